@@ -0,0 +1,54 @@
+"""
+게이트 테스트 (GATE_ENABLED=1 로 띄운 main.app 을 통해)
+
+python -m pytest backend/test_gate.py
+"""
+
+import os
+import uuid
+
+import pytest
+
+import backend.gate_store as gate_store
+from backend.gate import BOOT_SECRET
+
+SUM = "/sum?a=1&b=2"
+
+
+def test_gate_is_off_by_default(load_app):
+    client = load_app()
+    assert client.get(SUM).status_code == 404  # 보호 라우터는 게이트와 함께만 등록
+    body = {"checked": ["a"], "order": ["a"], "ts": 1}
+    assert client.post("/save", json=body).status_code == 200
+
+
+def test_signal_ready_opens_gate_for_that_user(load_app):
+    client = load_app(GATE_ENABLED="1", GATE_STORE="memory")
+    assert client.get(SUM).status_code == 401
+    assert client.get(SUM, headers={"X-User-ID": "u1"}).status_code == 503
+
+    assert client.post("/signal/ready", params={"x_key": "wrong", "user_id": "u1"}).status_code == 401
+    res = client.post("/signal/ready", params={"x_key": BOOT_SECRET, "user_id": "u1"})
+    assert res.status_code == 200 and res.json()["ok"]
+
+    assert client.get(SUM, headers={"X-User-ID": "u1"}).json() == {"result": 3}
+    assert client.get(SUM + "&user_id=u1").status_code == 200
+    assert client.get(SUM, headers={"X-User-ID": "u2"}).status_code == 503
+    assert client.get("/health").json()["gate"]["live"] == 1
+
+
+@pytest.mark.skipif(gate_store.fcntl is None, reason="shm 백엔드는 POSIX 전용")
+def test_shm_gate_is_shared_with_other_workers(load_app):
+    name = f"test-{uuid.uuid4().hex}"
+    client = load_app(GATE_ENABLED="1", GATE_STORE="shm", GATE_SHM_NAME=name, GATE_SHM_SLOTS="64")
+    store = gate_store._default
+    try:
+        assert client.get(SUM, headers={"X-User-ID": "u1"}).status_code == 503
+        client.post("/signal/ready", params={"x_key": BOOT_SECRET, "user_id": "u1"})
+        assert client.get(SUM, headers={"X-User-ID": "u1"}).status_code == 200
+        other = gate_store.SharedMemoryGateStore(path=store.path)  # 다른 워커 프로세스와 같은 파일
+        assert other.is_ready("u1") and not other.is_ready("u2")
+        other.close()
+    finally:
+        store.close()
+        os.remove(store.path)
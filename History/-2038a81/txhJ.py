@@ -0,0 +1,61 @@
+"""
+log_file tests
+
+python -m pytest test01/frontend/custom/log-file
+"""
+
+import os
+
+import log_file
+
+
+def _write(path, lines, mode="w"):
+    with open(path, mode, encoding="utf-8", newline="\n") as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+def test_append_extends_the_index(tmp_path):
+    path = tmp_path / "app.log"
+    _write(path, ["a 1", "b 2"])
+    log = log_file.LogFile(str(path))
+    _write(path, ["c 3"], mode="a")
+    assert log.refresh() == 1
+    assert [log.line(i) for i in range(len(log))] == ["a 1", "b 2", "c 3"]
+
+
+def test_copytruncate_that_grows_past_old_size_is_rescanned(tmp_path):
+    path = tmp_path / "app.log"
+    _write(path, ["one", "two", "three", "four"])
+    log = log_file.LogFile(str(path))
+    inode = os.stat(path).st_ino
+    new = ["2025-01-01 00:00:00 INFO rotated first line", "2025-01-01 00:00:01 INFO second line"]
+    with open(path, "r+", encoding="utf-8", newline="\n") as f:  # copytruncate: same inode
+        f.truncate(0)
+        f.writelines(line + "\n" for line in new)
+    assert os.stat(path).st_ino == inode and os.stat(path).st_size > 19
+    log.refresh()
+    assert [log.line(i) for i in range(len(log))] == new
+
+
+def test_stale_sidecar_of_rewritten_file_is_not_extended(tmp_path):
+    path = tmp_path / "app.log"
+    _write(path, ["one", "two"])
+    log_file.LogFile(str(path)).close()  # leaves app.log.idx for the first 8 bytes
+    _write(path, ["ab", "xyzw", "longer tail"])  # byte 8 still ends a line, line starts moved
+    log = log_file.LogFile(str(path))
+    assert [log.line(i) for i in range(len(log))] == ["ab", "xyzw", "longer tail"]
+
+
+def test_sidecar_is_reused_for_an_appended_file(tmp_path, monkeypatch):
+    path = tmp_path / "app.log"
+    _write(path, ["one", "two"])
+    log_file.LogFile(str(path)).close()
+    _write(path, ["three"], mode="a")
+    scanned = []
+    real_scan = log_file._scan_line_starts
+    monkeypatch.setattr(
+        log_file, "_scan_line_starts", lambda buf, start, end: scanned.append(start) or real_scan(buf, start, end)
+    )
+    log = log_file.LogFile(str(path))
+    assert [log.line(i) for i in range(len(log))] == ["one", "two", "three"]
+    assert scanned == [4]  # only from the last indexed line on
@@ -0,0 +1,83 @@
+"""
+유저별 게이트 (main.py 에서 GATE_ENABLED=1 일 때 install_gate(app) 로 켬)
+
+- Streamlit 이 /signal/ready 호출하면 해당 user_id 의 게이트가 '지금부터 READY_TTL_SEC' 열림
+- 다시 호출하면 '지금부터 READY_TTL_SEC' 로 리셋 (연장 누적 X)
+- 보호 경로는 user_id 필수 (헤더 X-User-ID 또는 쿼리 user_id), 닫혀 있으면 503
+- /health, /signal/* 는 게이트 없이 통과
+- 저장소는 GATE_STORE 로 고름 (backend.gate_store.get_gate_store)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+
+from backend.gate_store import GateStore, get_gate_store
+
+BOOT_SECRET = os.getenv("BOOT_SECRET", "dev-secret")
+READY_TTL_SEC = int(os.getenv("READY_TTL_SEC", "600"))  # 최대 10분(600초)
+ALLOW_HEALTH_PATHS = {"/health"}
+ALLOW_SIGNAL_PREFIX = "/signal/"
+
+log = logging.getLogger("gate")
+
+
+def get_user_id(request: Request) -> Optional[str]:
+    """유저 식별: 헤더 X-User-ID > 쿼리 user_id"""
+    uid = request.headers.get("X-User-ID")
+    if uid and uid.strip():
+        return uid.strip()
+    q = request.query_params.get("user_id")
+    if q and q.strip():
+        return q.strip()
+    return None
+
+
+def install_gate(app: FastAPI, store: Optional[GateStore] = None) -> GateStore:
+    """게이트 미들웨어 + /health + /signal/ready 등록. 보호할 라우터는 이 뒤에 include"""
+    gate = store if store is not None else get_gate_store()
+
+    @app.middleware("http")
+    async def gatekeeper(request: Request, call_next):
+        path = request.url.path
+
+        if path in ALLOW_HEALTH_PATHS or path.startswith(ALLOW_SIGNAL_PREFIX):
+            return await call_next(request)
+
+        user_id = get_user_id(request)
+        if not user_id:
+            return JSONResponse({"detail": "user_id required"}, status_code=401)
+
+        if not gate.is_ready(user_id):
+            return JSONResponse({"detail": "Service not ready for this user"}, status_code=503)
+
+        return await call_next(request)
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True, "now": datetime.utcnow().isoformat(), "gate": gate.stats()}
+
+    @app.post("/signal/ready")
+    async def signal_ready(x_key: str = Query(...), user_id: str = Query(...)):
+        """
+        Streamlit 이 호출:
+        - x_key 일치해야 함
+        - user_id 의 게이트를 '지금부터 READY_TTL_SEC' 로 리셋
+        """
+        if x_key != BOOT_SECRET:
+            raise HTTPException(status_code=401, detail="unauthorized")
+
+        if not user_id.strip():
+            raise HTTPException(status_code=400, detail="user_id required")
+
+        gate.set_ready(user_id.strip(), READY_TTL_SEC)
+        log.info("READY SET: user=%s ttl=%ss", user_id, READY_TTL_SEC)
+        return {"ok": True, "user_id": user_id, "ttl_sec": READY_TTL_SEC}
+
+    return gate
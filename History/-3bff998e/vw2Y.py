@@ -0,0 +1,109 @@
+"""
+유저별 게이트 (main.py 에서 GATE_ENABLED=1 일 때 install_gate(app) 로 켬)
+
+- Streamlit 이 /signal/ready 호출하면 해당 user_id 의 게이트가 '지금부터 READY_TTL_SEC' 열림
+- 다시 호출하면 '지금부터 READY_TTL_SEC' 로 리셋 (연장 누적 X)
+- 보호 경로는 user_id 필수 (헤더 X-User-ID 또는 쿼리 user_id), 닫혀 있으면 503
+- /health, /signal/* 는 게이트 없이 통과
+- 저장소는 GATE_STORE 로 고름
+  - "memory" / "shm": backend.gate_store.get_gate_store() (프로세스 내 / mmap — 네트워크 I/O 없음)
+  - "redis": backend.redis_batch.RedisGate (redis.asyncio + RedisBatcher — 이벤트 루프를 막지 않음)
+    (gate_store 의 RedisGateStore / NearCacheRedisGateStore 는 동기 전용이라 여기선 안 씀)
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import os
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+
+from backend.gate_store import get_gate_store
+
+BOOT_SECRET = os.getenv("BOOT_SECRET", "dev-secret")
+READY_TTL_SEC = int(os.getenv("READY_TTL_SEC", "600"))  # 최대 10분(600초)
+ALLOW_HEALTH_PATHS = {"/health"}
+ALLOW_SIGNAL_PREFIX = "/signal/"
+
+log = logging.getLogger("gate")
+
+
+def get_user_id(request: Request) -> Optional[str]:
+    """유저 식별: 헤더 X-User-ID > 쿼리 user_id"""
+    uid = request.headers.get("X-User-ID")
+    if uid and uid.strip():
+        return uid.strip()
+    q = request.query_params.get("user_id")
+    if q and q.strip():
+        return q.strip()
+    return None
+
+
+def make_app_gate() -> Any:
+    """GATE_STORE 에 맞는 게이트 저장소 — redis 는 async RedisGate, 나머지는 get_gate_store()"""
+    if os.getenv("GATE_STORE", "memory").strip().lower() == "redis":
+        import redis.asyncio  # pip install "redis>=5"
+
+        from backend.redis_batch import RedisGate
+
+        return RedisGate(redis.asyncio.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0")))
+    return get_gate_store()
+
+
+async def _call(fn: Any, *args: Any) -> Any:
+    """동기 저장소(GateStore)와 async 저장소(RedisGate) 둘 다 받음"""
+    res = fn(*args)
+    if inspect.isawaitable(res):
+        res = await res
+    return res
+
+
+def install_gate(app: FastAPI, store: Optional[Any] = None) -> Any:
+    """게이트 미들웨어 + /health + /signal/ready 등록. 보호할 라우터는 이 뒤에 include
+
+    store: GateStore (동기, 메모리/mmap) 또는 RedisGate (async). 없으면 make_app_gate()
+    """
+    gate = store if store is not None else make_app_gate()
+
+    @app.middleware("http")
+    async def gatekeeper(request: Request, call_next):
+        path = request.url.path
+
+        if path in ALLOW_HEALTH_PATHS or path.startswith(ALLOW_SIGNAL_PREFIX):
+            return await call_next(request)
+
+        user_id = get_user_id(request)
+        if not user_id:
+            return JSONResponse({"detail": "user_id required"}, status_code=401)
+
+        if not await _call(gate.is_ready, user_id):
+            return JSONResponse({"detail": "Service not ready for this user"}, status_code=503)
+
+        return await call_next(request)
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True, "now": datetime.utcnow().isoformat(), "gate": await _call(gate.stats)}
+
+    @app.post("/signal/ready")
+    async def signal_ready(x_key: str = Query(...), user_id: str = Query(...)):
+        """
+        Streamlit 이 호출:
+        - x_key 일치해야 함
+        - user_id 의 게이트를 '지금부터 READY_TTL_SEC' 로 리셋
+        """
+        if x_key != BOOT_SECRET:
+            raise HTTPException(status_code=401, detail="unauthorized")
+
+        if not user_id.strip():
+            raise HTTPException(status_code=400, detail="user_id required")
+
+        await _call(gate.set_ready, user_id.strip(), READY_TTL_SEC)
+        log.info("READY SET: user=%s ttl=%ss", user_id, READY_TTL_SEC)
+        return {"ok": True, "user_id": user_id, "ttl_sec": READY_TTL_SEC}
+
+    return gate
@@ -0,0 +1,107 @@
+"""
+벤치마크: 게이트 백엔드별 요청당 지연 (is_ready hit/miss, set_ready)
+
+python -m backend.bench_gate              # 유저 50k
+python -m backend.bench_gate 200000 3     # 유저 수, 반복
+
+- dict   : 예전 main.py (_user_ready: Dict[str, datetime] + utcnow 비교)
+- memory : MemoryGateStore (타이머 휠)
+- shm    : SharedMemoryGateStore (워커 공유 mmap)
+- redis  : RedisGateStore + fakeredis (설치돼 있으면), REDIS_URL 이 있으면 실제 Redis 도
+- redis+near : NearCacheRedisGateStore (워커별 near-cache, pub/sub 무효화)
+"""
+
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict
+
+from backend.gate_store import MemoryGateStore, NearCacheRedisGateStore, RedisGateStore, SharedMemoryGateStore
+
+TTL = 600
+
+
+class DictGate:
+    """예전 in-memory 게이트 그대로 (만료 키 정리 없음)"""
+
+    def __init__(self) -> None:
+        self._user_ready: Dict[str, datetime] = {}
+
+    def set_ready(self, user_id: str, ttl_sec: float) -> None:
+        self._user_ready[user_id] = datetime.utcnow() + timedelta(seconds=ttl_sec)
+
+    def is_ready(self, user_id: str) -> bool:
+        exp = self._user_ready.get(user_id)
+        return bool(exp and exp > datetime.utcnow())
+
+
+def _best(fn, keys, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for k in keys:
+            fn(k)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(keys)
+
+
+def _near(client, prefix: str) -> NearCacheRedisGateStore:
+    store = NearCacheRedisGateStore(client, prefix=prefix, channel=prefix + "inval")
+    deadline = time.monotonic() + 5
+    while not store.stats()["near_live"] and time.monotonic() < deadline:
+        time.sleep(0.01)  # 구독 확인 전에는 캐시를 안 쓰므로 대기
+    return store
+
+
+def _stores(users: int) -> Dict[str, object]:
+    stores: Dict[str, object] = {
+        "dict": DictGate(),
+        "memory": MemoryGateStore(TTL, max_keys=users * 2),
+        "shm": SharedMemoryGateStore(
+            path=os.path.join(tempfile.gettempdir(), f"bench-{os.getpid()}.gate"), slots=users * 2
+        ),
+    }
+    try:
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        stores["redis (fakeredis)"] = RedisGateStore(fakeredis.FakeRedis(server=server))
+        stores["redis+near (fakeredis)"] = _near(fakeredis.FakeRedis(server=server), "ready:")
+    except ImportError:
+        print("  (fakeredis 없음: pip install fakeredis — redis 행 생략)")
+    if os.getenv("REDIS_URL"):
+        import redis
+
+        url = os.environ["REDIS_URL"]
+        stores["redis (REDIS_URL)"] = RedisGateStore(redis.Redis.from_url(url), prefix="bench:ready:")
+        stores["redis+near (REDIS_URL)"] = _near(redis.Redis.from_url(url), "bench:near:")
+    return stores
+
+
+def main() -> None:
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    ids = [str(uuid.uuid4()) for _ in range(users)]
+    misses = [str(uuid.uuid4()) for _ in range(users)]
+    print(f"users={users:,} (best of {repeat}, us/call)")
+    print(f"  {'backend':<24}{'set_ready':>10}{'hit':>10}{'miss':>10}")
+    for name, store in _stores(users).items():
+        sample = ids if not name.startswith("redis") else ids[: min(users, 5000)]
+        miss = misses[: len(sample)]
+        t_set = _best(lambda k: store.set_ready(k, TTL), sample, 1)
+        t_hit = _best(store.is_ready, sample, repeat)
+        t_miss = _best(store.is_ready, miss, repeat)
+        assert all(store.is_ready(k) for k in sample[:100]) and not any(store.is_ready(k) for k in miss[:100])
+        print(f"  {name:<24}{t_set * 1e6:10.2f}{t_hit * 1e6:10.2f}{t_miss * 1e6:10.2f}")
+        if isinstance(store, NearCacheRedisGateStore):
+            store.close()
+        if isinstance(store, SharedMemoryGateStore):
+            store.close()
+            os.remove(store.path)
+
+
+if __name__ == "__main__":
+    main()
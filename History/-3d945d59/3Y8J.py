@@ -0,0 +1,28 @@
+"""
+backend 테스트 공용 fixture
+
+load_app(**env): 환경변수를 바꾼 뒤 backend.main 을 다시 import 한 TestClient
+(GATE_ENABLED 같은 플래그는 import 시점에 읽으므로). 테스트가 끝나면 기본 설정으로 되돌림
+"""
+
+import importlib
+
+import pytest
+
+
+@pytest.fixture
+def load_app(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import backend.gate_store as gate_store
+    import backend.main
+
+    def load(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr(gate_store, "_default", None)  # 게이트 저장소도 새로
+        return TestClient(importlib.reload(backend.main).app)
+
+    yield load
+    monkeypatch.undo()
+    importlib.reload(backend.main)
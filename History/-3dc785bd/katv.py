@@ -0,0 +1,15 @@
+"""
+Put the component directories on sys.path, as the Streamlit app does, so the
+tests import my_viewer / table_viewer / log_viewer / log_file / viewer_common by name.
+
+python -m pytest test01/frontend/custom
+"""
+
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+for _name in ("viewer-common", "log-file", "my-viewer", "table-viewer", "log-viewer"):
+    _path = os.path.join(HERE, _name)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -0,0 +1,174 @@
+"""
+Benchmark: component payload encoding per rerun (Streamlit's json.dumps of the args
+vs json_bytes=True, cold and cached) for my_viewer, table_viewer, log_viewer and
+the sub_menu args shape.
+
+python bench_json.py              # 100k log rows
+python bench_json.py 20000 5      # rows, repeats
+
+_component_func is replaced by what Streamlit does with component args: bytes
+pass through untouched, everything else goes through json.dumps.
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+for _name in ("my-viewer", "table-viewer", "log-viewer"):
+    sys.path.insert(0, os.path.join(HERE, _name))
+
+import log_viewer  # noqa: E402
+import my_viewer  # noqa: E402
+import table_viewer  # noqa: E402
+
+MODULES = (my_viewer, table_viewer, log_viewer)
+
+
+def streamlit_args(**kwargs):
+    """Serialize like streamlit.components.v1: bytes/DataFrames are special args, rest json.dumps."""
+    kwargs.pop("key", None)
+    default = kwargs.pop("default", None)
+    json_args = {k: v for k, v in kwargs.items() if not isinstance(v, (bytes, pd.DataFrame))}
+    json.dumps(json_args)
+    return default
+
+
+def make_logs(rows: int) -> tuple:
+    rng = np.random.default_rng(0)
+    ts = pd.Timestamp("2025-01-01") + pd.to_timedelta(np.arange(rows) * 250, unit="ms")
+    short = pd.DataFrame(
+        {
+            "Timestamp": ts,
+            "Level": rng.choice(["INFO", "WARN", "ERROR", "DEBUG"], size=rows),
+            "Message": [f"request {i} finished in {i % 997} ms" for i in range(rows)],
+        }
+    )
+    detail = short.assign(
+        Host=rng.choice([f"node-{i:02d}" for i in range(16)], size=rows),
+        Latency=np.where(rng.random(rows) < 0.05, np.nan, rng.normal(50, 10, size=rows)),
+        Trace=[f"trace-{i:08x} user=u{i % 5000} path=/api/v1/items/{i % 300}" for i in range(rows)],
+    )
+    return short, detail
+
+
+def sub_menu_args(columns: int = 200) -> dict:
+    """The args dict sub_menu() builds (its payload is small; encoding only)."""
+    order = [f"col_{i}" for i in range(columns)]
+    return {
+        "title": "Columns",
+        "name": "demo",
+        "order": order,
+        "checked": order[::3],
+        "required": order[:5],
+        "options": {"limit": ["100", "200"], "mode": "fast"},
+        "alarm_note": "변경 후 반드시 Save를 눌러주세요.",
+        "listHeight": 420,
+        "frameHeight": 720,
+        "ack": None,
+        "saveApi": {
+            "url": "http://localhost:8000/save",
+            "method": "POST",
+            "headers": {"Content-Type": "application/json"},
+            "timeoutMs": 5000,
+            "okCodes": [200, 201, 204],
+            "successPath": "ok",
+            "bodyTemplate": {"name": "$name", "checked": "$checked", "order": "$order"},
+        },
+    }
+
+
+def _best(fn, repeat: int, before=None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _clear_encoded() -> None:
+    for module in MODULES:
+        if hasattr(module, "_encoded_cache"):
+            module._encoded_cache.clear()
+
+
+def _bench(label: str, render, repeat: int, encoders: dict) -> None:
+    """render(json_bytes) runs one rerun; normalized payload caches are warm for every row."""
+    render(False)
+    render(True)
+    base = _best(lambda: render(False), repeat)
+    print(f"  {label}")
+    print(f"    {'json args':<22}: {base * 1000:9.1f} ms")
+    for name, enc in encoders.items():
+        for module in MODULES:
+            module.orjson = enc
+        cold = _best(lambda: render(True), repeat, before=_clear_encoded)
+        print(f"    {'json_bytes cold ' + name:<22}: {cold * 1000:9.1f} ms  (x{base / cold:.1f})")
+    hot = _best(lambda: render(True), repeat)
+    print(f"    {'json_bytes cached':<22}: {hot * 1000:9.1f} ms  (x{base / hot:.1f})")
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    orjson = my_viewer.orjson
+    encoders = {"stdlib": None}
+    if orjson is not None:
+        encoders["orjson"] = orjson
+    for module in MODULES:
+        module._component_func = streamlit_args
+
+    short, detail = make_logs(rows)
+    reports = [
+        {"short": short.iloc[i::20].head(2000), "detail": detail.iloc[i::20].head(2000), "detail_html": f"<p>report {i}</p>"}
+        for i in range(20)
+    ]
+    report_list = pd.DataFrame({"id": range(20), "title": [f"report {i}" for i in range(20)]})
+    print(f"rows={rows:,} (best of {repeat}, encoders: {', '.join(encoders)})")
+
+    for wire in ("records", "columnar"):
+        _bench(
+            f"my_viewer {wire} (short/detail + 20 cached reports)",
+            lambda jb: my_viewer.my_viewer(
+                report_list=report_list,
+                error_log_short=short,
+                error_log_detail=detail,
+                report_cache=reports,
+                wire_format=wire,
+                json_bytes=jb,
+            ),
+            repeat,
+            encoders,
+        )
+        _bench(
+            f"table_viewer {wire}",
+            lambda jb: table_viewer.table_viewer(detail, wire_format=wire, json_bytes=jb),
+            repeat,
+            encoders,
+        )
+        _bench(
+            f"log_viewer {wire}",
+            lambda jb: log_viewer.log_viewer(short, detail, wire_format=wire, json_bytes=jb),
+            repeat,
+            encoders,
+        )
+
+    args = sub_menu_args()
+    n = 2000
+    print("  sub_menu args (per call)")
+    t = _best(lambda: [json.dumps(args) for _ in range(n)], repeat) / n
+    print(f"    {'json.dumps':<22}: {t * 1e6:9.1f} us")
+    if orjson is not None:
+        t2 = _best(lambda: [orjson.dumps(args) for _ in range(n)], repeat) / n
+        print(f"    {'orjson.dumps':<22}: {t2 * 1e6:9.1f} us  (x{t / t2:.1f})")
+
+
+if __name__ == "__main__":
+    main()
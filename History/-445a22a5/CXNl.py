@@ -0,0 +1,364 @@
+"""
+Memory-mapped, line-indexed log files that my_viewer / log_viewer page from.
+
+    from log_file import open_log, regex_parser
+
+    log = open_log(
+        "/data/job-1234.log",
+        parser=regex_parser(r"(?P<Timestamp>\\S+ \\S+) (?P<Level>\\w+) (?P<Message>.*)"),
+    )
+    my_viewer(error_log_short=log, error_log_detail=log, window_size=200, key="viewer")
+    log_viewer(tail_source=log, short_columns=["Timestamp", "Level"], key="log")
+
+One row per line. Line start offsets are saved next to the log as "<path>.idx"
+and reused across restarts while the file is unchanged (extended when it only
+grew: same head/tail bytes up to the indexed size, so a copytruncate rotation
+that has grown past the old size is rescanned). Lines are parsed into rows only
+when page/take/column asks for them.
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+from viewer_common import anchor_digest
+
+Parser = Callable[[str], Dict[str, Any]]
+
+IDX_MAGIC = b"LOGIDX2\0"
+_IDX_HEADER = struct.Struct("<QQQ16s")  # indexed file size, mtime_ns, line count, anchor_digest
+_SCAN_CHUNK = 64 * 1024 * 1024
+_COLUMN_SAMPLE_ROWS = 100
+_OPEN_FILES_MAX = 8
+
+
+# ---------------------- parsers ----------------------
+def default_parser(line: str) -> Dict[str, Any]:
+    """JSON object lines as-is, anything else as {"Message": line}."""
+    text = line.strip()
+    if text.startswith("{"):
+        try:
+            obj = json.loads(text)
+        except ValueError:
+            obj = None
+        if isinstance(obj, dict):
+            return obj
+    return {"Message": line}
+
+
+@lru_cache(maxsize=64)
+def regex_parser(pattern: str, fallback: str = "Message") -> Parser:
+    """Parser from a regex with named groups; lines that don't match -> {fallback: line}.
+
+    Cached per pattern so reruns get the same parser (and the same open_log entry).
+    """
+    rx = re.compile(pattern)
+
+    def parse(line: str) -> Dict[str, Any]:
+        m = rx.match(line)
+        return m.groupdict() if m else {fallback: line}
+
+    parse.__qualname__ = f"regex_parser({pattern!r})"
+    return parse
+
+
+# ---------------------- line index ----------------------
+def _scan_line_starts(buf: Any, start: int, end: int) -> Any:
+    """Offsets of the lines in buf[start:end] (the first one begins at `start`)."""
+    parts = [np.array([start], dtype=np.uint64)]
+    for pos in range(start, end, _SCAN_CHUNK):
+        chunk = np.frombuffer(buf, dtype=np.uint8, count=min(_SCAN_CHUNK, end - pos), offset=pos)
+        parts.append((np.flatnonzero(chunk == 10) + (pos + 1)).astype(np.uint64))
+        del chunk
+    starts = np.concatenate(parts)
+    if len(starts) and int(starts[-1]) >= end:  # trailing newline doesn't open a line
+        starts = starts[:-1]
+    return starts
+
+
+def _read_index(index_path: str) -> Optional[tuple]:
+    """(size, mtime_ns, anchor, starts) from a sidecar, or None if missing/corrupt."""
+    try:
+        with open(index_path, "rb") as f:
+            if f.read(len(IDX_MAGIC)) != IDX_MAGIC:
+                return None
+            size, mtime_ns, count, anchor = _IDX_HEADER.unpack(f.read(_IDX_HEADER.size))
+            starts = np.fromfile(f, dtype="<u8", count=count)
+    except (OSError, struct.error, ValueError):
+        return None
+    if len(starts) != count:
+        return None
+    return size, mtime_ns, anchor, starts.astype(np.uint64, copy=False)
+
+
+def _write_index(index_path: str, size: int, mtime_ns: int, anchor: bytes, starts: Any) -> None:
+    """Best effort: a read-only log directory just means no sidecar."""
+    tmp = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(IDX_MAGIC)
+            f.write(_IDX_HEADER.pack(size, mtime_ns, len(starts), anchor))
+            starts.astype("<u8", copy=False).tofile(f)
+        os.replace(tmp, index_path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+# ---------------------- lazy table ----------------------
+class LogFile:
+    """Lazy table over a line-oriented log file, one row per line.
+
+    The file is memory-mapped; page/take/column parse only the lines they
+    return. `fingerprint` changes whenever the file does, so callers can key
+    caches on it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        parser: Optional[Parser] = None,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        encoding: str = "utf-8",
+        index_path: Optional[str] = None,
+    ) -> None:
+        self.path = os.path.abspath(os.fspath(path))
+        self.parser = parser or default_parser
+        self.encoding = encoding
+        self.index_path = index_path or self.path + ".idx"
+        self._columns = list(columns) if columns else None
+        self._lock = threading.RLock()
+        self._file: Any = None
+        self._mm: Any = None
+        self._inode = 0
+        self._size = 0
+        self._mtime_ns = 0
+        self._anchor = b""
+        self._starts = np.zeros(0, dtype=np.uint64)
+        self._column_cache: Dict[str, List[Any]] = {}
+        self.refresh()
+
+    # -- file / index --
+    def refresh(self) -> int:
+        """Pick up changes to the file; returns how many lines were added."""
+        with self._lock:
+            stat = os.stat(self.path)
+            state = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            if self._file is not None and state == (self._inode, self._size, self._mtime_ns):
+                return 0
+            # same inode and larger, with the indexed bytes unchanged: appended, only
+            # the tail needs scanning (copytruncate + new writes also grows the file)
+            grew = self._file is not None and stat.st_ino == self._inode and stat.st_size > self._size
+            old_size = self._size
+            self._remap(stat.st_size)
+            grew = grew and anchor_digest(self._file, old_size) == self._anchor
+            before = len(self._starts) if grew else 0
+            anchor = anchor_digest(self._file, stat.st_size)
+            if grew:
+                starts = self._extend(self._starts, stat.st_size, stat.st_mtime_ns, anchor)
+            else:
+                starts = self._load_index(stat.st_size, stat.st_mtime_ns, anchor)
+            self._column_cache.clear()
+            self._starts = starts
+            self._anchor = anchor
+            self._inode, self._size, self._mtime_ns = state
+            return max(0, len(starts) - before)
+
+    def _remap(self, size: int) -> None:
+        self.close()
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def _extend(self, starts: Any, size: int, mtime_ns: int, anchor: bytes) -> Any:
+        # the last indexed line may have been partial: rescan from its start
+        head = starts[:-1] if len(starts) else starts
+        begin = int(starts[-1]) if len(starts) else 0
+        starts = np.concatenate([head, _scan_line_starts(self._mm, begin, size)])
+        _write_index(self.index_path, size, mtime_ns, anchor, starts)
+        return starts
+
+    def _load_index(self, size: int, mtime_ns: int, anchor: bytes) -> Any:
+        cached = _read_index(self.index_path)
+        if cached is not None:
+            idx_size, idx_mtime, idx_anchor, starts = cached
+            if (idx_size, idx_mtime, idx_anchor) == (size, mtime_ns, anchor):
+                return starts
+            if 0 < idx_size < size and len(starts) and self._appended_to(idx_size, idx_anchor):
+                return self._extend(starts, size, mtime_ns, anchor)
+        starts = _scan_line_starts(self._mm, 0, size) if self._mm is not None else np.zeros(0, np.uint64)
+        _write_index(self.index_path, size, mtime_ns, anchor, starts)
+        return starts
+
+    def _appended_to(self, offset: int, anchor: bytes) -> bool:
+        """Appended-only check for a stale sidecar: the old end sat on a newline and
+        the bytes up to it still have the sidecar's anchor digest."""
+        return (
+            self._mm is not None
+            and self._mm[offset - 1 : offset] == b"\n"
+            and anchor_digest(self._file, offset) == anchor
+        )
+
+    def _ensure_open(self) -> None:
+        """Remap after close() (e.g. another holder closed it): reads keep working."""
+        if self._file is None:
+            self.refresh()
+
+    def close(self) -> None:
+        """Release the map and file handle now; the next read reopens them."""
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # -- table interface --
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f"LogFile({self.path!r}, rows={len(self)})"
+
+    @property
+    def fingerprint(self) -> str:
+        parser = getattr(self.parser, "__qualname__", repr(self.parser))
+        return f"{self.path}:{self._size}:{self._mtime_ns}:{parser}:{self.encoding}"
+
+    @property
+    def columns(self) -> List[str]:
+        """Given columns, or the union of the first rows' keys (in order)."""
+        if self._columns is None:
+            seen: Dict[str, None] = {}
+            for row in self.page(0, _COLUMN_SAMPLE_ROWS):
+                seen.update(dict.fromkeys(row))
+            return list(seen)
+        return list(self._columns)
+
+    def line(self, i: int) -> str:
+        """Raw text of line i (without the line break)."""
+        n = len(self._starts)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        self._ensure_open()
+        start = int(self._starts[i])
+        end = int(self._starts[i + 1]) if i + 1 < n else self._size
+        raw = self._mm[start:end]
+        if raw.endswith(b"\n"):
+            raw = raw[:-1]
+        if raw.endswith(b"\r"):
+            raw = raw[:-1]
+        return raw.decode(self.encoding, errors="replace")
+
+    def row(self, i: int) -> Dict[str, Any]:
+        line = self.line(i)
+        row = self.parser(line)
+        return row if isinstance(row, dict) else {"Message": line}
+
+    def page(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        """Rows start..stop-1 (clipped to the file)."""
+        with self._lock:
+            start, stop = max(0, int(start)), min(len(self), int(stop))
+            return [self.row(i) for i in range(start, stop)]
+
+    def take(self, ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """Rows at the given line numbers, in that order."""
+        with self._lock:
+            return [self.row(int(i)) for i in ids]
+
+    def select(self, names: Sequence[str]) -> Dict[str, List[Any]]:
+        """Whole columns (one parse pass for the ones not cached yet)."""
+        with self._lock:
+            missing = [c for c in dict.fromkeys(names) if c not in self._column_cache]
+            if missing:
+                values: Dict[str, List[Any]] = {c: [] for c in missing}
+                for i in range(len(self)):
+                    row = self.row(i)
+                    for c in missing:
+                        values[c].append(row.get(c))
+                self._column_cache.update(values)
+            return {c: self._column_cache[c] for c in names}
+
+    def column(self, name: str) -> List[Any]:
+        return self.select([name])[name]
+
+    def grep(self, text: str) -> Any:
+        """Line numbers whose raw bytes contain `text` (ASCII case-insensitive)."""
+        with self._lock:
+            self._ensure_open()
+            if not text or self._mm is None:
+                return np.zeros(0, dtype=np.int64)
+            rx = re.compile(re.escape(text.encode(self.encoding)), re.IGNORECASE)
+            n = len(self._starts)
+            hits: List[int] = []
+            pos = 0
+            while True:
+                m = rx.search(self._mm, pos)
+                if m is None:
+                    break
+                i = int(np.searchsorted(self._starts, m.start(), side="right")) - 1
+                hits.append(i)
+                if i + 1 >= n:
+                    break
+                pos = int(self._starts[i + 1])
+            return np.asarray(hits, dtype=np.int64)
+
+    def __call__(self, cursor: int) -> Iterator[Dict[str, Any]]:
+        """Rows from `cursor` on (log_viewer tail_source); new lines are picked up first."""
+        self.refresh()
+        for i in range(int(cursor), len(self)):
+            yield self.row(i)
+
+
+_open_files: "OrderedDict[Any, LogFile]" = OrderedDict()
+_open_lock = threading.Lock()
+
+
+def open_log(
+    path: str,
+    parser: Optional[Parser] = None,
+    *,
+    columns: Optional[Sequence[str]] = None,
+    encoding: str = "utf-8",
+    index_path: Optional[str] = None,
+) -> LogFile:
+    """LogFile for `path`, reused across reruns (refreshed if the file changed).
+
+    Entries dropped from the LRU are not closed: other sessions may still hold
+    them. The map is released when the last reference goes away.
+    """
+    key = (os.path.abspath(os.fspath(path)), parser, tuple(columns or ()), encoding, index_path)
+    with _open_lock:
+        log = _open_files.get(key)
+        if log is not None:
+            _open_files.move_to_end(key)
+    if log is not None:
+        log.refresh()
+        return log
+    log = LogFile(path, parser, columns=columns, encoding=encoding, index_path=index_path)
+    with _open_lock:
+        _open_files[key] = log
+        while len(_open_files) > _OPEN_FILES_MAX:
+            _open_files.popitem(last=False)
+    return log
+
+
+__all__ = ["LogFile", "open_log", "default_parser", "regex_parser", "IDX_MAGIC"]
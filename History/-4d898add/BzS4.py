@@ -0,0 +1,1273 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+import streamlit.components.v1 as components
+
+_RELEASE = False
+
+if not _RELEASE:
+    _component_func = components.declare_component(
+        "my_viewer",
+        url="http://localhost:3001",
+    )
+else:
+    parent_dir = os.path.dirname(os.path.abspath(__file__))
+    build_dir = os.path.join(parent_dir, "frontend/build")
+    _component_func = components.declare_component("my_viewer", path=build_dir)
+
+
+# ---------------------- util: safe import ----------------------
+@lru_cache(maxsize=None)
+def _try_imports():
+    try:
+        import pandas as pd  # type: ignore
+    except Exception:
+        pd = None  # type: ignore
+    try:
+        import numpy as np  # type: ignore
+    except Exception:
+        np = None  # type: ignore
+    return pd, np
+
+
+# ---------------------- util: safe cast ----------------------
+def _cast_value(v: Any) -> Any:
+    """Cast values to JSON-serializable primitives."""
+    pd, np = _try_imports()
+    try:
+        if v is None:
+            return None
+        if pd is not None and (v is pd.NaT):  # type: ignore[attr-defined]
+            return None
+        if np is not None:
+            if getattr(np, "isnan", None) is not None:
+                try:
+                    if np.isnan(v):  # type: ignore[arg-type]
+                        return None
+                except Exception:
+                    pass
+            if isinstance(v, getattr(np, "integer", tuple())):
+                try:
+                    return v.item()
+                except Exception:
+                    return int(v)
+            if isinstance(v, getattr(np, "floating", tuple())):
+                try:
+                    return v.item()
+                except Exception:
+                    return float(v)
+        if isinstance(v, (bool, int, float, str)):
+            return v
+        for attr in ("isoformat", "ctime", "__str__"):
+            if hasattr(v, attr):
+                try:
+                    if attr == "isoformat":
+                        return getattr(v, attr)()
+                except Exception:
+                    pass
+        return str(v)
+    except Exception:
+        return str(v)
+
+
+# ---------------------- util: columnar serializer ----------------------
+_PLAIN_TYPES = (str, int, float, bool)
+
+
+def _datetime_values(s: Any) -> List[Any]:
+    """ISO strings for a naive datetime64 column (matches Timestamp.isoformat)."""
+    pd, np = _try_imports()
+    arr = s.to_numpy(dtype="datetime64[ns]")
+    nat = np.isnat(arr)
+    sub = arr.view("i8") % 1_000_000_000
+    out = np.datetime_as_string(arr, unit="s").astype(object)
+    has_ns = (sub % 1000) != 0
+    has_us = (sub != 0) & ~has_ns
+    if has_us.any():
+        out[has_us] = np.datetime_as_string(arr[has_us], unit="us")
+    if has_ns.any():
+        out[has_ns] = np.datetime_as_string(arr[has_ns], unit="ns")
+    out[nat] = None
+    return out.tolist()
+
+
+def _column_values(s: Any) -> List[Any]:
+    """Convert one pandas column to a list of JSON-safe values in one pass."""
+    pd, np = _try_imports()
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        cats = _column_values(pd.Series(dtype.categories))
+        lookup = np.array(cats + [None], dtype=object)
+        return lookup[s.cat.codes.to_numpy()].tolist()  # code -1 -> None
+    if isinstance(dtype, np.dtype):
+        kind = dtype.kind
+        if kind in "iub":
+            return s.to_numpy().tolist()
+        if kind == "f":
+            arr = s.to_numpy()
+            values = arr.tolist()
+            for i in np.flatnonzero(np.isnan(arr)).tolist():
+                values[i] = None
+            return values
+        if kind == "M":
+            return _datetime_values(s)
+    # object / extension / tz-aware / timedelta: per-cell only where needed
+    values = s.tolist()
+    missing = s.isna().to_numpy()
+    for i, v in enumerate(values):
+        if missing[i]:
+            values[i] = None
+        elif type(v) not in _PLAIN_TYPES:
+            values[i] = _cast_value(v)
+    return values
+
+
+def _frame_columns(df: Any) -> tuple[List[str], List[List[Any]]]:
+    """DataFrame -> (column names, JSON-safe value list per column)."""
+    columns = [str(c) for c in list(df.columns)]
+    if len(set(columns)) != len(columns):
+        raise ValueError("duplicate column names")
+    return columns, [_column_values(df.iloc[:, i]) for i in range(len(columns))]
+
+
+def _normalize_frame_columnar(df: Any) -> Dict[str, Any]:
+    """DataFrame -> {"records", "columns"} converting column-at-a-time."""
+    columns, values = _frame_columns(df)
+    if not columns:
+        return {"records": [{} for _ in range(len(df))], "columns": columns}
+    records = [dict(zip(columns, row)) for row in zip(*values)]
+    return {"records": records, "columns": columns}
+
+
+def _normalize_frame_per_cell(df: Any) -> Dict[str, Any]:
+    """Reference path: to_dict(records) + _cast_value on every cell."""
+    df = df.copy()
+    try:
+        df = df.where(df.notna(), None)
+    except Exception:
+        pass
+    records: List[Dict[str, Any]] = df.to_dict(orient="records")  # type: ignore
+    records = [{k: _cast_value(v) for k, v in row.items()} for row in records]
+    columns = [str(c) for c in list(df.columns)]
+    return {"records": records, "columns": columns}
+
+
+# ---------------------- util: wire format ----------------------
+_WIRE_FORMATS = {"records", "columnar", "arrow"}
+_DICT_MIN_ROWS = 16  # dictionary-encode strings only for columns at least this long
+
+
+def _validate_wire_format(x: Optional[str]) -> str:
+    if x is None:
+        return "records"
+    x = str(x).strip().lower()
+    if x in _WIRE_FORMATS:
+        return x
+    raise ValueError(f"wire_format must be one of {sorted(_WIRE_FORMATS)}, got {x!r}")
+
+
+def _encode_column(values: List[Any]) -> Any:
+    """Dictionary-encode repetitive string columns as {"dict", "codes"}."""
+    n = len(values)
+    if n < _DICT_MIN_ROWS:
+        return values
+    lookup: Dict[Any, int] = {}
+    codes: List[int] = []
+    for v in values:
+        if v is None:
+            codes.append(-1)
+            continue
+        if type(v) is not str:
+            return values
+        code = lookup.get(v)
+        if code is None:
+            code = lookup[v] = len(lookup)
+            if code * 2 > n:
+                return values
+        codes.append(code)
+    return {"dict": list(lookup), "codes": codes}
+
+
+def _columnar_payload(columns: List[str], values: List[List[Any]], length: int) -> Dict[str, Any]:
+    return {
+        "columns": columns,
+        "data": {c: _encode_column(v) for c, v in zip(columns, values)},
+        "length": length,
+    }
+
+
+def _records_to_columnar(norm: Dict[str, Any]) -> Dict[str, Any]:
+    records = norm.get("records") or []
+    columns = [str(c) for c in norm.get("columns") or []]
+    values = [[r.get(c) for r in records] for c in columns]
+    return _columnar_payload(columns, values, len(records))
+
+
+def _arrow_frame(data: Any) -> Any:
+    """DataFrame for Streamlit's Arrow serializer, or None to fall back to JSON.
+
+    Datetime/timedelta columns are sent as ISO strings so the frontend shows the
+    same text as the JSON path; everything else goes to Arrow untouched.
+    """
+    pd, _ = _try_imports()
+    if pd is None:
+        return None
+    if isinstance(data, pd.Series):  # type: ignore[attr-defined]
+        data = pd.DataFrame({"index": data.index, "value": data.to_numpy()})
+    elif isinstance(data, list) and data and all(isinstance(r, dict) for r in data):
+        data = pd.DataFrame(data)
+    if not isinstance(data, pd.DataFrame):  # type: ignore[attr-defined]
+        return None
+    columns = [str(c) for c in list(data.columns)]
+    if len(set(columns)) != len(columns):
+        return None
+    df = data.reset_index(drop=True)
+    df.columns = columns
+    for i, dtype in enumerate(list(df.dtypes)):
+        if getattr(dtype, "kind", None) in ("M", "m"):
+            df[columns[i]] = _column_values(df.iloc[:, i])
+    return df
+
+
+def _table_columns(norm: Any) -> List[str]:
+    pd, _ = _try_imports()
+    if pd is not None and isinstance(norm, pd.DataFrame):  # type: ignore[attr-defined]
+        return [str(c) for c in list(norm.columns)]
+    if isinstance(norm, dict) and isinstance(norm.get("columns"), list):
+        return [str(c) for c in norm["columns"]]
+    return []
+
+
+def _table_column(norm: Any, col: str) -> List[Any]:
+    """Values of one column from any wire format (records / columnar / arrow frame)."""
+    pd, _ = _try_imports()
+    if pd is not None and isinstance(norm, pd.DataFrame):  # type: ignore[attr-defined]
+        s = norm[col]
+        return s.where(s.notna(), None).tolist()
+    if not isinstance(norm, dict):
+        return []
+    data = norm.get("data")
+    if isinstance(data, dict):
+        v = data.get(col)
+        if isinstance(v, dict):
+            lookup = v.get("dict") or []
+            return [None if c < 0 else lookup[c] for c in v.get("codes") or []]
+        return v or []
+    return [r.get(col) for r in norm.get("records") or []]
+
+
+# ---------------------- util: normalize data ----------------------
+def _normalize_table(data: Any, wire_format: str = "records") -> Optional[Dict[str, Any]]:
+    """Normalize pandas DataFrame/Series or list/dicts into frontend shape.
+
+    wire_format="records" -> {"records": [{col: v}], "columns"}
+    wire_format="columnar" -> {"columns", "data": {col: [v] | {"dict", "codes"}}, "length"}
+    """
+    if data is None:
+        return None
+    pd, _ = _try_imports()
+    if wire_format == "columnar":
+        if pd is not None and isinstance(data, pd.DataFrame):  # type: ignore[attr-defined]
+            try:
+                columns, values = _frame_columns(data)
+                return _columnar_payload(columns, values, len(data))
+            except Exception:
+                pass
+        norm = _normalize_table(data)
+        return _records_to_columnar(norm) if norm is not None else None
+
+    # DataFrame
+    if pd is not None and isinstance(data, pd.DataFrame):  # type: ignore[attr-defined]
+        try:
+            return _normalize_frame_columnar(data)
+        except Exception:
+            pass
+        try:
+            return _normalize_frame_per_cell(data)
+        except Exception:
+            pass
+
+    # Series
+    if pd is not None and isinstance(data, pd.Series):  # type: ignore[attr-defined]
+        try:
+            index = _column_values(data.index.to_series())
+            values = _column_values(data)
+            records = [{"index": i, "value": v} for i, v in zip(index, values)]
+            return {"records": records, "columns": ["index", "value"]}
+        except Exception:
+            pass
+        try:
+            s = data.copy()
+            try:
+                s = s.where(s.notna(), None)
+            except Exception:
+                pass
+            records = [
+                {"index": _cast_value(i), "value": _cast_value(v)} for i, v in s.items()
+            ]
+            return {"records": records, "columns": ["index", "value"]}
+        except Exception:
+            pass
+
+    # List[dict]
+    if isinstance(data, list) and (len(data) == 0 or isinstance(data[0], dict)):
+        records = [{str(k): _cast_value(v) for k, v in row.items()} for row in data]
+        columns_set = set()
+        for r in records:
+            columns_set.update(r.keys())
+        return {"records": records, "columns": list(columns_set)}
+
+    # List[primitive]
+    if isinstance(data, list):
+        records = [{"value": _cast_value(v)} for v in data]
+        return {"records": records, "columns": ["value"]}
+
+    # Dict of lists
+    if isinstance(data, dict):
+        try:
+            keys = list(data.keys())
+            length = max(
+                (len(v) for v in data.values() if isinstance(v, list)), default=0
+            )
+            recs: List[Dict[str, Any]] = []
+            for i in range(length):
+                recs.append(
+                    {
+                        k: _cast_value((data.get(k) or [None] * length)[i])
+                        for k in keys
+                    }
+                )
+            return {"records": recs, "columns": keys}
+        except Exception:
+            pass
+
+    # Fallback
+    return {"records": [{"value": _cast_value(data)}], "columns": ["value"]}
+
+
+# ---------------------- util: payload cache ----------------------
+PAYLOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class _PayloadCache:
+    """LRU of normalized payloads keyed by content fingerprint, bounded by bytes.
+
+    Shared by all sessions of the process (keys are content hashes, not ids), so
+    reruns that only move the selection reuse the already-serialized tables.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Any, tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Any, value: Any, nbytes: int) -> None:
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._items[key] = (value, nbytes)
+            self.bytes += nbytes
+            while self.bytes > self.max_bytes and self._items:
+                _, (_, size) = self._items.popitem(last=False)
+                self.bytes -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.bytes = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._items),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_payload_cache = _PayloadCache(PAYLOAD_CACHE_MAX_BYTES)
+
+
+def payload_cache_info() -> Dict[str, int]:
+    """Hit/miss/eviction counters and current size of the normalized payload cache."""
+    return _payload_cache.info()
+
+
+def clear_payload_cache(max_bytes: Optional[int] = None) -> None:
+    """Drop all cached payloads (optionally changing the byte budget)."""
+    if max_bytes is not None:
+        _payload_cache.max_bytes = int(max_bytes)
+    _payload_cache.clear()
+
+
+def _frame_fingerprint(df: Any) -> Optional[str]:
+    """Content hash of a DataFrame (shape, columns, dtypes, hashed rows); None if unhashable."""
+    pd, _ = _try_imports()
+    try:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((df.shape, [str(c) for c in df.columns], [str(t) for t in df.dtypes])).encode())
+        h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return h.hexdigest()
+    except Exception:
+        return None
+
+
+def _normalize_table_cached(data: Any, wire_format: str = "records") -> Optional[Dict[str, Any]]:
+    """_normalize_table memoized by content for DataFrame input."""
+    pd, _ = _try_imports()
+    if pd is None or not isinstance(data, pd.DataFrame):  # type: ignore[attr-defined]
+        return _normalize_table(data, wire_format)
+    fp = _frame_fingerprint(data)
+    if fp is None:
+        return _normalize_table(data, wire_format)
+    key = (fp, wire_format)
+    hit = _payload_cache.get(key)
+    if hit is not None:
+        return hit
+    norm = _normalize_table(data, wire_format)
+    try:
+        nbytes = int(data.memory_usage(index=True, deep=True).sum())
+    except Exception:
+        nbytes = 0
+    _payload_cache.put(key, norm, nbytes)
+    return norm
+
+
+# ---------------------- util: delta updates ----------------------
+def _content_hash(data: Any, wire_format: str) -> Optional[str]:
+    """Stable hash of a panel's source data (+ wire format); None if it can't be hashed."""
+    pd, _ = _try_imports()
+    if data is None:
+        return None
+    if isinstance(data, str):
+        raw = data.encode("utf-8")
+    elif pd is not None and isinstance(data, pd.DataFrame):  # type: ignore[attr-defined]
+        fp = _frame_fingerprint(data)
+        if fp is None:
+            return None
+        raw = fp.encode("ascii")
+    else:
+        try:
+            raw = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        except Exception:
+            return None
+    h = hashlib.blake2b(raw, digest_size=12)
+    h.update(wire_format.encode("ascii"))
+    return h.hexdigest()
+
+
+def _held_hashes(key: Optional[str]) -> set:
+    """Hashes the frontend reported holding in its last event (st.session_state[key])."""
+    if not key:
+        return set()
+    try:
+        import streamlit as st
+
+        last = st.session_state.get(key)
+    except Exception:
+        return set()
+    if isinstance(last, dict) and isinstance(last.get("held"), list):
+        return {str(h) for h in last["held"]}
+    return set()
+
+
+# ---------------------- util: lazy report cache ----------------------
+ReportEntry = Dict[str, Any]
+ReportLoader = Callable[[int], Optional[ReportEntry]]
+
+
+def _requested_report(key: Optional[str]) -> Optional[int]:
+    """Report index the frontend asked for in its last event (report_selected)."""
+    if not key:
+        return None
+    try:
+        import streamlit as st
+
+        last = st.session_state.get(key)
+    except Exception:
+        return None
+    if isinstance(last, dict) and last.get("type") == "report_selected":
+        return _as_int_or_none(last.get("rowIndex"))
+    return None
+
+
+def _table_len(data: Any) -> Optional[int]:
+    try:
+        return len(data) if data is not None else None
+    except Exception:
+        return None
+
+
+def _resolve_report_cache(
+    report_cache: Any,
+    *,
+    count: Optional[int],
+    prefetch: Optional[int],
+    wanted: List[Optional[int]],
+) -> tuple[Optional[List[Optional[ReportEntry]]], bool]:
+    """Materialize only the reports that will be shown soon.
+
+    report_cache may be a list of dicts, a list mixing dicts and zero-arg callables,
+    or a loader(index) -> dict. Lazy mode (a loader/callables, or prefetch given)
+    loads wanted indices +- prefetch; every other slot is None.
+    Returns (entries, lazy).
+    """
+    if report_cache is None:
+        return None, False
+    is_loader = callable(report_cache)
+    items: List[Any] = [] if is_loader else list(report_cache)
+    lazy = is_loader or prefetch is not None or any(callable(x) for x in items)
+    if not lazy:
+        return items, False
+    n = count if is_loader else len(items)
+    if not n:
+        return None, True
+    radius = max(0, int(prefetch if prefetch is not None else 1))
+    keep = set()
+    for idx in wanted:
+        if idx is None:
+            continue
+        for j in range(idx - radius, idx + radius + 1):
+            if 0 <= j < n:
+                keep.add(j)
+    out: List[Optional[ReportEntry]] = [None] * n
+    for j in sorted(keep):
+        try:
+            entry = report_cache(j) if is_loader else items[j]
+            out[j] = entry() if callable(entry) else entry
+        except Exception:
+            out[j] = None
+    return out, True
+
+
+# ---------------------- util: windowed short/detail logs ----------------------
+_INDEX_KEYS = ("rowindex", "index", "__index")
+_FILTERED_INDEX_KEYS = ("filteredindex", "__filteredindex")
+_FILTER_VALUES_MAX = 500
+
+
+def _as_frame(data: Any) -> Any:
+    """DataFrame view of a table input (None if it isn't tabular)."""
+    pd, _ = _try_imports()
+    if pd is None or data is None:
+        return None
+    if isinstance(data, pd.DataFrame):  # type: ignore[attr-defined]
+        return data
+    if isinstance(data, pd.Series):  # type: ignore[attr-defined]
+        return pd.DataFrame({"index": data.index, "value": data.to_numpy()})
+    if isinstance(data, list) and all(isinstance(r, dict) for r in data):
+        return pd.DataFrame(data)
+    if isinstance(data, dict):
+        try:
+            return pd.DataFrame(data)
+        except Exception:
+            return None
+    return None
+
+
+def _text_column(df: Any, col: str) -> Any:
+    """Column as lower-cased display text (None -> "") for server-side matching."""
+    pd, np = _try_imports()
+    values = _column_values(df[col])
+    return pd.Series(["" if v is None else str(v) for v in values], dtype=object).str.lower()
+
+
+def _window_state(key: Optional[str]) -> Dict[str, Any]:
+    """Window request the frontend attached to its last event (start/query/filters/jump)."""
+    if not key:
+        return {}
+    try:
+        import streamlit as st
+
+        last = st.session_state.get(key)
+    except Exception:
+        return {}
+    if isinstance(last, dict) and isinstance(last.get("window"), dict):
+        return last["window"]
+    return {}
+
+
+def _rule_mask(df: Any, view: Any, rules: Dict[str, Any]) -> Any:
+    """Rows of `view` matching one jump-button definition (same rules as the frontend)."""
+    _, np = _try_imports()
+    mask = np.ones(len(view), dtype=bool)
+    for col, terms in (rules or {}).items():
+        terms = terms if isinstance(terms, list) else [terms]
+        cl = str(col).lower()
+        if cl in _INDEX_KEYS or cl in _FILTERED_INDEX_KEYS:
+            wanted = []
+            for t in terms:
+                try:
+                    wanted.append(int(t))
+                except Exception:
+                    pass
+            pos = view if cl in _INDEX_KEYS else np.arange(len(view))
+            mask &= np.isin(pos, wanted)
+        elif col in df.columns:
+            text = _text_column(df, col).to_numpy()[view]
+            hit = np.zeros(len(view), dtype=bool)
+            for t in terms:
+                needle = str(t).lower()
+                hit |= np.fromiter((needle in v for v in text), dtype=bool, count=len(text))
+            mask &= hit
+        else:
+            mask[:] = False
+    return mask
+
+
+def _shortlog_window(
+    short_df: Any,
+    size: int,
+    state: Dict[str, Any],
+    *,
+    filter_columns: List[str],
+    search_columns: List[str],
+    jump_buttons: Optional[Dict[str, Any]],
+) -> tuple[Any, Dict[str, Any]]:
+    """Resolve the requested window -> (original row ids, window meta for the frontend)."""
+    _, np = _try_imports()
+    n = len(short_df)
+    mask = np.ones(n, dtype=bool)
+    filters = state.get("filters") if isinstance(state.get("filters"), dict) else {}
+    for col, vals in filters.items():
+        vals = vals if isinstance(vals, list) else [vals]
+        wanted = {str(v).lower() for v in vals if v is not None and str(v) != ""}
+        if wanted and col in short_df.columns:
+            mask &= _text_column(short_df, col).isin(wanted).to_numpy()
+    query_raw = str(state.get("query") or "")
+    query = query_raw.strip().lower()
+    if query:
+        cols = [c for c in (search_columns or list(short_df.columns)) if c in short_df.columns]
+        hit = np.zeros(n, dtype=bool)
+        for c in cols:
+            hit |= _text_column(short_df, c).str.contains(query, regex=False).to_numpy()
+        mask &= hit
+    view = np.flatnonzero(mask)
+
+    start = int(state.get("start") or 0)
+    focus: Optional[int] = None
+    jump_counts: Dict[str, int] = {}
+    for label, rules in (jump_buttons or {}).items():
+        hits = np.flatnonzero(_rule_mask(short_df, view, rules))
+        jump_counts[label] = int(len(hits))
+        if label == state.get("jump") and len(hits):
+            after = int(state.get("after", -1))
+            nxt = hits[view[hits] > after]
+            pos = int(nxt[0] if len(nxt) else hits[0])
+            focus = int(view[pos])
+            start = pos
+    start = max(0, min(start, max(0, len(view) - 1)))
+    start -= start % size
+    ids = view[start : start + size]
+
+    filter_values: Dict[str, List[str]] = {}
+    for col in filter_columns:
+        if col in short_df.columns:
+            vals = _column_values(short_df[col])
+            uniq = sorted({"" if v is None else str(v) for v in vals})
+            filter_values[col] = uniq[:_FILTER_VALUES_MAX]
+
+    meta = {
+        "total": n,
+        "matched": int(len(view)),
+        "start": start,
+        "size": size,
+        "row_ids": ids.tolist(),
+        "query": query_raw,
+        "filters": filters,
+        "focus": focus,
+        "filter_values": filter_values,
+        "jump_counts": jump_counts,
+    }
+    return ids, meta
+
+
+# ---------------------- util: layout helpers ----------------------
+def _as_int_or_none(x: Any) -> Optional[int]:
+    if x is None:
+        return None
+    try:
+        return int(x)
+    except Exception:
+        return None
+
+
+def _as_width(x: Any) -> Optional[int | str]:
+    if x is None:
+        return None
+    if isinstance(x, (int, float)):
+        return int(x)
+    s = str(x).strip()
+    return s if s else None
+
+
+def _as_track_spec(
+    x: Union[
+        None, str, int, float, Sequence[Union[int, float, str]]
+    ],
+    *,
+    fallback: Optional[str] = None,
+    use_fr_for_numbers: bool = True,
+) -> Optional[str]:
+    """Convert python input to CSS grid track string."""
+    if x is None:
+        return fallback
+    if isinstance(x, str):
+        s = x.strip()
+        return s or fallback
+    if isinstance(x, (int, float)):
+        return f"{int(x)}px"
+    try:
+        seq = list(x)  # type: ignore
+    except Exception:
+        return fallback
+    if len(seq) != 2:
+        return fallback
+    out: list[str] = []
+    for v in seq:
+        if isinstance(v, str):
+            out.append(v.strip())
+        elif isinstance(v, (int, float)):
+            if use_fr_for_numbers:
+                out.append(f"{v}fr" if v != 0 else "0px")
+            else:
+                out.append(f"{int(v)}px")
+        else:
+            out.append(str(v))
+    return " ".join(out)
+
+
+def _validate_column_sizing(x: Optional[str]) -> Optional[str]:
+    if x is None:
+        return None
+    x = str(x).strip().lower()
+    if x in {"preset", "content", "auto"}:
+        return x
+    # fallback to preset if invalid
+    return "preset"
+
+
+# ---------------------- main component function ----------------------
+def my_viewer(
+    *,
+    report_list: Any | None = None,
+    report_list_schema: Optional[Dict[str, str]] = None,
+    report_detail_html: Optional[str] = None,
+    error_log_short: Any | None = None,
+    error_log_detail: Any | None = None,
+    # list of dicts, list with zero-arg callables, or loader(index) -> dict (lazy)
+    report_cache: Optional[Union[List[Union[ReportEntry, Callable[[], ReportEntry]]], ReportLoader]] = None,
+    active_report_index: Optional[int] = None,
+    # Lazy report_cache: also load this many neighbours of the active report
+    report_prefetch: Optional[int] = None,
+    # Behavior controls
+    emit_copy_events: Optional[bool] = None,
+    emit_shortlog_events: Optional[bool] = None,
+    selection_debounce_ms: Optional[int] = None,
+    shortlog_debounce_ms: Optional[int] = None,
+    filter_config: Optional[Dict[str, Any]] = None,
+    search_config: Optional[Dict[str, Any]] = None,
+    ui_theme: Optional[Dict[str, Any]] = None,
+    auto_emit_initial: Optional[bool] = True,
+    shortlog_style_rules: Optional[List[Dict[str, Any]]] = None,
+    # Optional alarm/note above the Short Log panel
+    shortlog_alarm_note: Optional[Union[str, Dict[str, Any]]] = None,
+    report_detail_alarm_note: Optional[Union[str, Dict[str, Any]]] = None,
+    # NEW: ShortLog quick jump buttons
+    # e.g., {"Go ERROR": {"level": ["ERROR"]}, "Go etc": {"message": "etc"}}
+    # Supports special keys: "rowIndex" (original row index), "filteredIndex" (index in current filtered view)
+    # Values may be string/int or list of string/int.
+    shortlog_jump_buttons: Optional[
+        Dict[str, Dict[str, Union[str, int, List[Union[str, int]]]]]
+    ] = None,
+    #  NEW: ShortLog column layout controls
+    shortlog_column_order: Optional[List[str]] = None,
+    shortlog_column_sizing: Optional[str] = None,  # "preset" | "content" | "auto"
+    # Data transport: "records" (list of row dicts) | "columnar" (column-major lists)
+    #                 | "arrow" (DataFrames via Streamlit's Arrow serialization)
+    wire_format: Optional[str] = None,
+    # Reuse normalized DataFrames across reruns when their content is unchanged
+    payload_cache: bool = True,
+    # Send only panels whose content changed since the frontend last saw them (needs key)
+    delta_updates: bool = False,
+    # Windowed short/detail logs: rows per page served from Python (needs key)
+    window_size: Optional[int] = None,
+    # misc
+    key: Optional[str] = None,
+    default_event: Optional[Dict[str, Any]] = None,
+    #  Size props
+    max_width: Optional[int | str] = None,
+    frame_height: Optional[int] = None,
+    list_max_height: Optional[int] = None,
+    list_min_height: Optional[int] = None,
+    report_list_max_height: Optional[int] = None,
+    report_list_min_height: Optional[int] = None,
+    shortlog_max_height: Optional[int] = None,
+    shortlog_min_height: Optional[int] = None,
+    detail_max_height: Optional[int] = None,
+    detail_min_height: Optional[int] = None,
+    html_max_height: Optional[int] = None,
+    html_min_height: Optional[int] = None,
+    #  Grid ratio/track props
+    col_ratio: Optional[List[float] | tuple[float, float]] = None,
+    row_ratio: Optional[List[float] | tuple[float, float]] = None,
+    grid_columns: Optional[str | List[int | float | str] | tuple[int | float | str, int | float | str]] = None,
+    grid_rows: Optional[str | List[int | float | str] | tuple[int | float | str, int | float | str]] = None,
+    **kwargs,
+) -> Dict[str, Any] | Any:
+    """Render the custom 4-panel viewer and return user events."""
+
+    wire = _validate_wire_format(wire_format)
+    # wire_format="arrow": DataFrames go to Streamlit as top-level args (Arrow IPC);
+    # the JSON payload only carries {"arrow": "<arg name>"} references to them.
+    arrow_args: Dict[str, Any] = {}
+    # delta_updates: panels the frontend already holds (by content hash) are sent
+    # as {"ref": hash}; "delta_hashes" maps payload path -> hash for every panel.
+    use_delta = bool(delta_updates and key)
+    held = _held_hashes(key) if use_delta else set()
+    delta_hashes: Dict[str, str] = {}
+
+    def _delta(path: str, data: Any, build: Any) -> Any:
+        if use_delta and data is not None:
+            h = _content_hash(data, wire)
+            if h is not None:
+                delta_hashes[path] = h
+                if h in held:
+                    return {"ref": h}
+        return build(data)
+
+    def _build_table(path: str, data: Any) -> Any:
+        if wire == "arrow" and data is not None:
+            df = _arrow_frame(data)
+            if df is not None:
+                arg = "arrow_" + path.replace(".", "_")
+                arrow_args[arg] = df
+                return {"arrow": arg}
+            return _normalize_table(data)
+        if payload_cache:
+            return _normalize_table_cached(data, wire)
+        return _normalize_table(data, wire)
+
+    def _table(path: str, data: Any) -> Any:
+        return _delta(path, data, lambda d: _build_table(path, d))
+
+    def _html(path: str, html: Any) -> Any:
+        return _delta(path, html, lambda d: d)
+
+    # window_size: only one page of short/detail rows is serialized; search, filter,
+    # paging and jump requests come back as events and are answered here.
+    shortlog_window: Optional[Dict[str, Any]] = None
+    if window_size:
+        short_df = _as_frame(error_log_short)
+        if short_df is not None:
+            ids, shortlog_window = _shortlog_window(
+                short_df,
+                max(1, int(window_size)),
+                _window_state(key),
+                filter_columns=list((filter_config or {}).get("columns") or []),
+                search_columns=list((search_config or {}).get("columns") or []),
+                jump_buttons=shortlog_jump_buttons,
+            )
+            error_log_short = short_df.iloc[ids]
+            detail_df = _as_frame(error_log_detail)
+            if detail_df is not None and len(detail_df) == len(short_df):
+                error_log_detail = detail_df.iloc[ids]
+
+    # Lazy report_cache: only the active/requested reports (+ neighbours) are
+    # loaded and normalized; the frontend keeps earlier ones in an LRU.
+    cache_items, cache_lazy = _resolve_report_cache(
+        report_cache,
+        count=_table_len(report_list),
+        prefetch=report_prefetch,
+        wanted=[active_report_index, _requested_report(key)],
+    )
+
+    payload: Dict[str, Any] = {
+        "report_list": _table("report_list", report_list),
+        "report_list_schema": report_list_schema,
+        "report_detail_html": _html("report_detail_html", report_detail_html),
+        "error_log_short": _table("error_log_short", error_log_short),
+        "error_log_detail": _table("error_log_detail", error_log_detail),
+        "report_cache": None
+        if not cache_items
+        else [
+            None
+            if cache_lazy and item is None
+            else {
+                "detail_html": _html(f"report_cache.{i}.detail_html", (item.get("detail_html") if isinstance(item, dict) else None)),
+                "short": _table(f"report_cache.{i}.short", (item.get("short") if isinstance(item, dict) else None)),
+                "detail": _table(f"report_cache.{i}.detail", (item.get("detail") if isinstance(item, dict) else None)),
+            }
+            for i, item in enumerate(cache_items)
+        ],
+        "report_cache_version": _content_hash(report_list, str(len(cache_items or [])))
+        if cache_lazy
+        else None,
+        "active_report_index": active_report_index,
+        "emit_copy_events": emit_copy_events,
+        "emit_shortlog_events": emit_shortlog_events,
+        "selection_debounce_ms": selection_debounce_ms,
+        "shortlog_debounce_ms": shortlog_debounce_ms,
+        "filter_config": filter_config,
+        "search_config": search_config,
+        "ui_theme": ui_theme,
+        "auto_emit_initial": auto_emit_initial,
+        "shortlog_style_rules": shortlog_style_rules,
+        "shortlog_alarm_note": shortlog_alarm_note,
+        "report_detail_alarm_note": report_detail_alarm_note,
+        "shortlog_jump_buttons": shortlog_jump_buttons,
+        #  NEW: pass-through
+        "shortlog_column_order": shortlog_column_order,
+        "shortlog_column_sizing": _validate_column_sizing(shortlog_column_sizing),
+        "delta_hashes": delta_hashes or None,
+        "shortlog_window": shortlog_window,
+    }
+
+    # Compute shortlog layout (order + width hints)
+    try:
+        norm = payload.get("error_log_short")
+        if isinstance(norm, dict) and "arrow" in norm:
+            norm = arrow_args.get(norm["arrow"])
+        elif isinstance(norm, dict) and "ref" in norm:
+            norm = _normalize_table_cached(error_log_short, "records" if wire == "arrow" else wire)
+        if norm is not None:
+            _cols = _table_columns(norm)
+            if _cols:
+                cols_list = [str(c) for c in _cols]
+                order = cols_list[:]
+                if shortlog_column_order:
+                    seen = set()
+                    merged: List[str] = []
+                    for c in shortlog_column_order:
+                        if c in order and c not in seen:
+                            merged.append(c)
+                            seen.add(c)
+                    for c in order:
+                        if c not in seen:
+                            merged.append(c)
+                    order = merged
+                low = [c.lower() for c in order]
+                for i, c in enumerate(low):
+                    if c in ("message", "text") and i != len(order) - 1:
+                        moved = order.pop(i)
+                        order.append(moved)
+                        break
+                def _width(col: str) -> int:
+                    sizing = _validate_column_sizing(shortlog_column_sizing)
+                    if sizing in ("auto", "content"):
+                        m = len(str(col))
+                        for v in _table_column(norm, col):
+                            try:
+                                s = "" if v is None else str(v)
+                            except Exception:
+                                s = ""
+                            if len(s) > m:
+                                m = len(s)
+                        return max(80, min(int(m * 8 + 24), 280))
+                    cl = col.lower()
+                    if cl in ("timestamp", "time", "date", "ts"):
+                        return 150
+                    if cl == "level":
+                        return 100
+                    return 140
+                layout_cols: List[Dict[str, Any]] = []
+                for i, col in enumerate(order):
+                    if i == len(order) - 1:
+                        layout_cols.append({"name": col, "flex": True})
+                    else:
+                        layout_cols.append({"name": col, "width_px": _width(col)})
+                payload["shortlog_layout"] = {"columns": layout_cols}
+    except Exception:
+        pass
+
+    # ---- grid controls ----
+    grid_cols_str = _as_track_spec(grid_columns, fallback=None, use_fr_for_numbers=True)
+    if grid_cols_str is None and col_ratio is not None:
+        grid_cols_str = _as_track_spec(col_ratio, fallback=None, use_fr_for_numbers=True)
+
+    grid_rows_str = _as_track_spec(grid_rows, fallback=None, use_fr_for_numbers=True)
+    if grid_rows_str is None and row_ratio is not None:
+        grid_rows_str = _as_track_spec(row_ratio, fallback=None, use_fr_for_numbers=True)
+
+    report_list_max_opt = _as_int_or_none(report_list_max_height)
+    if report_list_max_opt is None:
+        report_list_max_opt = _as_int_or_none(list_max_height)
+
+    report_list_min_opt = _as_int_or_none(report_list_min_height)
+    if report_list_min_opt is None:
+        report_list_min_opt = _as_int_or_none(list_min_height)
+
+    shortlog_max_opt = _as_int_or_none(shortlog_max_height)
+    if shortlog_max_opt is None:
+        shortlog_max_opt = _as_int_or_none(list_max_height)
+
+    shortlog_min_opt = _as_int_or_none(shortlog_min_height)
+    if shortlog_min_opt is None:
+        shortlog_min_opt = _as_int_or_none(list_min_height)
+
+    component_value = _component_func(
+        **payload,
+        **arrow_args,
+        key=key,
+        default=default_event or {"type": "init"},
+        max_width=_as_width(max_width),
+        frame_height=_as_int_or_none(frame_height),
+        list_max_height=_as_int_or_none(list_max_height),
+        list_min_height=_as_int_or_none(list_min_height),
+        report_list_max_height=report_list_max_opt,
+        report_list_min_height=report_list_min_opt,
+        shortlog_max_height=shortlog_max_opt,
+        shortlog_min_height=shortlog_min_opt,
+        detail_max_height=_as_int_or_none(detail_max_height),
+        detail_min_height=_as_int_or_none(detail_min_height),
+        html_max_height=_as_int_or_none(html_max_height),
+        html_min_height=_as_int_or_none(html_min_height),
+        grid_columns=grid_cols_str,
+        grid_rows=grid_rows_str,
+        **kwargs,
+    )
+    if isinstance(component_value, dict) and ("held" in component_value or "window" in component_value):
+        component_value = {k: v for k, v in component_value.items() if k not in ("held", "window")}
+    return component_value
+
+
+if __name__ == "__main__":
+    # Interactive demo with aligned short/detail logs per report
+    import streamlit as st
+
+    st.set_page_config(layout="wide")
+
+    try:
+        import pandas as pd
+    except Exception:
+        pd = None
+
+    # Cache demo data and conversions to keep reruns fast
+    if pd is not None:
+        @st.cache_data(show_spinner=False)
+        def _to_df(obj):
+            return pd.DataFrame(obj)
+
+        @st.cache_data(show_spinner=False)
+        def _report_list_df(reports: list[dict]):
+            return pd.DataFrame([r["report"] for r in reports])
+    else:
+        def _to_df(obj):
+            return obj
+        def _report_list_df(reports: list[dict]):
+            return [r["report"] for r in reports]
+
+    @st.cache_data(show_spinner=False)
+    def _demo_reports() -> list[dict]:
+        data: list[dict] = [
+            {
+                "report": {"name": "Alpha", "date": "2025-01-10", "path1": "/a/b", "path2": "/c/d"},
+                "detail_html": """
+                    <div style='font-family:Arial'>
+                        <style>
+                            .hl-red { background:#ffebee; color:#c62828; padding:2px 4px; border-radius:4px; }
+                            .hl-blue { background:#e3f2fd; color:#1565c0; padding:2px 4px; border-radius:4px; }
+                            .note { color:#555; font-size:13px; }
+                        </style>
+                        <h3>Alpha Report</h3>
+                        <p><b>Summary:</b> Alpha run completed with <span class='hl-red'>warnings</span>.</p>
+                        <ul>
+                          <li>Init OK</li>
+                          <li>Processed <span class='hl-blue'>120</span> items</li>
+                          <li><span class='hl-red'>2 warnings</span></li>
+                        </ul>
+                        <p class='note'>This is a <span class='hl-blue'>demo highlight</span> to preview copy behavior.</p>
+                    </div>
+                """,
+                "short": [
+                    {"ts": "10:00:01.1230124210", "level": "INFO", "message": "Start", "line": 1},
+                    {"ts": "10:00:05", "level": "INFO", "message": "Loading", "line": 2},
+                    {"ts": "10:00:12", "level": "WARN", "message": "Slow network", "line": 3},
+                    {"ts": "10:00:20", "level": "INFO", "message": "Done", "line": 4},
+                ],
+                "detail": [
+                    {"ts": "10:00:01", "message": "Start", "full": "Job started by user alpha\ndasds\nasdf\nsdfds\nsdfds\n\ndsfsdd", "line": 1},
+                    {"ts": "10:00:05", "message": "Loading", "full": "Loading resources from S3 bucket...", "line": 2},
+                    {"ts": "10:00:12", "message": "Slow network", "full": "Download slowed below 1MB/s", "line": 3},
+                    {"ts": "10:00:20", "message": "Done", "full": "Job finished in 19s", "line": 4},
+                ],
+            },
+            {
+                "report": {"name": "Beta", "date": "2025-01-11", "path1": "/e/f", "path2": "/g/h"},
+                "detail_html": """
+                    <div style='font-family:Arial'>
+                        <style>
+                            .hl-red { background:#ffebee; color:#c62828; padding:2px 4px; border-radius:4px; }
+                            .hl-blue { background:#e3f2fd; color:#1565c0; padding:2px 4px; border-radius:4px; }
+                            .note { color:#555; font-size:13px; }
+                        </style>
+                        <h3>Beta Report</h3>
+                        <p><b>Summary:</b> Beta run failed with <span class='hl-red'>errors</span>.</p>
+                        <ul>
+                          <li>Init OK</li>
+                          <li>Processed <span class='hl-blue'>23</span> items</li>
+                          <li><span class='hl-red'>1 error</span></li>
+                        </ul>
+                        <p class='note'>Highlighted words will remain highlighted when copied.</p>
+                    </div>
+                """,
+                "short": [
+                    {"ts": "11:00:01", "level": "INFO", "message": "Start", "line": 1},
+                    {"ts": "11:00:04", "level": "ERROR", "message": "DB connect fail", "line": 2},
+                    {"ts": "11:00:04", "level": "INFO", "message": "Retrying", "line": 3},
+                    {"ts": "11:00:06", "level": "ERROR", "message": "DB connect timeout", "line": 4},
+                ],
+                "detail": [
+                    {"ts": "11:00:01", "message": "Start", "full": "Job started by user beta", "line": 1},
+                    {"ts": "11:00:04", "message": "DB connect fail", "full": "psycopg2.OperationalError ...", "line": 2},
+                    {"ts": "11:00:04", "message": "Retrying", "full": "Reattempting connection (1/3)", "line": 3},
+                    {"ts": "11:00:06", "message": "DB connect timeout", "full": "Connection timed out after 2s", "line": 4},
+                ],
+            },
+        ]
+        for i in range(3, 21):
+            name = f"Report {i:02d}"
+            date = f"2025-01-{10 + (i % 20):02d}"
+            short = [
+                {
+                    "ts": f"{12 + (i % 6):02d}:{(j // 60):02d}:{(j % 60):02d}",
+                    "level": ["INFO", "WARN", "ERROR"][j % 3],
+                    "message": f"{name} short log line {j}",
+                    "line": j,
+                }
+                for j in range(1, 26)
+            ]
+            detail = [
+                {
+                    "ts": s["ts"],
+                    "message": s["message"],
+                    "full": f"Full detail for {name} line {s['line']}: Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod.",
+                    "line": s["line"],
+                }
+                for s in short
+            ]
+            html = f"""
+                <div style='font-family:Arial'>
+                    <style>
+                        .hl-red {{ background:#ffebee; color:#c62828; padding:2px 4px; border-radius:4px; }}
+                        .hl-blue {{ background:#e3f2fd; color:#1565c0; padding:2px 4px; }}
+                    </style>
+                    <h3>{name}</h3>
+                    <p><b>Summary:</b> Demo <span class='hl-blue'>auto-generated</span> report with <span class='hl-red'>highlights</span>.</p>
+                </div>
+            """
+            data.append({
+                "report": {"name": name, "date": date, "path1": f"/auto/{i}/x", "path2": f"/auto/{i}/y"},
+                "detail_html": html,
+                "short": short,
+                "detail": detail,
+            })
+        return data
+
+    def _rerun():
+        try:
+            st.rerun()
+        except Exception:
+            try:
+                st.experimental_rerun()
+            except Exception:
+                pass
+
+    st.write("Demo: my_viewer (Report list + Short/Detail sync)")
+
+    reports_data = _demo_reports()
+    report_list = _report_list_df(reports_data)
+
+    if "selected_report_idx" not in st.session_state:
+        st.session_state["selected_report_idx"] = 0
+
+    sel = int(st.session_state["selected_report_idx"]) if st.session_state.get("selected_report_idx") is not None else 0
+    sel = max(0, min(sel, len(reports_data) - 1))
+    cur = reports_data[sel]
+
+    short_logs = cur["short"]
+    detail_logs = cur["detail"]
+    if pd is not None:
+        try:
+            short_logs = pd.DataFrame(short_logs)
+            detail_logs = pd.DataFrame(detail_logs)
+        except Exception:
+            pass
+
+    event = my_viewer(
+        report_list=report_list,
+        report_list_schema={
+            "name": "name",
+            "date": "date",
+            "path1": "path1",
+            "path2": "path2",
+        },
+        report_detail_html=cur["detail_html"],
+        error_log_short=short_logs,
+        error_log_detail=detail_logs,
+        active_report_index=sel,
+        auto_emit_initial=True,
+        emit_copy_events=False,
+        emit_shortlog_events=False,
+        selection_debounce_ms=0,
+        shortlog_debounce_ms=140,
+        report_detail_alarm_note={"text": "Demo : Report Detail   ", "level": "info"},
+        shortlog_style_rules=[
+            #  level  /
+            {"column": "level", "equals": ["ERROR"], "backgroundColor": "#ffebee", "color": "#c62828", "badge": True},
+            {"column": "level", "equals": ["WARN", "WARNING"], "backgroundColor": "#fff8e1", "color": "#f57c00", "badge": True},
+            # rowIndex/filteredIndex 
+            {"column": "rowIndex", "equals": [1, 4, 7], "backgroundColor": "#e8f1fd", "color": "#1565c0"},
+            {"column": "filteredIndex", "equals": [0], "backgroundColor": "#f3e5f5", "color": "#6a1b9a"},
+        ],
+        shortlog_alarm_note={"text": "Demo : Short Log   ", "level": "error"},
+        shortlog_jump_buttons={
+            #  / 
+            "Go ERROR": {"level": "ERROR"},
+            "Go WARN": {"level": ["WARN", "WARNING"]},
+            # rowIndex filteredIndex 
+            "Go rows 1,4,7": {"rowIndex": [1, 4]},
+        },
+        filter_config={"columns": ["level"]},
+        search_config={"columns": ["message"], "placeholder": "Search message..."},
+        ui_theme={"accentColor": "#1976d2"},
+        #  NEW: column layout controls ( TSX )
+        shortlog_column_order=["ts", "level", "message"],  #  
+        shortlog_column_sizing="preset",                   # "preset" | "content" | "auto"
+        report_list_max_height = 200,
+        shortlog_max_height = 344,
+        delta_updates=True,  # clicks only resend panels that changed
+        key="my_viewer_demo",
+    )
+
+    if isinstance(event, dict) and event.get("type") == "report_selected":
+        idx = int(event.get("rowIndex", 0))
+        if idx != sel:
+            st.session_state["selected_report_idx"] = idx
+            _rerun() 
+
@@ -0,0 +1,46 @@
+"""
+viewer_common tests
+
+python -m pytest test01/frontend/custom/viewer-common
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import viewer_common
+
+STAMPS = ["1500-06-01T01:02:03.5", "1969-12-31T23:59:59.999", "2020-01-01T00:00:00.123456", "3000-01-01", None]
+
+
+def _per_cell(series, nat=None):
+    return [nat if v is pd.NaT else v.isoformat() for v in series]
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us"])
+def test_datetime_isoformat_matches_timestamp_outside_ns_range(unit):
+    series = pd.Series(np.array(STAMPS, dtype=f"datetime64[{unit}]"))
+    assert viewer_common.datetime_isoformat(series) == _per_cell(series)
+    assert viewer_common.datetime_isoformat(series, nat="NaT")[-1] == "NaT"
+
+
+def test_datetime_isoformat_ns_and_coarse_units():
+    ns = pd.Series(pd.to_datetime(["2020-01-01T00:00:00.000000001", "2020-01-01T00:00:00.5", None]))
+    assert viewer_common.datetime_isoformat(ns) == _per_cell(ns)
+    days = pd.Series(np.array(["2020-01-01", "1200-03-04"], dtype="datetime64[D]"))
+    assert viewer_common.datetime_isoformat(days) == ["2020-01-01T00:00:00", "1200-03-04T00:00:00"]
+
+
+def test_datetime_isoformat_tz_aware_keeps_row_offsets():
+    series = pd.Series(pd.to_datetime(["2024-01-15 12:00", "2024-07-15 12:00", None]).tz_localize("Europe/Berlin"))
+    assert viewer_common.datetime_isoformat(series) == _per_cell(series)
+    assert viewer_common.datetime_isoformat(series)[:2] == ["2024-01-15T12:00:00+01:00", "2024-07-15T12:00:00+02:00"]
+
+
+def test_datetime_epoch_ms():
+    series = pd.Series(np.array(["1500-01-01", "1970-01-01T00:00:01.5", None], dtype="datetime64[ms]"))
+    result = viewer_common.datetime_epoch_ms(series)
+    assert result[0] == np.datetime64("1500-01-01", "ms").astype("int64")
+    assert result[1] == 1500.0 and np.isnan(result[2])
+    aware = pd.Series(pd.to_datetime(["1970-01-01T09:00:00"]).tz_localize("Asia/Seoul"))
+    assert viewer_common.datetime_epoch_ms(aware).tolist() == [0.0]
@@ -0,0 +1,97 @@
+import { useEffect, useMemo, useState } from "react"
+import type { Args, HtmlValue, PackedHtml } from "./types"
+
+// html_dedup: report HTML arrives as { html | deflate, frags } with shared
+// <style>/<template> blocks replaced by markers; the blocks come once in
+// html_fragments and are kept here across renders (reported back as "held").
+const FRAGMENT_LIMIT = 256
+const MARKER = /<!--mv-frag:([0-9a-f]+)-->/g
+
+export type FragmentStore = { map: Map<string, string>; version: number }
+
+export const createFragmentStore = (): FragmentStore => ({
+  map: new Map(),
+  version: 0,
+})
+
+export const isPackedHtml = (v: unknown): v is PackedHtml =>
+  !!v && typeof v === "object" && Array.isArray((v as any).frags)
+
+// Store incoming fragments; returns hashes referenced in args but not held
+export function applyFragments(a: Args, store: FragmentStore): string[] {
+  const incoming = a.html_fragments
+  if (incoming) {
+    for (const [hash, text] of Object.entries(incoming)) {
+      store.map.delete(hash)
+      store.map.set(hash, text)
+    }
+    while (store.map.size > FRAGMENT_LIMIT) {
+      store.map.delete(store.map.keys().next().value as string)
+    }
+    store.version++
+  }
+  const values: HtmlValue[] = [
+    a.report_detail_html,
+    ...(a.report_cache || []).map((e) => e?.detail_html),
+  ]
+  const missing = new Set<string>()
+  for (const v of values) {
+    if (!isPackedHtml(v)) continue
+    for (const hash of v.frags) if (!store.map.has(hash)) missing.add(hash)
+  }
+  return Array.from(missing)
+}
+
+function expand(body: string, frags: string[], store: FragmentStore): string {
+  if (frags.length === 0) return body
+  const wanted = new Set(frags)
+  return body.replace(MARKER, (marker, hash: string) =>
+    wanted.has(hash) && store.map.has(hash) ? store.map.get(hash)! : marker
+  )
+}
+
+const inflated = new WeakMap<PackedHtml, Promise<string>>()
+
+function inflate(p: PackedHtml): Promise<string> {
+  let pending = inflated.get(p)
+  if (!pending) {
+    const bytes = Uint8Array.from(atob(p.deflate!), (c) => c.charCodeAt(0))
+    const stream = new Blob([bytes])
+      .stream()
+      .pipeThrough(new DecompressionStream("deflate"))
+    pending = new Response(stream).text()
+    inflated.set(p, pending)
+  }
+  return pending
+}
+
+// Plain strings pass through; packed HTML is inflated (async) and expanded
+export function useHtml(
+  value: HtmlValue,
+  store: FragmentStore
+): string | null | undefined {
+  const [body, setBody] = useState<{ src: PackedHtml; text: string } | null>(
+    null
+  )
+  useEffect(() => {
+    if (!isPackedHtml(value) || value.deflate == null) return
+    let alive = true
+    inflate(value).then((text) => {
+      if (alive) setBody({ src: value, text })
+    })
+    return () => {
+      alive = false
+    }
+  }, [value])
+  const version = store.version
+  return useMemo(() => {
+    if (!isPackedHtml(value)) return value
+    const raw =
+      value.deflate != null
+        ? body?.src === value
+          ? body.text
+          : null
+        : value.html ?? ""
+    return raw == null ? null : expand(raw, value.frags, store)
+  }, [value, body, store, version])
+}
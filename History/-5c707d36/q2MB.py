@@ -0,0 +1,92 @@
+"""
+벤치마크: 동시 요청 처리량 (게이트 확인 + 레이트리밋)
+
+python -m backend.bench_redis_batch                 # fakeredis, 동시 500 요청 x 20 라운드
+python -m backend.bench_redis_batch 2000 10         # 동시 수, 라운드
+REDIS_URL=redis://localhost:6379/0 python -m backend.bench_redis_batch
+
+- separate : 요청마다 PTTL(게이트) + 레이트리밋 명령들을 따로 보냄 (왕복 여러 번)
+- script   : 요청마다 Lua 스크립트 1회 (왕복 1번)
+- batched  : Lua 스크립트 + RedisBatcher (동시 요청들이 파이프라인 하나를 공유)
+
+fakeredis 는 프로세스 내라 네트워크 왕복이 없음 → 실제 Redis 에서 차이가 훨씬 큼
+"""
+
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+from backend.redis_batch import RedisBatcher, RedisGate
+
+WINDOW_MS = 10_000
+LIMIT = 1_000_000  # 벤치 중 차단되지 않게
+POOL = 64  # 연결 풀 크기 (풀이 차면 대기 — 요청마다 연결을 잡는 방식은 여기서 막힘)
+
+
+async def _separate(client, user_id: str, rate_key: str) -> bool:
+    """Lua 없이 명령을 하나씩 (예전 방식 그대로 Redis 로 옮긴 경우)"""
+    if await client.pttl("ready:" + user_id) <= 0:
+        return False
+    if await client.pttl("rl:" + rate_key + ":ban") > 0:
+        return False
+    now = int(time.time() * 1000)
+    key = "rl:" + rate_key
+    await client.zremrangebyscore(key, "-inf", now - WINDOW_MS)
+    if await client.zcard(key) >= LIMIT:
+        return False
+    await client.zadd(key, {uuid.uuid4().hex: now})
+    await client.pexpire(key, WINDOW_MS)
+    return True
+
+
+async def _round(fn, users, concurrency: int) -> None:
+    await asyncio.gather(*(fn(users[i % len(users)]) for i in range(concurrency)))
+
+
+async def _run(label: str, fn, users, concurrency: int, rounds: int) -> None:
+    await _round(fn, users, concurrency)  # 워밍업 (스크립트 로드 등)
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        await _round(fn, users, concurrency)
+    dt = time.perf_counter() - t0
+    n = concurrency * rounds
+    print(f"  {label:<12}: {n / dt:10,.0f} req/s  ({dt / n * 1e6:7.1f} us/req)")
+
+
+async def main() -> None:
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    if os.getenv("REDIS_URL"):
+        import redis.asyncio as aioredis
+
+        pool = aioredis.BlockingConnectionPool.from_url(os.environ["REDIS_URL"], max_connections=POOL)
+        client = aioredis.Redis(connection_pool=pool)
+        target = os.environ["REDIS_URL"]
+    else:
+        from fakeredis import aioredis  # pip install fakeredis lupa
+        from redis.asyncio import BlockingConnectionPool
+
+        client = aioredis.FakeRedis(connection_pool_class=BlockingConnectionPool, max_connections=POOL)
+        target = "fakeredis"
+
+    users = [str(uuid.uuid4()) for _ in range(200)]
+    for u in users:
+        await client.set("ready:" + u, "1", ex=600)
+
+    plain = RedisGate(client, batcher=RedisBatcher(client, max_batch=1, max_delay_us=0), limit=LIMIT)
+    batcher = RedisBatcher(client, max_batch=256, max_delay_us=100)
+    batched = RedisGate(client, batcher=batcher, limit=LIMIT)
+
+    print(f"{target}: concurrency={concurrency}, rounds={rounds}, pool={POOL}")
+    await _run("separate", lambda u: _separate(client, u, "user:" + u), users, concurrency, rounds)
+    await _run("script", lambda u: plain.check(u, "user:" + u), users, concurrency, rounds)
+    await _run("batched", lambda u: batched.check(u, "user:" + u), users, concurrency, rounds)
+    print(f"  batcher: {batcher.stats()}")
+    for u in users:
+        await client.delete("ready:" + u, "rl:user:" + u)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
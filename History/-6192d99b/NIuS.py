@@ -0,0 +1,89 @@
+"""
+my_viewer tests
+
+python -m pytest test01/frontend/custom/my-viewer
+"""
+
+import multiprocessing
+import os
+
+import numpy as np
+import pandas as pd
+
+import my_viewer
+
+
+def _report(i):
+    return {
+        "short": pd.DataFrame({"n": [i, i + 1], "msg": [f"r{i}", None]}),
+        "detail": [{"k": "v", "i": i}],
+        "detail_html": f"<p>{i}</p>",
+    }
+
+
+def _dies_in_worker():
+    """Report loader that kills a pool worker (BrokenProcessPool) but works in-process."""
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return _report(9)
+
+
+def _tables(prepared):
+    return [(r["short"].json, r["detail"].json, r["detail_html"]) for r in prepared]
+
+
+def test_column_widths_are_cached_by_sample_content(monkeypatch):
+    monkeypatch.setattr(my_viewer, "_width_cache", my_viewer._PayloadCache(my_viewer.WIDTH_CACHE_MAX_BYTES))
+    s = pd.Series(["a", "abcdef", None, "abc"], name="msg")
+    assert my_viewer._column_text_len(s) == 6
+    assert my_viewer._column_text_len(s.copy()) == 6
+    info = my_viewer._width_cache.info()
+    assert (info["entries"], info["hits"], info["misses"]) == (1, 1, 1) and info["bytes"] > 0
+
+
+def test_prepare_reports_with_spawn_workers_matches_in_process():
+    reports = [_report(i) for i in range(3)]
+    local = my_viewer.prepare_reports(reports, workers=1)
+    pooled = my_viewer.prepare_reports(reports, workers=2, mp_context=multiprocessing.get_context("spawn"))
+    assert _tables(pooled) == _tables(local)
+    assert all(isinstance(r["short"], my_viewer.PreparedTable) for r in pooled)
+
+
+def test_prepare_reports_falls_back_when_workers_die():
+    reports = [_report(0), _dies_in_worker, _report(1)]
+    prepared = my_viewer.prepare_reports(reports, workers=2, mp_context=multiprocessing.get_context("spawn"))
+    assert _tables(prepared) == _tables(my_viewer.prepare_reports([_report(0), _report(9), _report(1)], workers=1))
+
+
+def test_prepare_reports_falls_back_when_the_pool_cannot_start(monkeypatch):
+    import concurrent.futures
+
+    def no_pool(*args, **kwargs):
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+    reports = [_report(0), _report(1)]
+    assert _tables(my_viewer.prepare_reports(reports, workers=2)) == _tables(my_viewer.prepare_reports(reports, workers=1))
+
+
+def test_columnar_normalize_matches_per_cell_reference():
+    df = pd.DataFrame(
+        {
+            "i": [1, 2, 3],
+            "f": [1.5, np.nan, 2.0],
+            "b": [True, False, True],
+            "s": ["a", None, "c"],
+            "ts": pd.to_datetime(["2024-01-01 00:00:00.500", None, "2024-03-01 00:00:00.000"]),
+            "tz": pd.to_datetime(["2024-01-15 12:00", "2024-07-15 12:00", None]).tz_localize("Europe/Berlin"),
+            "old": np.array(["1500-06-01T01:02:03", None, "3000-01-01"], dtype="datetime64[s]"),
+            "ms": np.array(["1969-12-31T23:59:59.999", "2262-04-12", None], dtype="datetime64[ms]"),
+            "cat": pd.Categorical(["x", None, "y"]),
+            "ni": pd.array([1, None, 3], dtype="Int64"),
+            "td": pd.to_timedelta([1, None, 3], unit="s"),
+        }
+    )
+    columnar = my_viewer._normalize_frame_columnar(df)
+    assert columnar == my_viewer._normalize_frame_per_cell(df)
+    assert columnar["records"][1]["ts"] is None and columnar["records"][1]["f"] is None
+    assert columnar["records"][0]["old"] == "1500-06-01T01:02:03"
+    assert columnar["records"][1]["tz"] == "2024-07-15T12:00:00+02:00"
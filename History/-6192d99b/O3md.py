@@ -0,0 +1,18 @@
+"""
+my_viewer tests
+
+python -m pytest test01/frontend/custom/my-viewer
+"""
+
+import pandas as pd
+
+import my_viewer
+
+
+def test_column_widths_are_cached_by_sample_content():
+    my_viewer._width_cache.clear()
+    s = pd.Series(["a", "abcdef", None, "abc"], name="msg")
+    assert my_viewer._column_text_len(s) == 6
+    assert my_viewer._column_text_len(s.copy()) == 6
+    info = my_viewer._width_cache.info()
+    assert (info["entries"], info["hits"], info["misses"]) == (1, 1, 1) and info["bytes"] > 0
@@ -0,0 +1,105 @@
+"""
+log_viewer tests
+
+python -m pytest test01/frontend/custom/log-viewer
+"""
+
+import os
+
+import log_viewer
+
+
+def test_tail_restarts_after_copytruncate_that_grows_past_offset(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"one\ntwo\n")
+    state = log_viewer._TailState("path:" + str(path))
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["one", "two"]
+    session = state.session
+
+    with open(path, "r+b") as f:  # copytruncate: same inode, new content longer than the old
+        f.truncate(0)
+        f.write(b"rotated first line\nrotated second line\n")
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["rotated first line", "rotated second line"]
+    assert state.session != session  # new session: the frontend drops its buffer
+
+    with open(path, "ab") as f:
+        f.write(b"appended\n")
+    session = state.session
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["appended"]
+    assert state.session == session
+    assert state.offset == os.path.getsize(path)
+
+
+def test_jump_index_is_cached_by_frame_content(monkeypatch):
+    import pandas as pd
+
+    monkeypatch.setattr(log_viewer, "_jump_cache", log_viewer._PayloadCache(log_viewer.JUMP_INDEX_CACHE_MAX_BYTES))
+    df = pd.DataFrame({"level": ["INFO", "ERROR", "WARN", "error"]})
+    specs = log_viewer._jump_specs(None, True, "level", {})
+    values = {"level": df["level"].tolist()}
+    first = log_viewer._jump_index_cached(df, values, len(df), specs)
+    assert first == {"__error": [1, 3], "__warn": [2]}
+    assert log_viewer._jump_index_cached(df.copy(), values, len(df), specs) is first
+    info = log_viewer._jump_cache.info()
+    assert (info["entries"], info["hits"]) == (1, 1) and info["bytes"] > 0
+
+
+def test_search_index_is_cached_for_row_input(monkeypatch):
+    monkeypatch.setattr(log_viewer, "_search_cache", log_viewer._PayloadCache(log_viewer.SEARCH_INDEX_CACHE_MAX_BYTES))
+    rows = [{"msg": "disk full"}, {"msg": "Disk ok"}, {"msg": "net down"}]
+    index = log_viewer._search_index_cached(rows, rows, ["msg"])
+    assert log_viewer._search_index_cached(list(rows), [dict(r) for r in rows], ["msg"]) is index
+    info = log_viewer._search_cache.info()
+    assert (info["entries"], info["hits"], info["bytes"]) == (1, 1, index.nbytes)
+
+
+def test_encoded_tables_are_cached_by_frame_content(monkeypatch):
+    import pandas as pd
+
+    monkeypatch.setattr(log_viewer, "_encoded_cache", log_viewer._PayloadCache(log_viewer.ENCODED_CACHE_MAX_BYTES))
+    df = pd.DataFrame({"msg": ["a", "b"]})
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"short": df.to_dict("records")}
+
+    raw = log_viewer._encode_tables_cached(build, [df], "records")
+    assert log_viewer._encode_tables_cached(build, [df.copy()], "records") is raw
+    assert len(calls) == 1
+    assert log_viewer._encoded_cache.info()["bytes"] == len(raw)
+
+
+def _render(monkeypatch, last=None, **kw):
+    import streamlit
+
+    monkeypatch.setattr(streamlit, "session_state", {"lv": last} if last is not None else {})
+    log_viewer.log_viewer(key="lv", search_index=True, **kw)
+    return streamlit.LAST["log_viewer"]
+
+
+SHORT = [
+    {"Level": "INFO", "Msg": "disk full"},
+    {"Level": "ERROR", "Msg": "net down"},
+    {"Level": "ERROR", "Msg": "Disk gone"},
+]
+DETAIL = [{"Trace": "a"}, {"Trace": "b"}, {"Trace": "c"}]
+
+
+def test_search_result_rows_for_query_and_filter(monkeypatch):
+    assert _render(monkeypatch, dict_log_short=SHORT, dict_log_detail=DETAIL)["search_result"] is None
+
+    sent = _render(monkeypatch, {"query": "DISK"}, dict_log_short=SHORT, dict_log_detail=DETAIL)
+    assert sent["search_index"] is True
+    assert sent["search_result"] == {"query": "DISK", "filters": {}, "rows": [0, 2]}
+
+    last = {"query": "", "active_filters": {"Level": ["ERROR"]}}
+    assert _render(monkeypatch, last, dict_log_short=SHORT, dict_log_detail=DETAIL)["search_result"]["rows"] == [1, 2]
+
+    last = {"query": "disk", "active_filters": {"Level": ["ERROR"]}}
+    assert _render(monkeypatch, last, dict_log_short=SHORT, dict_log_detail=DETAIL)["search_result"]["rows"] == [2]
+
+    # shared rows: only short_columns are searched, like the frontend's short view
+    rows = [dict(s, **d) for s, d in zip(SHORT, DETAIL)]
+    sent = _render(monkeypatch, {"query": "b"}, log_rows=rows, short_columns=["Level", "Msg"])
+    assert sent["search_result"]["rows"] == []
@@ -0,0 +1,30 @@
+"""
+log_viewer tests
+
+python -m pytest test01/frontend/custom/log-viewer
+"""
+
+import os
+
+import log_viewer
+
+
+def test_tail_restarts_after_copytruncate_that_grows_past_offset(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"one\ntwo\n")
+    state = log_viewer._TailState("path:" + str(path))
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["one", "two"]
+    session = state.session
+
+    with open(path, "r+b") as f:  # copytruncate: same inode, new content longer than the old
+        f.truncate(0)
+        f.write(b"rotated first line\nrotated second line\n")
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["rotated first line", "rotated second line"]
+    assert state.session != session  # new session: the frontend drops its buffer
+
+    with open(path, "ab") as f:
+        f.write(b"appended\n")
+    session = state.session
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["appended"]
+    assert state.session == session
+    assert state.offset == os.path.getsize(path)
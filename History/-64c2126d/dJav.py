@@ -0,0 +1,44 @@
+"""
+log_viewer tests
+
+python -m pytest test01/frontend/custom/log-viewer
+"""
+
+import os
+
+import log_viewer
+
+
+def test_tail_restarts_after_copytruncate_that_grows_past_offset(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_bytes(b"one\ntwo\n")
+    state = log_viewer._TailState("path:" + str(path))
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["one", "two"]
+    session = state.session
+
+    with open(path, "r+b") as f:  # copytruncate: same inode, new content longer than the old
+        f.truncate(0)
+        f.write(b"rotated first line\nrotated second line\n")
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["rotated first line", "rotated second line"]
+    assert state.session != session  # new session: the frontend drops its buffer
+
+    with open(path, "ab") as f:
+        f.write(b"appended\n")
+    session = state.session
+    assert log_viewer._tail_read_file(state, str(path), "utf-8") == ["appended"]
+    assert state.session == session
+    assert state.offset == os.path.getsize(path)
+
+
+def test_jump_index_is_cached_by_frame_content():
+    import pandas as pd
+
+    log_viewer._jump_cache.clear()
+    df = pd.DataFrame({"level": ["INFO", "ERROR", "WARN", "error"]})
+    specs = log_viewer._jump_specs(None, True, "level", {})
+    values = {"level": df["level"].tolist()}
+    first = log_viewer._jump_index_cached(df, values, len(df), specs)
+    assert first == {"__error": [1, 3], "__warn": [2]}
+    assert log_viewer._jump_index_cached(df.copy(), values, len(df), specs) is first
+    info = log_viewer._jump_cache.info()
+    assert (info["entries"], info["hits"]) == (1, 1) and info["bytes"] > 0
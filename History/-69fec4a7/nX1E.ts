@@ -0,0 +1,59 @@
+import type { Args } from "./types"
+
+// Panels kept across renders so Python can send { ref: hash } instead of the data
+const STORE_LIMIT = 64
+
+export type DeltaStore = Map<string, unknown>
+
+const isRef = (v: unknown): v is { ref: string } =>
+  !!v && typeof v === "object" && typeof (v as any).ref === "string"
+
+function getPath(obj: any, path: string[]): unknown {
+  return path.reduce((cur, k) => (cur == null ? cur : cur[k]), obj)
+}
+
+function setPath(obj: any, path: string[], value: unknown) {
+  let cur = obj
+  for (let i = 0; i < path.length - 1; i++) {
+    if (cur == null) return
+    cur = cur[path[i]]
+  }
+  if (cur != null) cur[path[path.length - 1]] = value
+}
+
+// Merge a delta payload into the store. Returns args with every ref resolved
+// plus the hashes that could not be resolved (-> ask Python to resync).
+export function applyDelta(
+  a: Args,
+  store: DeltaStore
+): { args: Args; missing: string[] } {
+  const hashes = a.delta_hashes
+  if (!hashes) return { args: a, missing: [] }
+  const out: any = {
+    ...a,
+    report_cache: a.report_cache?.map((e) => (e ? { ...e } : e)),
+  }
+  const missing: string[] = []
+  for (const [key, hash] of Object.entries(hashes)) {
+    const path = key.split(".")
+    const value = getPath(out, path)
+    if (isRef(value)) {
+      if (store.has(hash)) {
+        const held = store.get(hash)
+        store.delete(hash)
+        store.set(hash, held)
+        setPath(out, path, held)
+      } else {
+        missing.push(hash)
+        setPath(out, path, null)
+      }
+    } else {
+      store.delete(hash)
+      store.set(hash, value)
+    }
+  }
+  while (store.size > STORE_LIMIT) {
+    store.delete(store.keys().next().value as string)
+  }
+  return { args: out as Args, missing }
+}
@@ -0,0 +1,79 @@
+"""
+Redis 게이트 저장소 테스트 (fakeredis — 개발 의존성, 없으면 실패: pip install "fakeredis[lua]")
+
+python -m pytest backend/test_gate_store_redis.py
+"""
+
+import asyncio
+import time
+
+import fakeredis
+import pytest
+
+from backend.gate_store import NearCacheRedisGateStore, RedisGateStore
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _wait(cond, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not cond():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_redis_store_set_and_check():
+    store = RedisGateStore(fakeredis.FakeRedis())
+    assert not store.is_ready("u")
+    store.set_ready("u", 10)
+    assert store.is_ready("u")
+    assert store.stats()["live"] == 1
+
+
+def test_near_cache_answers_locally_and_is_invalidated_by_set_ready():
+    server = fakeredis.FakeServer()
+    clock = Clock()
+    a = NearCacheRedisGateStore(fakeredis.FakeRedis(server=server), negative_ttl_sec=60, clock=clock)
+    b = NearCacheRedisGateStore(fakeredis.FakeRedis(server=server), clock=clock)
+    try:
+        _wait(lambda: a.stats()["near_live"] and b.stats()["near_live"])
+        assert not a.is_ready("u") and not a.is_ready("u")  # 닫힘도 캐시
+        assert (a.hits, a.misses) == (1, 1)
+
+        b.set_ready("u", 600)  # 다른 워커가 열면 pub/sub 로 a 의 negative 항목이 지워짐
+        _wait(lambda: a.invalidations >= 1)
+        assert a.is_ready("u") and a.is_ready("u")
+        assert (a.hits, a.misses) == (2, 2)
+
+        clock.now += 601  # 로컬 만료가 지나면 다시 Redis 에 물어봄
+        a.is_ready("u")
+        assert a.misses == 3
+    finally:
+        a.close()
+        b.close()
+
+
+@pytest.mark.parametrize("cls", [RedisGateStore, NearCacheRedisGateStore])
+def test_sync_store_refuses_event_loop_thread(cls):
+    store = cls(fakeredis.FakeRedis())
+
+    async def main():
+        with pytest.raises(RuntimeError, match="동기 전용"):
+            store.is_ready("u")
+        with pytest.raises(RuntimeError, match="동기 전용"):
+            store.set_ready("u", 10)
+        # 스레드풀에서는 그대로 동작
+        await asyncio.to_thread(store.set_ready, "u", 10)
+        return await asyncio.to_thread(store.is_ready, "u")
+
+    try:
+        assert asyncio.run(main())
+    finally:
+        if hasattr(store, "close"):
+            store.close()
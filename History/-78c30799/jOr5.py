@@ -0,0 +1,27 @@
+"""
+table_viewer tests
+
+python -m pytest test01/frontend/custom/table-viewer
+"""
+
+import table_viewer
+
+
+def test_nearest_index_is_cached_for_list_input(monkeypatch):
+    monkeypatch.setattr(table_viewer, "_nearest_cache", table_viewer._PayloadCache(table_viewer.NEAREST_CACHE_MAX_BYTES))
+    rows = [{"ts": f"2025-01-01T00:00:{i:02d}", "v": i} for i in range(30)]
+    first = table_viewer._resolve_highlight_rows(rows, "ts", "2025-01-01T00:00:10", 1)
+    assert first == [{"row": 10, "ref": 0, "rank": 0, "offset_ms": 0.0}]
+    info = table_viewer._nearest_cache.info()
+    assert (info["entries"], info["misses"]) == (1, 1) and info["bytes"] > 0
+    again = table_viewer._resolve_highlight_rows(rows, "ts", "2025-01-01T00:00:20", 1)
+    assert again[0]["row"] == 20
+    info = table_viewer._nearest_cache.info()
+    assert (info["entries"], info["hits"]) == (1, 1)  # parsed once, reused
+
+
+def test_unhashable_cells_skip_the_cache(monkeypatch):
+    monkeypatch.setattr(table_viewer, "_nearest_cache", table_viewer._PayloadCache(table_viewer.NEAREST_CACHE_MAX_BYTES))
+    rows = [{"ts": {"nested": i}} for i in range(3)]
+    assert table_viewer._resolve_highlight_rows(rows, "ts", 0, 1) == []
+    assert table_viewer._nearest_cache.info()["entries"] == 0
@@ -0,0 +1,27 @@
+"""
+table_viewer tests
+
+python -m pytest test01/frontend/custom/table-viewer
+"""
+
+import table_viewer
+
+
+def test_nearest_index_is_cached_for_list_input():
+    table_viewer._nearest_cache.clear()
+    rows = [{"ts": f"2025-01-01T00:00:{i:02d}", "v": i} for i in range(30)]
+    first = table_viewer._resolve_highlight_rows(rows, "ts", "2025-01-01T00:00:10", 1)
+    assert first == [{"row": 10, "ref": 0, "rank": 0, "offset_ms": 0.0}]
+    assert len(table_viewer._nearest_cache) == 1
+    (key,) = table_viewer._nearest_cache
+    index = table_viewer._nearest_cache[key]
+    again = table_viewer._resolve_highlight_rows(rows, "ts", "2025-01-01T00:00:20", 1)
+    assert again[0]["row"] == 20
+    assert table_viewer._nearest_cache[key] is index  # parsed once, reused
+
+
+def test_unhashable_cells_skip_the_cache():
+    table_viewer._nearest_cache.clear()
+    rows = [{"ts": {"nested": i}} for i in range(3)]
+    assert table_viewer._resolve_highlight_rows(rows, "ts", 0, 1) == []
+    assert len(table_viewer._nearest_cache) == 0
@@ -0,0 +1,174 @@
+"""
+레이트리밋 (GCRA, 키당 float 하나)
+
+예전 방식(_request_qs deque + 키별 asyncio.Lock + _ban_until) 대체
+- 키 상태 = TAT(theoretical arrival time) float 하나 → O(1) 메모리/시간
+- 판정과 갱신 사이에 await 가 없어 이벤트 루프 하나에선 락 불필요
+- 차단(ban)은 예전 _ban_until 처럼 만료 시각을 따로 둠 (차단 중엔 연장 X)
+  → 풀리면 TAT 를 비운 상태로 시작 (새 창에서 burst 개 다시 허용)
+- 유휴 키 정리: 두 세대 dict. 세대 주기가 상태의 최대 수명보다 길어서
+  한 주기 동안 안 쓰인 키는 이미 TAT <= now (새 키와 같음) → 통째로 버려도 손실 없음
+  차단 dict 는 세대 교체 때 풀린 항목만 정리 (차단된 키 수만큼만 남음)
+- 라우트별 규칙: 정확한 경로 > 접두사(먼저 등록한 순) > default
+
+규칙: period_sec 동안 limit 회 (연속 burst 회까지 허용, 기본 limit).
+초과하면 ban_sec 동안 거부 (0 이면 다음 배출 시점까지만).
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass(frozen=True)
+class RateRule:
+    limit: int
+    period_sec: float
+    ban_sec: float = 0.0
+    burst: Optional[int] = None
+
+    @property
+    def interval(self) -> float:
+        """요청 1개당 배출 간격 T"""
+        return self.period_sec / self.limit
+
+    @property
+    def tolerance(self) -> float:
+        """허용 오차 tau = T * (burst - 1) → 빈 상태에서 burst 개 연속 통과"""
+        return self.interval * ((self.burst or self.limit) - 1)
+
+    @property
+    def horizon(self) -> float:
+        """TAT - now 의 최댓값 (이 시간 지나면 상태가 새 키와 같아짐)"""
+        return self.tolerance + self.interval
+
+
+@dataclass
+class _RuleState:
+    rule: RateRule
+    cur: Dict[str, float] = field(default_factory=dict)
+    old: Dict[str, float] = field(default_factory=dict)
+    banned: Dict[str, float] = field(default_factory=dict)  # key -> 차단 만료 시각
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        default: Optional[RateRule] = None,
+        routes: Optional[Dict[str, RateRule]] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._exact: Dict[str, _RuleState] = {}
+        self._prefix: List[Tuple[str, _RuleState]] = []
+        self._default = _RuleState(default) if default else None
+        for path, rule in (routes or {}).items():
+            st = _RuleState(rule)
+            if path.endswith("*"):
+                self._prefix.append((path[:-1], st))
+            else:
+                self._exact[path] = st
+        states = self._states()
+        # 세대 주기 = 모든 규칙의 최대 상태 수명 (최소 1초)
+        self._period = max([1.0] + [st.rule.horizon for st in states])
+        self._next_rotate = clock() + self._period
+        self.allowed = 0
+        self.denied = 0
+
+    def _states(self) -> List[_RuleState]:
+        out = list(self._exact.values()) + [st for _, st in self._prefix]
+        if self._default:
+            out.append(self._default)
+        return out
+
+    def rule_for(self, path: str) -> Optional[_RuleState]:
+        st = self._exact.get(path)
+        if st is not None:
+            return st
+        for prefix, pst in self._prefix:
+            if path.startswith(prefix):
+                return pst
+        return self._default
+
+    def _rotate(self, now: float) -> None:
+        for st in self._states():
+            st.old, st.cur = st.cur, {}
+            if st.banned:
+                st.banned = {k: until for k, until in st.banned.items() if until > now}
+        self._next_rotate = now + self._period
+
+    def hit(self, st: _RuleState, key: str) -> float:
+        """요청 1회 기록. 통과면 0.0, 거부면 retry_after(초)"""
+        now = self._clock()
+        if now >= self._next_rotate:
+            self._rotate(now)
+        cur = st.cur
+        rule = st.rule
+        if st.banned:
+            until = st.banned.get(key)
+            if until is not None:
+                if until > now:
+                    # 차단 중 → 연장하지 않음 (예전 _ban_until 과 같음)
+                    self.denied += 1
+                    return until - now
+                del st.banned[key]  # 풀림 → 아래에서 빈 TAT 로 시작
+        tat = cur.get(key)
+        if tat is None:
+            tat = st.old.pop(key, now)  # 이전 세대에서 승격
+        if tat < now:
+            tat = now
+        wait = tat - rule.tolerance - now
+        if wait > 0:
+            self.denied += 1
+            if rule.ban_sec > 0:
+                # 차단 시작: TAT 는 버림 → 풀리는 시점엔 새 키와 같음
+                st.banned[key] = now + rule.ban_sec
+                cur.pop(key, None)
+                return rule.ban_sec
+            return wait
+        cur[key] = tat + rule.interval
+        self.allowed += 1
+        return 0.0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "keys": sum(len(st.cur) + len(st.old) for st in self._states()),
+            "banned": sum(len(st.banned) for st in self._states()),
+            "allowed": self.allowed,
+            "denied": self.denied,
+        }
+
+
+def _key_of(request: Request) -> str:
+    # 스트림릿에서 붙이는 사용자 식별 헤더가 있으면 최우선 사용
+    uid = request.headers.get("X-User-ID")
+    if uid:
+        return f"user:{uid}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def rate_limit_middleware(limiter: RateLimiter, key_func: Callable[[Request], str] = _key_of):
+    """app.middleware("http")(rate_limit_middleware(limiter)) 로 등록"""
+
+    async def middleware(request: Request, call_next):
+        if request.method != "OPTIONS":  # CORS preflight 는 세지 않음
+            st = limiter.rule_for(request.url.path)
+            if st is not None:
+                retry_after = limiter.hit(st, key_func(request))
+                if retry_after > 0:
+                    rule = st.rule
+                    return JSONResponse(
+                        {"detail": f"Too many requests. Limit={rule.limit} per {rule.period_sec:g}s."},
+                        status_code=429,
+                        headers={"Retry-After": str(math.ceil(retry_after))},
+                    )
+        return await call_next(request)
+
+    return middleware
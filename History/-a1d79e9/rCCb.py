@@ -0,0 +1,91 @@
+"""
+gate_store 테스트
+
+python -m pytest backend/test_gate_store.py
+"""
+
+import multiprocessing as mp
+import os
+
+import pytest
+
+from backend.gate_store import MemoryGateStore, SharedMemoryGateStore, fcntl
+
+shm_only = pytest.mark.skipif(fcntl is None, reason="shm 백엔드는 POSIX 전용")
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_memory_store_expiry():
+    clock = Clock()
+    g = MemoryGateStore(60, clock=clock)
+    g.set_ready("u", 10)
+    assert g.is_ready("u")
+    clock.now += 10
+    assert not g.is_ready("u")
+    clock.now += 1  # 지나간 tick 슬롯은 통째로 정리
+    assert g.stats()["live"] == 0
+
+
+@shm_only
+def test_shm_store_shared_between_instances(tmp_path):
+    clock = Clock()
+    path = str(tmp_path / "g.gate")
+    a = SharedMemoryGateStore(path=path, slots=64, clock=clock)
+    b = SharedMemoryGateStore(path=path, slots=1024, clock=clock)  # 먼저 만든 쪽 크기를 따름
+    assert b.slots == 64
+    a.set_ready("u", 10)
+    assert b.is_ready("u") and not b.is_ready("v")
+    clock.now += 10
+    assert not b.is_ready("u")
+    b.set_ready("v", 10)  # 만료된 슬롯 재사용 가능
+    assert a.is_ready("v")
+    a.close()
+    b.close()
+
+
+def _flip(path: str, rounds: int) -> None:
+    g = SharedMemoryGateStore(path=path)
+    for n in range(rounds):
+        h = 1 + (n & 1)
+        with g._lock:
+            fcntl.flock(g._fd, fcntl.LOCK_EX)  # _write 는 flock 안에서만
+            try:
+                g._write(0, h, float(h))
+            finally:
+                fcntl.flock(g._fd, fcntl.LOCK_UN)
+
+
+@shm_only
+def test_shm_reader_never_pairs_hash_with_other_expiry(tmp_path):
+    path = str(tmp_path / "race.gate")
+    g = SharedMemoryGateStore(path=path, slots=16)
+    writer = mp.get_context("fork").Process(target=_flip, args=(path, 200_000))
+    writer.start()
+    torn = 0
+    while writer.is_alive():
+        for _ in range(1000):
+            h, exp = g._read(0)
+            if h and exp != float(h):
+                torn += 1
+    writer.join()
+    g.close()
+    os.remove(path)
+    assert torn == 0
+
+
+@shm_only
+def test_shm_recovers_slot_left_mid_write(tmp_path):
+    g = SharedMemoryGateStore(path=str(tmp_path / "dead.gate"), slots=16)
+    g.set_ready("u", 10)
+    i = next(i for i in range(g.slots) if g._words[3 * i + 1])
+    g._words[3 * i] |= 1  # 쓰던 프로세스가 죽은 상태
+    assert g.is_ready("u")
+    assert g._words[3 * i] & 1 == 0
+    g.close()
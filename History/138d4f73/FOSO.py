@@ -0,0 +1,76 @@
+"""
+Benchmark: table_viewer payload conversion (per-column converters vs per-cell _convert_value)
+
+python bench_convert.py            # 200k rows
+python bench_convert.py 50000 3    # rows, repeats
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from table_viewer import _convert_value, _prepare_table_payload
+
+
+def per_cell(df: pd.DataFrame):
+    """Previous implementation: to_dict(records) + _convert_value on every cell."""
+    columns = df.columns.tolist()
+    records = df.to_dict(orient="records")
+    return columns, [{c: _convert_value(r.get(c)) for c in columns} for r in records]
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    """One column per dtype family the converters special-case."""
+    rng = np.random.default_rng(0)
+    ts = pd.Timestamp("2025-01-01") + pd.to_timedelta(np.arange(rows) * 250, unit="ms")
+    val = rng.normal(size=rows)
+    val[rng.random(rows) < 0.05] = np.nan
+    return pd.DataFrame(
+        {
+            "int64": np.arange(rows, dtype="int64"),
+            "float": val,
+            "bool": rng.random(rows) < 0.5,
+            "datetime": ts,
+            "category": pd.Categorical(rng.choice(["INFO", "WARN", "ERROR"], size=rows)),
+            "bytes": pd.Series([f"b{i % 100}".encode() for i in range(rows)], dtype=object),
+            "object": pd.Series([f"row {i}" for i in range(rows)], dtype=object),
+        }
+    )
+
+
+def _best(fn, df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(df)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    df = make_frame(rows)
+
+    def fast(frame: pd.DataFrame):
+        return _prepare_table_payload(frame, None)
+
+    assert fast(df) == per_cell(df)
+
+    a = _best(per_cell, df, repeat)
+    b = _best(fast, df, repeat)
+    print(f"rows={rows:,} cols={df.shape[1]} (best of {repeat})")
+    print(f"  per-cell   : {a * 1000:9.1f} ms")
+    print(f"  per-column : {b * 1000:9.1f} ms  (x{a / b:.1f})")
+
+    for col in df.columns:
+        one = df[[col]]
+        a = _best(per_cell, one, repeat)
+        b = _best(fast, one, repeat)
+        print(f"  {col:<9} {str(df[col].dtype):<15} {a * 1000:8.1f} -> {b * 1000:7.1f} ms  (x{a / b:.1f})")
+
+
+if __name__ == "__main__":
+    main()
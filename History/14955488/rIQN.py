@@ -0,0 +1,140 @@
+"""
+rate_limit 테스트 (주입한 시계로)
+
+python -m pytest backend/test_rate_limit.py
+"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from backend.rate_limit import RateLimiter, RateRule  # noqa: E402
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limiter(clock: Clock, **routes: RateRule) -> RateLimiter:
+    return RateLimiter(RateRule(10, 10.0, ban_sec=10.0), routes or None, clock=clock)
+
+
+def test_ban_starts_on_first_excess_request():
+    clock = Clock()
+    lim = _limiter(clock)
+    st = lim.rule_for("/save")
+    assert [lim.hit(st, "u") for _ in range(10)] == [0.0] * 10
+    assert lim.hit(st, "u") == 10.0
+    assert lim.stats()["banned"] == 1
+
+
+def test_hits_during_ban_do_not_extend_it():
+    clock = Clock()
+    lim = _limiter(clock)
+    st = lim.rule_for("/save")
+    for _ in range(11):
+        lim.hit(st, "u")
+    clock.now = 9.5
+    assert lim.hit(st, "u") == pytest.approx(0.5)
+    clock.now = 9.9
+    assert lim.hit(st, "u") == pytest.approx(0.1)
+
+
+def test_first_window_after_ban_is_fresh():
+    clock = Clock()
+    lim = _limiter(clock)
+    st = lim.rule_for("/save")
+    for _ in range(11):
+        lim.hit(st, "u")
+    clock.now = 9.5
+    lim.hit(st, "u")
+    clock.now = 10.0
+    assert [lim.hit(st, "u") for _ in range(10)] == [0.0] * 10
+    assert lim.hit(st, "u") == 10.0  # 새 창을 다 쓰면 다시 차단
+
+
+def test_keys_are_independent():
+    clock = Clock()
+    lim = _limiter(clock)
+    st = lim.rule_for("/save")
+    for _ in range(11):
+        lim.hit(st, "a")
+    assert lim.hit(st, "b") == 0.0
+
+
+def test_without_ban_waits_one_interval():
+    clock = Clock()
+    lim = RateLimiter(RateRule(2, 1.0), clock=clock)
+    st = lim.rule_for("/")
+    assert lim.hit(st, "u") == 0.0 and lim.hit(st, "u") == 0.0
+    assert lim.hit(st, "u") == pytest.approx(0.5)
+    clock.now = 0.5
+    assert lim.hit(st, "u") == 0.0
+
+
+def test_route_rules():
+    clock = Clock()
+    lim = _limiter(clock, **{"/save": RateRule(2, 1.0)})
+    lim2 = RateLimiter(routes={"/api/*": RateRule(5, 5.0)}, clock=clock)
+    assert lim.rule_for("/save").rule.limit == 2
+    assert lim.rule_for("/other").rule.limit == 10
+    assert lim2.rule_for("/api/v1/x").rule.limit == 5
+    assert lim2.rule_for("/health") is None
+
+
+def test_idle_keys_and_expired_bans_are_dropped():
+    clock = Clock()
+    lim = _limiter(clock)
+    st = lim.rule_for("/")
+    for _ in range(11):
+        lim.hit(st, "banned")
+    lim.hit(st, "idle")
+    clock.now = 100.0
+    lim.hit(st, "live")
+    clock.now = 200.0
+    lim.hit(st, "live")
+    assert lim.stats()["keys"] == 1
+    assert lim.stats()["banned"] == 0
+
+
+BODY = {"checked": ["a"], "order": ["a"], "ts": 1}
+
+
+def test_main_rule_through_middleware_at_two_per_second():
+    """main.py 의 규칙 그대로: 연속 10회 + 초당 1회 → 2회/초면 19회 통과, 20회째에 10초 차단"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from backend import main
+    from backend.rate_limit import rate_limit_middleware
+
+    clock = Clock()
+    app = FastAPI()
+    app.middleware("http")(rate_limit_middleware(RateLimiter(main.RATE_RULE, clock=clock)))
+    app.post("/save")(main.save)
+    client = TestClient(app)
+    codes = []
+    for _ in range(21):
+        codes.append(client.post("/save", json=BODY, headers={"X-User-ID": "u"}))
+        clock.now += 0.5
+    assert [r.status_code for r in codes] == [200] * 19 + [429, 429]
+    assert codes[19].headers["retry-after"] == str(int(main.BAN_SEC))
+
+
+def test_rate_limit_is_off_by_default(load_app):
+    client = load_app()
+    assert all(client.post("/save", json=BODY).status_code == 200 for _ in range(30))
+
+
+def test_429_keeps_cors_headers(load_app):
+    client = load_app(RATE_LIMIT_ENABLED="1")
+    headers = {"X-User-ID": "cors-test", "Origin": "http://localhost:8501"}
+    codes = [client.post("/save", json=BODY, headers=headers) for _ in range(11)]
+    last = codes[-1]
+    assert last.status_code == 429
+    assert last.headers["retry-after"] == "10"
+    assert last.headers["access-control-allow-origin"] == "http://localhost:8501"
@@ -0,0 +1,40 @@
+import type { Args, ColumnarColumn, ReportCacheEntry, TableData } from "./types"
+
+// Expand one column: plain list or dictionary-encoded { dict, codes }
+export function decodeColumn(col: ColumnarColumn | undefined): any[] {
+  if (!col) return []
+  if (Array.isArray(col)) return col
+  const dict = col.dict || []
+  return (col.codes || []).map((c) => (c < 0 ? null : dict[c]))
+}
+
+// Columnar payload -> { records, columns } (records payloads pass through)
+export function decodeTable(t: TableData): TableData {
+  if (!t || Array.isArray(t.records) || !t.data) return t
+  const columns = t.columns || Object.keys(t.data)
+  const cols = columns.map((c) => decodeColumn(t.data![c]))
+  const length =
+    typeof t.length === "number" ? t.length : cols.length ? cols[0].length : 0
+  const records = new Array(length)
+  for (let i = 0; i < length; i++) {
+    const row: Record<string, unknown> = {}
+    for (let j = 0; j < columns.length; j++) row[columns[j]] = cols[j][i]
+    records[i] = row
+  }
+  return { records, columns }
+}
+
+function decodeCacheEntry(e: ReportCacheEntry): ReportCacheEntry {
+  if (!e) return e
+  return { ...e, short: decodeTable(e.short), detail: decodeTable(e.detail) }
+}
+
+export function decodeArgs(a: Args): Args {
+  return {
+    ...a,
+    report_list: decodeTable(a.report_list),
+    error_log_short: decodeTable(a.error_log_short),
+    error_log_detail: decodeTable(a.error_log_detail),
+    report_cache: a.report_cache?.map(decodeCacheEntry),
+  }
+}
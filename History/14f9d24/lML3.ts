@@ -0,0 +1,71 @@
+import { ArrowTable } from "streamlit-component-lib"
+import type { Args, ColumnarColumn, ReportCacheEntry, TableData } from "./types"
+
+// Expand one column: plain list or dictionary-encoded { dict, codes }
+export function decodeColumn(col: ColumnarColumn | undefined): any[] {
+  if (!col) return []
+  if (Array.isArray(col)) return col
+  const dict = col.dict || []
+  return (col.codes || []).map((c) => (c < 0 ? null : dict[c]))
+}
+
+const plain = (v: unknown) =>
+  v == null ? null : typeof v === "bigint" ? Number(v) : v
+
+// Arrow table (wire_format="arrow") -> { records, columns }
+export function arrowToTable(t: ArrowTable): TableData {
+  const hr = t.headerRows
+  const hc = t.headerColumns
+  const columns: string[] = []
+  for (let c = hc; c < t.columns; c++) {
+    columns.push(String(t.getCell(hr - 1, c).content))
+  }
+  const records = new Array(t.dataRows)
+  for (let r = 0; r < t.dataRows; r++) {
+    const row: Record<string, unknown> = {}
+    for (let j = 0; j < columns.length; j++) {
+      row[columns[j]] = plain(t.getCell(hr + r, hc + j).content)
+    }
+    records[r] = row
+  }
+  return { records, columns }
+}
+
+// Any wire format -> { records, columns } (records payloads pass through)
+export function decodeTable(t: TableData, args?: Record<string, any>): TableData {
+  if (t && typeof t.arrow === "string") {
+    const table = args?.[t.arrow]
+    return table instanceof ArrowTable ? arrowToTable(table) : null
+  }
+  if (!t || Array.isArray(t.records) || !t.data) return t
+  const columns = t.columns || Object.keys(t.data)
+  const cols = columns.map((c) => decodeColumn(t.data![c]))
+  const length =
+    typeof t.length === "number" ? t.length : cols.length ? cols[0].length : 0
+  const records = new Array(length)
+  for (let i = 0; i < length; i++) {
+    const row: Record<string, unknown> = {}
+    for (let j = 0; j < columns.length; j++) row[columns[j]] = cols[j][i]
+    records[i] = row
+  }
+  return { records, columns }
+}
+
+function decodeCacheEntry(e: ReportCacheEntry, args: Args): ReportCacheEntry {
+  if (!e) return e
+  return {
+    ...e,
+    short: decodeTable(e.short, args),
+    detail: decodeTable(e.detail, args),
+  }
+}
+
+export function decodeArgs(a: Args): Args {
+  return {
+    ...a,
+    report_list: decodeTable(a.report_list, a),
+    error_log_short: decodeTable(a.error_log_short, a),
+    error_log_detail: decodeTable(a.error_log_detail, a),
+    report_cache: a.report_cache?.map((e) => decodeCacheEntry(e, a)),
+  }
+}
@@ -0,0 +1,601 @@
+﻿import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import streamlit.components.v1 as components
+from viewer_common import (
+    PayloadCache as _PayloadCache,
+    deep_sizeof,
+    encode_column as _encode_column,
+    frame_fingerprint as _frame_fingerprint,
+    json_dumps,
+)
+
+try:
+    import pandas as pd  # type: ignore
+except ImportError:  # pragma: no cover
+    pd = None  # type: ignore[assignment]
+
+_RELEASE = False
+
+if not _RELEASE:
+    _component_func = components.declare_component(
+        "table_viewer",
+        url="http://localhost:3001",
+    )
+else:
+    parent_dir = os.path.dirname(os.path.abspath(__file__))
+    build_dir = os.path.join(parent_dir, "frontend/build")
+    _component_func = components.declare_component("table_viewer", path=build_dir)
+
+
+def _convert_value(value: Any) -> Any:
+    """Convert values so they can be safely JSON-serialized by Streamlit."""
+    if value is None:
+        return None
+
+    if isinstance(value, float) and math.isnan(value):
+        return None
+
+    if isinstance(value, (str, int, float, bool)):
+        return value
+
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="ignore")
+
+    if getattr(value, "__float__", None) is not None:
+        try:
+            numeric = float(value)
+            if math.isnan(numeric):
+                return None
+            return numeric
+        except Exception:  # pragma: no cover - fallback guard
+            pass
+
+    if hasattr(value, "item"):
+        try:
+            item = value.item()
+            return _convert_value(item)
+        except Exception:  # pragma: no cover - fallback guard
+            pass
+
+    if hasattr(value, "isoformat"):
+        try:
+            return value.isoformat()
+        except Exception:  # pragma: no cover - fallback guard
+            pass
+
+    if isinstance(value, Mapping):
+        return {str(key): _convert_value(val) for key, val in value.items()}
+
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+        return [_convert_value(v) for v in value]
+
+    return str(value)
+
+
+_PLAIN_TYPES = (str, int, float, bool)
+
+
+_TICKS_PER_SECOND = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+
+def _datetime_column(series: Any) -> List[Any]:
+    """ISO strings for a naive datetime64 column, same text as Timestamp.isoformat().
+
+    Works in the column's own unit; a cast to datetime64[ns] would wrap dates
+    outside 1677-2262 without raising.
+    """
+    import numpy as np
+
+    values = series.to_numpy()
+    unit = np.datetime_data(values.dtype)[0]
+    if unit not in _TICKS_PER_SECOND:  # D, h, m: whole seconds
+        values, unit = values.astype("datetime64[s]"), "s"
+    missing = np.isnat(values)
+    fraction = values.view("i8") % _TICKS_PER_SECOND[unit]
+    result = np.datetime_as_string(values, unit="s").astype(object)
+    has_ns = (fraction % 1000) != 0 if unit == "ns" else np.zeros(len(values), dtype=bool)
+    has_us = (fraction != 0) & ~has_ns
+    if has_us.any():
+        result[has_us] = np.datetime_as_string(values[has_us], unit="us")
+    if has_ns.any():
+        result[has_ns] = np.datetime_as_string(values[has_ns], unit="ns")
+    result[missing] = "NaT"
+    return result.tolist()
+
+
+def _generic_column(series: Any) -> List[Any]:
+    """Per-cell path: plain Python values pass through, everything else via _convert_value."""
+    values = series.tolist()
+    missing = series.isna().to_numpy()
+    for index, value in enumerate(values):
+        if missing[index]:
+            values[index] = "NaT" if value is pd.NaT else None
+        elif type(value) not in _PLAIN_TYPES:
+            values[index] = _convert_value(value)
+    return values
+
+
+def _convert_column(series: Any) -> List[Any]:
+    """Convert one DataFrame column with a converter picked once from its dtype.
+
+    Produces the same values as _convert_value applied to every cell.
+    """
+    import numpy as np
+
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = _convert_column(pd.Series(dtype.categories))
+        lookup = np.array(categories + [None], dtype=object)
+        return lookup[series.cat.codes.to_numpy()].tolist()  # code -1 -> None
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return series.to_numpy().tolist()
+        if dtype.kind == "f":
+            array = series.to_numpy()
+            values = array.astype("float64").tolist()
+            for index in np.flatnonzero(np.isnan(array)).tolist():
+                values[index] = None
+            return values
+        if dtype.kind == "M":
+            return _datetime_column(series)
+        if dtype.kind == "O" and pd.api.types.infer_dtype(series, skipna=True) == "bytes":
+            return [
+                None if value is None else value.decode("utf-8", errors="ignore")
+                for value in series.where(series.notna(), None).tolist()
+            ]
+    return _generic_column(series)
+
+
+def _prepare_table_payload(
+    data: Any, columns: Optional[Sequence[str]]
+) -> tuple[List[str], List[Dict[str, Any]]]:
+    if data is None:
+        return list(columns or []), []
+
+    if pd is not None and isinstance(data, pd.DataFrame):
+        resolved_columns = list(columns) if columns else data.columns.tolist()
+        filtered_columns = [column for column in resolved_columns if column in data.columns]
+        if columns and len(filtered_columns) != len(resolved_columns):
+            resolved_columns = filtered_columns
+        dataframe = data.loc[:, resolved_columns] if resolved_columns else data
+        if not resolved_columns:
+            return resolved_columns, [{} for _ in range(len(dataframe))]
+        values = [_convert_column(dataframe.iloc[:, i]) for i in range(len(resolved_columns))]
+        rows: List[Dict[str, Any]] = [dict(zip(resolved_columns, row)) for row in zip(*values)]
+        return resolved_columns, rows
+
+    if isinstance(data, Sequence) and not isinstance(data, (str, bytes, bytearray)):
+        rows = []
+        for entry in data:
+            if isinstance(entry, Mapping):
+                row = {key: _convert_value(value) for key, value in entry.items()}
+                rows.append(row)
+        resolved_columns = list(columns) if columns else []
+        if not resolved_columns:
+            seen: List[str] = []
+            for row in rows:
+                for key in row:
+                    if key not in seen:
+                        seen.append(key)
+            resolved_columns = seen
+        return resolved_columns, rows
+
+    raise TypeError("table_viewer expects a pandas DataFrame or a sequence of mappings")
+
+
+_WIRE_FORMATS = ("records", "columnar")
+
+
+def _prepare_columnar_payload(
+    data: Any, columns: Optional[Sequence[str]]
+) -> tuple[List[str], Dict[str, Any], int]:
+    """Column-major variant of _prepare_table_payload: (columns, {column: values}, length)."""
+    if pd is not None and isinstance(data, pd.DataFrame):
+        resolved_columns = list(columns) if columns else data.columns.tolist()
+        resolved_columns = [column for column in resolved_columns if column in data.columns]
+        column_data = {
+            str(column): _encode_column(_convert_column(data[column]))
+            for column in resolved_columns
+        }
+        return [str(column) for column in resolved_columns], column_data, len(data)
+
+    resolved_columns, rows = _prepare_table_payload(data, columns)
+    column_data = {
+        str(column): _encode_column([row.get(column) for row in rows])
+        for column in resolved_columns
+    }
+    return [str(column) for column in resolved_columns], column_data, len(rows)
+
+
+PAYLOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_payload_cache = _PayloadCache(PAYLOAD_CACHE_MAX_BYTES)
+
+
+def payload_cache_info() -> Dict[str, int]:
+    """Hit/miss/eviction counters and current size of the table payload cache."""
+    return _payload_cache.info()
+
+
+def clear_payload_cache(max_bytes: Optional[int] = None) -> None:
+    """Drop all cached payloads and encoded JSON (optionally changing the byte budget)."""
+    if max_bytes is not None:
+        _payload_cache.max_bytes = int(max_bytes)
+    _payload_cache.clear()
+    _encoded_cache.clear()
+
+
+def _prepare_cached(
+    data: Any,
+    columns: Optional[Sequence[str]],
+    wire_format: str,
+    fingerprint: Optional[str] = None,
+) -> Any:
+    """Prepare the table payload, memoized by content for DataFrame input."""
+    def build() -> Any:
+        if wire_format == "columnar":
+            return _prepare_columnar_payload(data, columns)
+        return _prepare_table_payload(data, columns)
+
+    if pd is None or not isinstance(data, pd.DataFrame):
+        return build()
+    if fingerprint is None:
+        fingerprint = _frame_fingerprint(data)
+    if fingerprint is None:
+        return build()
+    cache_key = (fingerprint, wire_format, tuple(columns) if columns else None)
+    cached = _payload_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    prepared = build()
+    # charge the converted rows/columns actually held, not the (much smaller) frame
+    _payload_cache.put(cache_key, prepared, deep_sizeof(prepared))
+    return prepared
+
+
+ENCODED_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _json_default(value: Any) -> Any:
+    """Encoder fallback: arrays as lists, everything else through _convert_value."""
+    if getattr(value, "ndim", 0) and hasattr(value, "tolist"):
+        return value.tolist()
+    return _convert_value(value)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json_dumps(obj, _json_default)
+
+
+_encoded_cache = _PayloadCache(ENCODED_CACHE_MAX_BYTES)
+
+
+def encoded_cache_info() -> Dict[str, int]:
+    """Hit/miss/eviction counters and current size of the encoded JSON cache."""
+    return _encoded_cache.info()
+
+
+def _encode_prepared(prepared: Any, wire_format: str) -> bytes:
+    if wire_format == "columnar":
+        columns, column_data, length = prepared
+        return _json_dumps({"columns": columns, "data": column_data, "length": length})
+    columns, rows = prepared
+    return _json_dumps({"columns": columns, "rows": rows})
+
+
+def _encode_cached(
+    data: Any,
+    columns: Optional[Sequence[str]],
+    wire_format: str,
+    fingerprint: Optional[str],
+    payload_cache: bool,
+) -> bytes:
+    """JSON bytes of the table payload; an unchanged DataFrame skips preparation entirely."""
+    if not payload_cache:
+        build = _prepare_columnar_payload if wire_format == "columnar" else _prepare_table_payload
+        return _encode_prepared(build(data, columns), wire_format)
+    if fingerprint is None:
+        return _encode_prepared(_prepare_cached(data, columns, wire_format), wire_format)
+    cache_key = (fingerprint, wire_format, tuple(columns) if columns else None)
+    cached = _encoded_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    raw = _encode_prepared(_prepare_cached(data, columns, wire_format, fingerprint), wire_format)
+    _encoded_cache.put(cache_key, raw, len(raw))
+    return raw
+
+
+_NEAREST_CACHE_MAX = 8
+
+
+class _TimestampIndex:
+    """target_ts column parsed once to epoch milliseconds, sorted for searchsorted."""
+
+    def __init__(self, epoch_ms: Any) -> None:
+        import numpy as np
+
+        valid = np.flatnonzero(~np.isnan(epoch_ms))
+        order = np.argsort(epoch_ms[valid], kind="stable")
+        self.positions = valid[order]  # row index of each sorted value
+        self.values = epoch_ms[self.positions]
+
+    def nearest(self, ref_ms: float, top_k: int) -> List[Tuple[int, float]]:
+        """Up to top_k (row index, target - ref in ms), closest first, earlier row on ties."""
+        import numpy as np
+
+        count = len(self.values)
+        if count == 0:
+            return []
+        pos = int(np.searchsorted(self.values, ref_ms, side="left"))
+        lo, hi = max(0, pos - top_k), min(count, pos + top_k)
+        lo = int(np.searchsorted(self.values, self.values[lo], side="left"))
+        hi = int(np.searchsorted(self.values, self.values[hi - 1], side="right"))
+        offsets = self.values[lo:hi] - ref_ms
+        rows = self.positions[lo:hi]
+        best = np.lexsort((rows, np.abs(offsets)))[:top_k]
+        return [(int(rows[i]), float(offsets[i])) for i in best]
+
+
+_nearest_cache: "OrderedDict[Tuple[str, str], _TimestampIndex]" = OrderedDict()
+_nearest_lock = threading.Lock()
+
+
+def _datetime_ms(parsed: Any) -> Any:
+    """Epoch ms (float64, NaN for NaT) from the column's own unit, so years outside 1677-2262 survive."""
+    import numpy as np
+
+    values = parsed.dt.tz_localize(None).to_numpy() if parsed.dt.tz is not None else parsed.to_numpy()
+    unit = np.datetime_data(values.dtype)[0]
+    if unit not in _TICKS_PER_SECOND:  # D, h, m: whole seconds
+        values, unit = values.astype("datetime64[s]"), "s"
+    ticks = values.view("i8")
+    per_ms = _TICKS_PER_SECOND[unit] // 1000
+    if per_ms:
+        ticks = ticks // per_ms
+    else:
+        ticks = ticks * (1000 // _TICKS_PER_SECOND[unit])
+    result = ticks.astype("float64")
+    result[np.isnat(values)] = np.nan
+    return result
+
+
+def _numeric_ms(values: Any) -> Any:
+    """Same epoch rule as the frontend: [1e9, 1e12) is seconds, anything else milliseconds."""
+    import numpy as np
+
+    values = np.array(values, dtype="float64")
+    values[~np.isfinite(values)] = np.nan
+    magnitude = np.abs(values)
+    values[(magnitude >= 1e9) & (magnitude < 1e12)] *= 1000
+    return values
+
+
+def _epoch_ms(series: Any) -> Any:
+    """Vectorized toTimestamp() of the frontend: epoch ms as float64, NaN if unparseable."""
+    import numpy as np
+
+    series = series.reset_index(drop=True)
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return _datetime_ms(pd.to_datetime(series, utc=True))
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        return _numeric_ms(series.to_numpy(dtype="float64", na_value=np.nan))
+    # ISO strings in one fast pass; numeric strings and other formats only for the rest
+    try:
+        result = _datetime_ms(pd.to_datetime(series, errors="coerce", utc=True, format="ISO8601"))
+    except (TypeError, ValueError):
+        result = np.full(len(series), np.nan)
+    try:
+        has_dash = series.str.contains("-", regex=False, na=False).to_numpy(dtype=bool)
+    except AttributeError:  # no strings at all
+        has_dash = np.zeros(len(series), dtype=bool)
+    rest = series[np.isnan(result) | ~has_dash]
+    rest = rest[rest.notna().to_numpy()]
+    if len(rest):
+        values = _numeric_ms(pd.to_numeric(rest, errors="coerce").to_numpy(dtype="float64", na_value=np.nan))
+        result[rest.index.to_numpy()] = values
+        text = rest[np.isnan(values)]
+        text = text[text.map(lambda value: isinstance(value, str) or hasattr(value, "isoformat")).to_numpy(dtype=bool)]
+        if len(text):
+            try:
+                parsed = pd.to_datetime(text, errors="coerce", utc=True, format="mixed")
+            except (TypeError, ValueError):
+                parsed = pd.to_datetime(text, errors="coerce", utc=True)
+            result[text.index.to_numpy()] = _datetime_ms(parsed)
+    return result
+
+
+def _timestamp_index(series: Any, fingerprint: Optional[str] = None) -> _TimestampIndex:
+    """Parsed/sorted target column, cached by content (frame fingerprint + column if given)."""
+    cache_key: Optional[Tuple[str, str]] = None
+    if fingerprint is not None:
+        cache_key = (fingerprint, str(series.name))
+    else:
+        try:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(repr((str(series.dtype), len(series))).encode())
+            digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+            cache_key = ("column", digest.hexdigest())
+        except Exception:
+            cache_key = None
+    if cache_key is not None:
+        with _nearest_lock:
+            cached = _nearest_cache.get(cache_key)
+            if cached is not None:
+                _nearest_cache.move_to_end(cache_key)
+                return cached
+    index = _TimestampIndex(_epoch_ms(series))
+    if cache_key is not None:
+        with _nearest_lock:
+            _nearest_cache[cache_key] = index
+            while len(_nearest_cache) > _NEAREST_CACHE_MAX:
+                _nearest_cache.popitem(last=False)
+    return index
+
+
+def _resolve_highlight_rows(
+    data: Any,
+    target_ts: Optional[str],
+    ref_ts: Any,
+    top_k: int,
+    fingerprint: Optional[str] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """Nearest rows to each reference timestamp: [{"row", "ref", "rank", "offset_ms"}].
+
+    None when the lookup can't be done here (no pandas / unknown column); the
+    frontend then falls back to its own scan.
+    """
+    if pd is None or target_ts is None or ref_ts is None:
+        return None
+    if isinstance(data, pd.DataFrame):
+        if target_ts not in data.columns:
+            return None
+        series = data[target_ts]
+    elif isinstance(data, Sequence) and not isinstance(data, (str, bytes, bytearray)):
+        series = pd.Series(
+            [entry.get(target_ts) for entry in data if isinstance(entry, Mapping)], dtype=object
+        )
+    else:
+        return None
+    if isinstance(ref_ts, (list, tuple, set, pd.Series)):
+        refs = list(ref_ts)
+    else:
+        refs = [ref_ts]
+    ref_ms = _epoch_ms(pd.Series(refs, dtype=object))
+    index = _timestamp_index(series, fingerprint if isinstance(data, pd.DataFrame) else None)
+    matches: List[Dict[str, Any]] = []
+    for ref_position, value in enumerate(ref_ms.tolist()):
+        if math.isnan(value):
+            continue
+        for rank, (row, offset) in enumerate(index.nearest(value, max(1, int(top_k)))):
+            matches.append({"row": row, "ref": ref_position, "rank": rank, "offset_ms": offset})
+    return matches
+
+
+def _normalize_ui_theme(ui_theme: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    if ui_theme is None:
+        return None
+    if not isinstance(ui_theme, Mapping):
+        raise TypeError("ui_theme must be a mapping of theme options")
+    normalized: Dict[str, Any] = {}
+    for key, value in ui_theme.items():
+        normalized[str(key)] = _convert_value(value)
+    return normalized
+
+
+def table_viewer(
+    data: Any,
+    columns: Optional[Sequence[str]] = None,
+    caption: Optional[str] = None,
+    ui_theme: Optional[Mapping[str, Any]] = None,
+    ref_ts: Optional[Any] = None,
+    target_ts: Optional[str] = None,
+    highlight_note: Optional[Any] = None,
+    highlight_top_k: int = 1,
+    wire_format: str = "records",
+    payload_cache: bool = True,
+    json_bytes: bool = False,
+    key: Optional[str] = None,
+):
+    """Render a simple table based on data passed from Python.
+
+    wire_format="columnar" sends {column: [values]} instead of one dict per row.
+    payload_cache reuses the prepared payload of an unchanged DataFrame across reruns.
+    json_bytes sends the table as one pre-encoded UTF-8 JSON bytes arg (orjson when
+    installed), cached alongside the prepared payload.
+    ref_ts may be one timestamp or a list; the highlight_top_k rows nearest to each
+    are resolved here (target_ts parsed once and cached) and sent as highlight_rows.
+    """
+    if wire_format not in _WIRE_FORMATS:
+        raise ValueError(f"wire_format must be one of {_WIRE_FORMATS}")
+    fingerprint: Optional[str] = None
+    if pd is not None and isinstance(data, pd.DataFrame) and (payload_cache or target_ts is not None):
+        fingerprint = _frame_fingerprint(data)
+    payload_json: Optional[bytes] = None
+    column_data: Optional[Dict[str, Any]] = None
+    row_count: Optional[int] = None
+    resolved_columns: Optional[List[str]] = None
+    rows: Optional[List[Dict[str, Any]]] = None
+    if json_bytes:
+        payload_json = _encode_cached(data, columns, wire_format, fingerprint, payload_cache)
+    else:
+        if payload_cache:
+            prepared = _prepare_cached(data, columns, wire_format, fingerprint)
+        elif wire_format == "columnar":
+            prepared = _prepare_columnar_payload(data, columns)
+        else:
+            prepared = _prepare_table_payload(data, columns)
+        if wire_format == "columnar":
+            resolved_columns, column_data, row_count = prepared
+        else:
+            resolved_columns, rows = prepared
+    theme_payload = _normalize_ui_theme(ui_theme)
+    highlight_rows = _resolve_highlight_rows(data, target_ts, ref_ts, highlight_top_k, fingerprint)
+    highlight_ref_ts = _convert_value(ref_ts) if ref_ts is not None else None
+    highlight_target_ts = str(target_ts) if target_ts is not None else None
+    highlight_note_payload = (
+        _convert_value(highlight_note) if highlight_note is not None else None
+    )
+    component_value = _component_func(
+        rows=rows,
+        columns=resolved_columns,
+        data=column_data,
+        length=row_count,
+        caption=caption,
+        ui_theme=theme_payload,
+        ref_ts=highlight_ref_ts,
+        target_ts=highlight_target_ts,
+        highlight_note=highlight_note_payload,
+        highlight_rows=highlight_rows,
+        payload_json=payload_json,
+        key=key,
+        default=None,
+    )
+    return component_value
+
+if __name__ == "__main__":
+    import pandas as pd
+    import streamlit as st
+    st.set_page_config(
+    page_title="My App",
+    page_icon="📊",
+    layout="wide",   # 👉 wide 모드
+    initial_sidebar_state="collapsed",  # 사이드바 접기 옵션도 같이 가능
+)
+
+    sample = pd.DataFrame(
+        {
+            "ts": ["2024-01-01 10:00", "2024-01-01 11:00"],
+            "desc": ["첫 번째 항목", "두 번째 항목"],  # ✅ 한글 직접 작성
+            "link": [
+                "https://example.com/notifications/1",
+                "https://example.com/tasks/42",
+            ],
+            "Close_Time": ["2024-01-01 10:04", "2024-01-01 11:02"],
+        }
+    )
+
+    table_viewer(
+        sample,
+        caption="데모 테이블",   # ✅ 한글 캡션
+        ui_theme={"accentColor": "#1976d2", "headerBackground": "#e8f1ff"},
+        ref_ts="2024-01-01 10:02",
+        target_ts="ts",
+        highlight_note={
+            "title": "✨ 이게 가장 유력",  # ✅ 한글 정상 표기
+            "icon": "⭐",
+            "body": "ref_ts와 가장 가까운 행입니다.",  # ✅ 한글 정상 표기
+        },
+        key="demo",
+    )
+
+
+
+
+
+
+
+
+
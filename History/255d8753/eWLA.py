@@ -0,0 +1,93 @@
+"""
+Wire format comparison for my_viewer / table_viewer / log_viewer payloads:
+"records" (list of row dicts) vs "columnar" (column -> values).
+
+Reports build time, json.dumps time and encoded size per component on
+synthetic log frames.
+
+python bench_wire_format.py                 # 10k / 100k / 1M rows
+python bench_wire_format.py 10000 50000     # custom row counts
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+for _pkg in ("my-viewer", "table-viewer", "log-viewer"):
+    sys.path.insert(0, os.path.join(_HERE, _pkg))
+
+import log_viewer  # noqa: E402
+import my_viewer  # noqa: E402
+import table_viewer  # noqa: E402
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    ts = pd.Timestamp("2025-01-01") + pd.to_timedelta(np.arange(rows), unit="s")
+    return pd.DataFrame(
+        {
+            "Timestamp": ts.astype(str),
+            "Level": rng.choice(["INFO", "WARN", "ERROR", "DEBUG"], size=rows),
+            "Source": rng.choice(["DB", "API", "Web", "Disk Monitor"], size=rows),
+            "Message": [f"log line {i} processed" for i in range(rows)],
+            "Line": np.arange(rows, dtype="int64"),
+        }
+    )
+
+
+def _builders():
+    def mv(wire):
+        return lambda df: my_viewer._normalize_table(df, wire)
+
+    def tv_records(df):
+        return table_viewer._prepare_table_payload(df, None)
+
+    def tv_columnar(df):
+        return table_viewer._prepare_columnar_payload(df, None)
+
+    def lv_records(df):
+        return log_viewer._to_records_safe(df)
+
+    def lv_columnar(df):
+        return log_viewer._records_to_columnar(log_viewer._to_records_safe(df))
+
+    return [
+        ("my_viewer", mv("records"), mv("columnar")),
+        ("table_viewer", tv_records, tv_columnar),
+        ("log_viewer", lv_records, lv_columnar),
+    ]
+
+
+def _measure(build, df):
+    t0 = time.perf_counter()
+    payload = build(df)
+    t1 = time.perf_counter()
+    encoded = json.dumps(payload)
+    t2 = time.perf_counter()
+    return t1 - t0, t2 - t1, len(encoded.encode("utf-8"))
+
+
+def main() -> None:
+    sizes = [int(x) for x in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'component':<13}{'rows':>10}  {'format':<9}{'build ms':>10}{'json ms':>10}{'MB':>9}")
+    for rows in sizes:
+        df = make_frame(rows)
+        for name, records, columnar in _builders():
+            base = None
+            for fmt, build in (("records", records), ("columnar", columnar)):
+                build_s, json_s, size = _measure(build, df)
+                ratio = "" if base is None else f"  ({size / base:.0%} of records)"
+                base = base or size
+                print(
+                    f"{name:<13}{rows:>10,}  {fmt:<9}{build_s * 1000:>10.1f}"
+                    f"{json_s * 1000:>10.1f}{size / 1e6:>9.2f}{ratio}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import type { Args, ReportCacheEntry } from "./types"
+
+// Lazy report_cache: Python only sends the active report (+ neighbours);
+// reports already received are kept here so revisiting them is instant.
+const REPORT_LRU_LIMIT = 24
+
+export type ReportLru = {
+  version: string | null
+  entries: Map<number, ReportCacheEntry>
+}
+
+export const createReportLru = (): ReportLru => ({
+  version: null,
+  entries: new Map(),
+})
+
+export function mergeReportCache(a: Args, lru: ReportLru): Args {
+  const cache = a.report_cache
+  const version = a.report_cache_version ?? null
+  if (!cache || version == null) return a
+  if (lru.version !== version) {
+    lru.version = version
+    lru.entries.clear()
+  }
+  const merged = cache.map((entry, i) => {
+    if (entry) {
+      lru.entries.delete(i)
+      lru.entries.set(i, entry)
+      return entry
+    }
+    return lru.entries.get(i) ?? null
+  })
+  while (lru.entries.size > REPORT_LRU_LIMIT) {
+    lru.entries.delete(lru.entries.keys().next().value as number)
+  }
+  return { ...a, report_cache: merged }
+}
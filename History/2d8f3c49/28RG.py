@@ -0,0 +1,317 @@
+"""
+Helpers shared by my_viewer / table_viewer / log_viewer: the byte-bounded payload
+cache, DataFrame fingerprints, string dictionary encoding, compact JSON and the
+server-side search index.
+
+    from viewer_common import PayloadCache, SearchIndex, deep_sizeof, frame_fingerprint, json_dumps
+
+Put the viewer-common directory on sys.path next to the component directories
+(like log-file); the components import it by name.
+"""
+
+import hashlib
+import json
+import math
+import re
+import sys
+import threading
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+try:
+    import pandas as pd  # type: ignore
+except ImportError:  # pragma: no cover
+    pd = None  # type: ignore[assignment]
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+# ---------------------- payload cache ----------------------
+class PayloadCache:
+    """LRU keyed by content fingerprint, bounded by the bytes charged on put().
+
+    Shared by all sessions of the process (keys are content hashes, not ids), so
+    reruns that only move the selection reuse the already-prepared tables.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Any, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Any, value: Any, nbytes: int) -> None:
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._items[key] = (value, nbytes)
+            self.bytes += nbytes
+            while self.bytes > self.max_bytes and self._items:
+                _, (_, size) = self._items.popitem(last=False)
+                self.bytes -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.bytes = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._items),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_SIZE_SAMPLE = 64
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Approximate resident size of a prepared payload (dicts, lists, tuples, scalars, arrays).
+
+    Containers longer than _SIZE_SAMPLE are sized from evenly spaced items and
+    scaled up; a value object repeated within the sample (category strings,
+    shared rows) is counted once. Dict keys are column names shared by every
+    row and aren't counted; None, bools and small ints are singletons.
+    """
+    return _sizeof(obj, set())
+
+
+def _sizeof(obj: Any, seen: set) -> int:
+    if obj is None or obj is True or obj is False:
+        return 0
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    kind = type(obj)
+    if kind is dict:
+        return sys.getsizeof(obj) + _items_sizeof(list(obj.values()), seen)
+    if kind is list or kind is tuple:
+        return sys.getsizeof(obj) + _items_sizeof(obj, seen)
+    if kind is int and -5 <= obj <= 256:
+        return 0
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):  # numpy arrays (views don't own their buffer)
+        return max(sys.getsizeof(obj), nbytes)
+    if pd is not None and isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(pd.Series(obj.memory_usage(index=True, deep=True)).sum())
+    return sys.getsizeof(obj)
+
+
+def _items_sizeof(items: Any, seen: set) -> int:
+    n = len(items)
+    if n <= _SIZE_SAMPLE:
+        return sum(_sizeof(v, seen) for v in items)
+    step = n / _SIZE_SAMPLE
+    sample = sum(_sizeof(items[int(i * step)], seen) for i in range(_SIZE_SAMPLE))
+    return sample * n // _SIZE_SAMPLE
+
+
+# ---------------------- fingerprints ----------------------
+def frame_fingerprint(df: Any) -> Optional[str]:
+    """Content hash of a DataFrame (shape, columns, dtypes, hashed rows); None if unhashable."""
+    try:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((df.shape, [str(c) for c in df.columns], [str(t) for t in df.dtypes])).encode())
+        h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return h.hexdigest()
+    except TypeError:  # unhashable cells (dicts, lists) in an object column
+        return None
+
+
+# ---------------------- wire encoding ----------------------
+DICT_MIN_ROWS = 16  # dictionary-encode strings only for columns at least this long
+
+
+def encode_column(values: List[Any]) -> Any:
+    """Dictionary-encode repetitive string columns as {"dict", "codes"}."""
+    n = len(values)
+    if n < DICT_MIN_ROWS:
+        return values
+    lookup: Dict[str, int] = {}
+    codes: List[int] = []
+    for v in values:
+        if v is None:
+            codes.append(-1)
+            continue
+        if type(v) is not str:
+            return values
+        code = lookup.get(v)
+        if code is None:
+            code = lookup[v] = len(lookup)
+            if code * 2 > n:
+                return values
+        codes.append(code)
+    return {"dict": list(lookup), "codes": codes}
+
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Compact UTF-8 JSON: orjson (numpy-aware) when installed, else the stdlib encoder.
+
+    `default` converts values the encoder doesn't know (each component passes its
+    own cell converter). NaN / Infinity become null with either encoder, as orjson
+    does; the stdlib's bare NaN tokens would make the browser's JSON.parse fail.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=ORJSON_OPTIONS)
+    try:
+        text = json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    except ValueError:  # a non-finite float somewhere: only then walk the payload
+        text = json.dumps(
+            _finite(obj, default), default=default, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        )
+    return text.encode("utf-8")
+
+
+def _finite(obj: Any, default: Optional[Callable[[Any], Any]]) -> Any:
+    """Copy of a payload with non-finite floats as None (values `default` converts included)."""
+    kind = type(obj)
+    if kind is str or kind is int or kind is bool or obj is None:
+        return obj
+    if isinstance(obj, float):
+        return float(obj) if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v, default) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v, default) for v in obj]
+    if default is not None and not isinstance(obj, (str, int)):
+        try:
+            return _finite(default(obj), default)
+        except TypeError:
+            pass
+    return obj
+
+
+# ---------------------- search index ----------------------
+_SEARCH_SMALL_VOCAB_HIT = 64
+_WORD_RE = re.compile(r"\w+")
+_QUERY_TERM_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def search_terms(query: str) -> List[str]:
+    """Query -> lower-cased terms: whitespace separates terms, "quoted text" is one term."""
+    out = []
+    for quoted, word in _QUERY_TERM_RE.findall(query or ""):
+        term = (quoted or word).strip().lower()
+        if term:
+            out.append(term)
+    return out
+
+
+class SearchIndex:
+    """Inverted index over lower-cased row texts: \\w+ token -> row ids.
+
+    `texts` are one object Series per searchable column (or one joined text per
+    row). A term matches a row when it is a substring of one of the row's texts,
+    like the browser search. Every \\w run of the term must then sit inside some
+    token of that row, so the postings of the vocabulary tokens containing each
+    run give the candidates; terms with other characters are confirmed by a
+    substring check on those candidates only.
+    """
+
+    def __init__(self, texts: List[Any], length: int) -> None:
+        self.texts = texts
+        self.length = length
+        # Tokenize each distinct value once, then expand (token, value) pairs to
+        # the rows holding that value.
+        token_parts, row_parts = [], []
+        for s in texts:
+            value_codes, uniques = pd.factorize(s)
+            token_lists = [_WORD_RE.findall(v) for v in uniques.tolist()]
+            lengths = np.fromiter(map(len, token_lists), dtype=np.int64, count=len(token_lists))
+            value_ids = np.repeat(np.arange(len(token_lists)), lengths)
+            by_value = np.argsort(value_codes, kind="stable")
+            counts = np.bincount(value_codes, minlength=len(uniques))
+            starts = np.cumsum(counts) - counts
+            reps = counts[value_ids]
+            pos = np.repeat(starts[value_ids] - (np.cumsum(reps) - reps), reps) + np.arange(int(reps.sum()))
+            tokens = np.fromiter(chain.from_iterable(token_lists), dtype=object, count=len(value_ids))
+            token_parts.append(np.repeat(tokens, reps))
+            row_parts.append(by_value[pos])
+        all_tokens = np.concatenate(token_parts) if token_parts else np.empty(0, dtype=object)
+        codes, vocab = pd.factorize(all_tokens)
+        rows = np.concatenate(row_parts) if row_parts else np.empty(0, dtype=np.int64)
+        # one sort on (token, row) packed into int64, then drop duplicate pairs
+        pairs = np.sort(codes.astype(np.int64) * max(length, 1) + rows)
+        pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))] if len(pairs) else pairs
+        codes, rows = pairs // max(length, 1), pairs % max(length, 1)
+        self.vocab = pd.Series(vocab, dtype=object)
+        self.offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(vocab)), out=self.offsets[1:])
+        self.postings = rows.astype(np.int32 if length < 2**31 else np.int64)
+
+    @property
+    def nbytes(self) -> int:
+        text_bytes = sum(int(s.memory_usage(index=False, deep=True)) for s in self.texts)
+        return text_bytes + self.postings.nbytes + self.offsets.nbytes + int(self.vocab.memory_usage(deep=True))
+
+    def _run_mask(self, run: str) -> Any:
+        """Rows having a token that contains `run`."""
+        out = np.zeros(self.length, dtype=bool)
+        hit = self.vocab.str.contains(run, regex=False).to_numpy(dtype=bool)
+        tokens = np.flatnonzero(hit)
+        if len(tokens) <= _SEARCH_SMALL_VOCAB_HIT:
+            for t in tokens.tolist():
+                out[self.postings[self.offsets[t] : self.offsets[t + 1]]] = True
+        else:
+            out[self.postings[np.repeat(hit, np.diff(self.offsets))]] = True
+        return out
+
+    def _scan(self, term: str, candidates: Any) -> Any:
+        rows = np.flatnonzero(candidates)
+        out = np.zeros(self.length, dtype=bool)
+        for s in self.texts:
+            sub = s.iloc[rows] if len(rows) < self.length else s
+            out[rows[sub.str.contains(term, regex=False).to_numpy(dtype=bool)]] = True
+        return out
+
+    def term_mask(self, term: str) -> Any:
+        runs = sorted(set(_WORD_RE.findall(term)), key=len, reverse=True)
+        mask = np.ones(self.length, dtype=bool)
+        for run in runs:
+            mask &= self._run_mask(run)
+            if not mask.any():
+                return mask
+        if runs != [term]:
+            mask = self._scan(term, mask)
+        return mask
+
+    def search(self, terms: List[str]) -> Any:
+        """Rows matching every term (AND)."""
+        mask = np.ones(self.length, dtype=bool)
+        for term in terms:
+            mask &= self.term_mask(term)
+        return mask
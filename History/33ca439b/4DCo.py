@@ -0,0 +1,355 @@
+import os
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+import numpy as np
+import streamlit.components.v1 as components
+
+_RELEASE = False
+if not _RELEASE:
+    _component_func = components.declare_component(
+        "log_viewer",
+        url="http://localhost:3001",
+    )
+else:
+    parent_dir = os.path.dirname(os.path.abspath(__file__))
+    build_dir = os.path.join(parent_dir, "frontend/build")
+    _component_func = components.declare_component("log_viewer", path=build_dir)
+
+
+_PLAIN_TYPES = (str, int, float, bool)
+
+
+def _clean_value(v: Any) -> Any:
+    if isinstance(v, np.datetime64):
+        v = pd.Timestamp(v)
+    elif isinstance(v, np.generic):
+        v = v.item()
+    if v is None or v is pd.NaT or v is pd.NA:
+        return None
+    if isinstance(v, float) and np.isnan(v):
+        return None
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    return v
+
+
+def _datetime_strings(s: pd.Series) -> List[Any]:
+    """datetime64 컬럼 -> Timestamp.isoformat() 과 같은 문자열 (NaT -> None), 벡터화."""
+    tz = getattr(s.dtype, "tz", None)
+    local = s.dt.tz_localize(None) if tz is not None else s
+    arr = local.to_numpy(dtype="datetime64[ns]")
+    nat = np.isnat(arr)
+    sub = arr.view("i8") % 1_000_000_000
+    out = np.datetime_as_string(arr, unit="s").astype(object)
+    has_ns = (sub % 1000) != 0
+    has_us = (sub != 0) & ~has_ns
+    if has_us.any():
+        out[has_us] = np.datetime_as_string(arr[has_us], unit="us")
+    if has_ns.any():
+        out[has_ns] = np.datetime_as_string(arr[has_ns], unit="ns")
+    if tz is not None:
+        # 행마다 UTC 오프셋(+09:00 등)을 붙임 — DST 가 있으면 행별로 다를 수 있음
+        utc = s.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+        offsets = ((arr.view("i8") - utc.view("i8")) // 1_000_000_000)[~nat]
+        suffix = np.empty(len(offsets), dtype=object)
+        for off in np.unique(offsets).tolist():
+            sign = "+" if off >= 0 else "-"
+            hh, mm = divmod(abs(off) // 60, 60)
+            sec = abs(off) % 60
+            suffix[offsets == off] = f"{sign}{hh:02d}:{mm:02d}" + (f":{sec:02d}" if sec else "")
+        out[~nat] = out[~nat] + suffix
+    out[nat] = None
+    return out.tolist()
+
+
+def _column_values(s: pd.Series) -> List[Any]:
+    """컬럼 하나를 JSON 안전한 값 리스트로 — dtype 보고 변환 방식을 한 번만 고름."""
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        cats = _column_values(pd.Series(dtype.categories))
+        lookup = np.array(cats + [None], dtype=object)
+        return lookup[s.cat.codes.to_numpy()].tolist()  # code -1 -> None
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return _datetime_strings(s)
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return s.to_numpy().tolist()
+        if dtype.kind == "f":
+            arr = s.to_numpy()
+            values = arr.tolist()
+            for i in np.flatnonzero(np.isnan(arr)).tolist():
+                values[i] = None
+            return values
+        if dtype.kind == "M":
+            return _datetime_strings(s)
+    # object / extension / timedelta: 일반 값은 그대로, 나머지만 셀 단위 변환
+    values = s.tolist()
+    missing = s.isna().to_numpy()
+    for i, v in enumerate(values):
+        if missing[i]:
+            values[i] = None
+        elif type(v) not in _PLAIN_TYPES:
+            values[i] = _clean_value(v)
+    return values
+
+
+def _sequence_values(values: Any) -> List[Any]:
+    if isinstance(values, (pd.Series, pd.Index, np.ndarray)):
+        return _column_values(pd.Series(values, copy=False))
+    if isinstance(values, (list, tuple)):
+        return [v if type(v) in _PLAIN_TYPES and v == v else _clean_value(v) for v in values]
+    raise ValueError(f"[log_viewer] dict 입력의 값은 리스트여야 합니다: {type(values).__name__}")
+
+
+def _rows_from_columns(columns: List[Any], values: List[List[Any]], length: int) -> List[Dict[str, Any]]:
+    if not columns:
+        return [{} for _ in range(length)]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _to_records_safe(
+    data: Union[pd.DataFrame, List[Dict[str, Any]], Dict[str, List[Any]]]
+) -> List[Dict[str, Any]]:
+    if isinstance(data, pd.DataFrame):
+        columns = list(data.columns)
+        values = [_column_values(data.iloc[:, i]) for i in range(len(columns))]
+        return _rows_from_columns(columns, values, len(data))
+    if isinstance(data, dict):
+        # dict-of-lists 는 DataFrame 을 거치지 않고 바로 변환
+        columns = list(data)
+        values = [_sequence_values(v) for v in data.values()]
+        lengths = {len(v) for v in values}
+        if len(lengths) > 1:
+            raise ValueError(f"[log_viewer] dict 입력의 컬럼 길이가 다릅니다: {sorted(lengths)}")
+        return _rows_from_columns(columns, values, lengths.pop() if lengths else 0)
+    if isinstance(data, list):
+        cleaned: List[Dict[str, Any]] = []
+        for row in data:
+            if isinstance(row, dict):
+                cleaned.append({k: _clean_value(v) for k, v in row.items()})
+            else:
+                cleaned.append({"value": _clean_value(row)})
+        return cleaned
+    return [{"value": str(data)}]
+
+
+_DICT_MIN_ROWS = 16
+
+
+def _encode_column(values: List[Any]) -> Any:
+    """반복이 많은 문자열 컬럼은 {"dict", "codes"} 로 사전 인코딩."""
+    n = len(values)
+    if n < _DICT_MIN_ROWS:
+        return values
+    lookup: Dict[str, int] = {}
+    codes: List[int] = []
+    for v in values:
+        if v is None:
+            codes.append(-1)
+            continue
+        if type(v) is not str:
+            return values
+        code = lookup.get(v)
+        if code is None:
+            code = lookup[v] = len(lookup)
+            if code * 2 > n:
+                return values
+        codes.append(code)
+    return {"dict": list(lookup), "codes": codes}
+
+
+def _records_to_columnar(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """row dict 리스트 -> {"columns", "data": {col: [values]}, "length"} (column-major)."""
+    columns: List[str] = []
+    seen = set()
+    for r in rows:
+        for k in r:
+            if k not in seen:
+                seen.add(k)
+                columns.append(k)
+    return {
+        "columns": columns,
+        "data": {c: _encode_column([r.get(c) for r in rows]) for c in columns},
+        "length": len(rows),
+    }
+
+
+def log_viewer(
+    dict_log_short: Union[pd.DataFrame, List[Dict[str, Any]], Dict[str, List[Any]]],
+    dict_log_detail: Union[pd.DataFrame, List[Dict[str, Any]], Dict[str, List[Any]]],
+    left_title: str = "Simple Log",
+    right_title: str = "Detail Log",
+    height: int = 560,
+    initial_index: Optional[int] = 0,
+    search_placeholder: str = "Search",
+    # 디자인/동작 옵션
+    accent_color: str = "#4F8CF7",
+    zebra: bool = True,
+    density: str = "compact",            # "compact" | "comfortable"
+    width: Union[int, str] = "100%",
+    left_width: Optional[Union[int, str]] = None,
+    right_width: Optional[Union[int, str]] = None,
+    filter_columns: Optional[List[str]] = None,
+    highlight_rules: Optional[Dict[str, Dict[str, Any]]] = None,
+    highlight_background: Optional[Dict[str, Dict[str, str]]] = None,
+    nav_buttons: bool = False,
+    nav_column: str = "Level",
+    nav_terms: Optional[Dict[str, str]] = None,
+    buttons: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    wire_format: str = "records",        # "records" | "columnar"
+    key: Optional[str] = None,
+) -> Dict[str, Any]:
+    if wire_format not in ("records", "columnar"):
+        raise ValueError(f"[log_viewer] wire_format must be 'records' or 'columnar': {wire_format!r}")
+    short_rows = _to_records_safe(dict_log_short)
+    detail_rows = _to_records_safe(dict_log_detail)
+
+    if len(short_rows) != len(detail_rows):
+        raise ValueError(
+            f"[log_viewer] 길이 불일치: short({len(short_rows)}) != detail({len(detail_rows)})"
+        )
+
+    safe_initial = None
+    if len(short_rows) > 0 and (initial_index is not None) and 0 <= initial_index < len(short_rows):
+        safe_initial = initial_index
+
+    default_payload = {
+        "selected_index": safe_initial,
+        "selected_short": short_rows[safe_initial] if safe_initial is not None else None,
+        "selected_detail": detail_rows[safe_initial] if safe_initial is not None else None,
+        "query": "",
+        "active_filters": {},
+    }
+
+    # Merge highlight rules with highlight_background mapping (column -> term -> color)
+    merged_rules: Dict[str, Dict[str, Any]] = {}
+    if highlight_rules:
+        merged_rules.update(highlight_rules)
+    if highlight_background:
+        idx = 0
+        for col, mapping in highlight_background.items():
+            if isinstance(mapping, dict):
+                for term, color in mapping.items():
+                    merged_rules[f"hb_{col}_{idx}"] = {
+                        "terms": [str(term)],
+                        "bg": color,
+                        "columns": [col],
+                    }
+                    idx += 1
+
+    # columnar: 행마다 컬럼명을 반복하지 않도록 column-major 로 전송
+    columnar = wire_format == "columnar"
+    component_value = _component_func(
+        short_rows=None if columnar else short_rows,
+        detail_rows=None if columnar else detail_rows,
+        short_table=_records_to_columnar(short_rows) if columnar else None,
+        detail_table=_records_to_columnar(detail_rows) if columnar else None,
+        left_title=left_title,
+        right_title=right_title,
+        height=height,
+        initial_index=safe_initial,
+        search_placeholder=search_placeholder,
+        accent_color=accent_color,
+        zebra=zebra,
+        density=density,
+        width=width,
+        left_width=left_width,
+        right_width=right_width,
+        filter_columns=filter_columns or [],
+        highlight_rules=merged_rules,
+        nav_buttons=nav_buttons,
+        nav_column=nav_column,
+        nav_terms=nav_terms or {"warn": "WARN", "error": "ERROR"},
+        buttons=buttons,
+        key=key,
+        default=default_payload,
+    )
+    return component_value
+
+
+if __name__ == "__main__":
+    import streamlit as st
+
+    st.set_page_config(
+    page_title="내 앱",
+    layout="wide",  # 👉 넓게 펼치는 옵션
+    initial_sidebar_state="expanded"
+)
+
+    st.title("log_viewer (Light UI + Expanding Search)")
+
+    short = [
+        {"Timestamp": "2024-01-26 10:00:00", "Level": "INFO",  "Message": "System started successfully"},
+        {"Timestamp": "2024-01-26 10:05:00", "Level": "WARNING","Message": "Low disk space"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+        {"Timestamp": "2024-01-26 10:15:00", "Level": "INFO",  "Message": "User logged in"},
+        {"Timestamp": "2024-01-26 10:20:00", "Level": "DEBUG", "Message": "Processing request"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+
+    ]
+    detail = [
+        {"Timestamp": "2024-01-26 10:00:00", "Level": "INFO",   "Message": "System started successfully", "Source":"System","User":"-" },
+        {"Timestamp": "2024-01-26 10:05:00", "Level": "WARNING","Message": "Low disk space",              "Source":"Disk Monitor","User":"System"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+        {"Timestamp": "2024-01-26 10:15:00", "Level": "INFO",   "Message": "User logged in",              "Source":"Web","User":"admin"},
+        {"Timestamp": "2024-01-26 10:20:00", "Level": "DEBUG",  "Message": "Processing request",          "Source":"API","User":"-"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+
+    ]
+
+    rules = {
+        "warn":  {"terms": ["low disk"], "bg": "rgba(255,211,105,0.18)", "columns": ["Message"]},
+        "error": {"terms": ["failed", "database"], "bg": "rgba(255,134,134,0.18)"},
+    }
+
+    # New: highlight_background maps column -> { term -> color }
+    highlight_bg = {
+        "Level": {
+            "WARNING": "rgba(255,211,105,0.18)",
+            "ERROR": "rgba(255,134,134,0.18)",
+        },
+        "Message": {
+            "logged in": "rgba(91,191,114,0.20)",
+        },
+    }
+
+    # Dynamic buttons: label -> { column -> [terms] }
+    buttons = {
+        "Go ERROR": {
+            "Level": ["ERROR"],
+        },
+        "Go warn": {
+            "Level": ["WARN", "WARNING"],
+        },
+    }
+
+    st.write(log_viewer(
+        dict_log_short=short,
+        dict_log_detail=detail,
+        left_title="Simple Log (Demo)",
+        right_title="Detail Log (Demo)",
+        height=400,
+        initial_index=0,
+        search_placeholder="Search logs...",
+        accent_color="#4F8CF7",
+        zebra=True,
+        density="compact",
+        width="100%",              # or a number like 1200
+        left_width=1.2,             # or "700px"
+        right_width=1,              # or "1fr"
+        filter_columns=["Level", "Message"],
+        highlight_rules=rules,      # existing rules still supported
+        highlight_background=highlight_bg,  # new background mapping
+        nav_buttons=True,
+        nav_column="Level",
+        nav_terms={"warn": "WARNING", "error": "ERROR"},
+        buttons=buttons,
+        key="demo",
+    ))
@@ -0,0 +1,819 @@
+import hashlib
+import json
+import os
+import re
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+import numpy as np
+import streamlit as st
+import streamlit.components.v1 as components
+from viewer_common import (
+    PayloadCache as _PayloadCache,
+    SearchIndex as _SearchIndex,
+    anchor_digest as _anchor_digest,
+    datetime_isoformat as _datetime_isoformat,
+    deep_sizeof as _deep_sizeof,
+    encode_column as _encode_column,
+    frame_fingerprint as _frame_fingerprint,
+    json_dumps,
+    search_terms as _search_terms,
+)
+
+_RELEASE = False
+if not _RELEASE:
+    _component_func = components.declare_component(
+        "log_viewer",
+        url="http://localhost:3001",
+    )
+else:
+    parent_dir = os.path.dirname(os.path.abspath(__file__))
+    build_dir = os.path.join(parent_dir, "frontend/build")
+    _component_func = components.declare_component("log_viewer", path=build_dir)
+
+
+_PLAIN_TYPES = (str, int, float, bool)
+
+
+def _clean_value(v: Any) -> Any:
+    if isinstance(v, np.datetime64):
+        v = pd.Timestamp(v)
+    elif isinstance(v, np.generic):
+        v = v.item()
+    if v is None or v is pd.NaT or v is pd.NA:
+        return None
+    if isinstance(v, float) and np.isnan(v):
+        return None
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    return v
+
+
+def _column_values(s: pd.Series) -> List[Any]:
+    """컬럼 하나를 JSON 안전한 값 리스트로 — dtype 보고 변환 방식을 한 번만 고름."""
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        cats = _column_values(pd.Series(dtype.categories))
+        lookup = np.array(cats + [None], dtype=object)
+        return lookup[s.cat.codes.to_numpy()].tolist()  # code -1 -> None
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return _datetime_isoformat(s)
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return s.to_numpy().tolist()
+        if dtype.kind == "f":
+            arr = s.to_numpy()
+            values = arr.tolist()
+            for i in np.flatnonzero(np.isnan(arr)).tolist():
+                values[i] = None
+            return values
+        if dtype.kind == "M":
+            return _datetime_isoformat(s)
+    # object / extension / timedelta: 일반 값은 그대로, 나머지만 셀 단위 변환
+    values = s.tolist()
+    missing = s.isna().to_numpy()
+    for i, v in enumerate(values):
+        if missing[i]:
+            values[i] = None
+        elif type(v) not in _PLAIN_TYPES:
+            values[i] = _clean_value(v)
+    return values
+
+
+def _sequence_values(values: Any) -> List[Any]:
+    if isinstance(values, (pd.Series, pd.Index, np.ndarray)):
+        return _column_values(pd.Series(values, copy=False))
+    if isinstance(values, (list, tuple)):
+        return [v if type(v) in _PLAIN_TYPES and v == v else _clean_value(v) for v in values]
+    raise ValueError(f"[log_viewer] dict 입력의 값은 리스트여야 합니다: {type(values).__name__}")
+
+
+def _rows_from_columns(columns: List[Any], values: List[List[Any]], length: int) -> List[Dict[str, Any]]:
+    if not columns:
+        return [{} for _ in range(length)]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _to_records_safe(
+    data: Union[pd.DataFrame, List[Dict[str, Any]], Dict[str, List[Any]]]
+) -> List[Dict[str, Any]]:
+    if isinstance(data, pd.DataFrame):
+        columns = list(data.columns)
+        values = [_column_values(data.iloc[:, i]) for i in range(len(columns))]
+        return _rows_from_columns(columns, values, len(data))
+    if isinstance(data, dict):
+        # dict-of-lists 는 DataFrame 을 거치지 않고 바로 변환
+        columns = list(data)
+        values = [_sequence_values(v) for v in data.values()]
+        lengths = {len(v) for v in values}
+        if len(lengths) > 1:
+            raise ValueError(f"[log_viewer] dict 입력의 컬럼 길이가 다릅니다: {sorted(lengths)}")
+        return _rows_from_columns(columns, values, lengths.pop() if lengths else 0)
+    if isinstance(data, list):
+        cleaned: List[Dict[str, Any]] = []
+        for row in data:
+            if isinstance(row, dict):
+                cleaned.append({k: _clean_value(v) for k, v in row.items()})
+            else:
+                cleaned.append({"value": _clean_value(row)})
+        return cleaned
+    return [{"value": str(data)}]
+
+
+def _columns_of(rows: List[Dict[str, Any]]) -> List[str]:
+    """등장 순서대로 모든 행의 키 합집합."""
+    columns: List[str] = []
+    seen = set()
+    for r in rows:
+        for k in r:
+            if k not in seen:
+                seen.add(k)
+                columns.append(k)
+    return columns
+
+
+def _records_to_columnar(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """row dict 리스트 -> {"columns", "data": {col: [values]}, "length"} (column-major)."""
+    columns = _columns_of(rows)
+    return {
+        "columns": columns,
+        "data": {c: _encode_column([r.get(c) for r in rows]) for c in columns},
+        "length": len(rows),
+    }
+
+
+_DEFAULT_RULE_BG = "rgba(79,140,247,0.10)"
+
+
+def _match_bits(values: List[Any], term_bits: Dict[str, int], dtype: Any) -> np.ndarray:
+    """값마다 매칭된 룰 비트(OR). 고유값 단위로 한 번만 검사하고 codes 로 펼침."""
+    try:
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    except TypeError:  # list/dict 같은 unhashable 값
+        codes, uniques = pd.factorize(pd.Series([None if v is None else str(v) for v in values], dtype=object))
+    # 전체 term 을 한 정규식으로 묶어 1차 필터, 걸린 값만 term 별로 확인
+    combined = re.compile("|".join(re.escape(t) for t in sorted(term_bits, key=len, reverse=True)))
+    unique_bits = np.zeros(len(uniques) + 1, dtype=dtype)  # 마지막 칸 = 결측(-1)
+    for i, v in enumerate(uniques.tolist()):
+        text = str(v).lower()
+        if combined.search(text) is None:
+            continue
+        bits = 0
+        for term, tb in term_bits.items():
+            if term in text:
+                bits |= tb
+        unique_bits[i] = bits
+    return unique_bits[codes]
+
+
+def _compile_highlight_rules(
+    columns: List[str],
+    column_values: Dict[str, List[Any]],
+    length: int,
+    rules: Dict[str, Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """highlight_rules -> 행별 매칭 룰 집합 (사전 인코딩된 비트마스크).
+
+    {"rules": [rule id], "bg": [color], "combos": [[rule index, ...]], "codes": [combo or -1]}
+    프론트는 codes -> combos[code][0] 의 bg 로 칠하기만 함 (룰 순서 = 우선순위).
+    """
+    rule_ids = [k for k, r in rules.items() if isinstance(r, dict) and r.get("terms")]
+    if not rule_ids or length == 0:
+        return None
+    per_column: Dict[str, Dict[str, int]] = {}
+    for i, rid in enumerate(rule_ids):
+        rule = rules[rid]
+        terms = [str(t).lower() for t in rule.get("terms") or [] if str(t)]
+        targets = [c for c in (rule.get("columns") or columns) if c in column_values]
+        for col in targets:
+            term_bits = per_column.setdefault(col, {})
+            for term in terms:
+                term_bits[term] = term_bits.get(term, 0) | (1 << i)
+    # 룰 63개 미만이면 int64 비트마스크, 그 이상은 파이썬 int (object)
+    dtype = np.int64 if len(rule_ids) < 63 else object
+    mask = np.zeros(length, dtype=dtype)
+    for col, term_bits in per_column.items():
+        if term_bits:
+            mask = mask | _match_bits(column_values[col], term_bits, dtype)
+    hit = mask != 0
+    codes = np.full(length, -1, dtype=np.int64)
+    codes[hit], combo_masks = pd.factorize(mask[hit])
+    combos = [[i for i in range(len(rule_ids)) if (int(m) >> i) & 1] for m in combo_masks.tolist()]
+    return {
+        "rules": rule_ids,
+        "bg": [rules[rid].get("bg") or _DEFAULT_RULE_BG for rid in rule_ids],
+        "combos": combos,
+        "codes": codes.tolist(),
+    }
+
+
+JUMP_INDEX_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_jump_cache = _PayloadCache(JUMP_INDEX_CACHE_MAX_BYTES)
+
+
+def _jump_specs(
+    buttons: Optional[Dict[str, Dict[str, List[str]]]],
+    nav_buttons: bool,
+    nav_column: str,
+    nav_terms: Dict[str, str],
+) -> Dict[str, Tuple[List[str], List[str]]]:
+    """프론트 goToNext 와 같은 (columns, terms) 정의. buttons 가 있으면 nav 버튼은 안 그려짐."""
+    if buttons:
+        specs: Dict[str, Tuple[List[str], List[str]]] = {}
+        for label, mapping in buttons.items():
+            mapping = mapping or {}
+            terms: List[str] = []
+            for col in mapping:
+                v = mapping[col] or []
+                terms.extend(v if isinstance(v, list) else [v])
+            specs[str(label)] = (list(mapping), [str(x) for x in terms])
+        return specs
+    if nav_buttons:
+        return {
+            "__error": ([nav_column], [nav_terms.get("error") or "ERROR"]),
+            "__warn": ([nav_column], [nav_terms.get("warn") or "WARN"]),
+        }
+    return {}
+
+
+def _build_jump_index(
+    column_values: Dict[str, List[Any]],
+    length: int,
+    specs: Dict[str, Tuple[List[str], List[str]]],
+) -> Dict[str, List[int]]:
+    """버튼 key -> 매칭되는 원본 행 번호 (오름차순). 컬럼 중 하나라도 term 포함이면 hit."""
+    out: Dict[str, List[int]] = {}
+    for key, (cols, terms) in specs.items():
+        term_bits = {t.lower(): 1 for t in terms if t}
+        hit = np.zeros(length, dtype=np.int64)
+        if term_bits:
+            for col in cols:
+                if col in column_values:
+                    hit |= _match_bits(column_values[col], term_bits, np.int64)
+        out[key] = np.flatnonzero(hit).tolist()
+    return out
+
+
+def _jump_index_cached(
+    source: Any,
+    column_values: Dict[str, List[Any]],
+    length: int,
+    specs: Dict[str, Tuple[List[str], List[str]]],
+) -> Dict[str, List[int]]:
+    """DataFrame 입력이면 (fingerprint, 버튼 정의) 기준으로 재사용."""
+    fp = _frame_fingerprint(source) if isinstance(source, pd.DataFrame) else None
+    if fp is None:
+        return _build_jump_index(column_values, length, specs)
+    key = (fp, json.dumps(specs, sort_keys=True))
+    hit = _jump_cache.get(key)
+    if hit is not None:
+        return hit
+    index = _build_jump_index(column_values, length, specs)
+    _jump_cache.put(key, index, _deep_sizeof(index))
+    return index
+
+
+SEARCH_INDEX_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+_search_cache = _PayloadCache(SEARCH_INDEX_CACHE_MAX_BYTES)
+
+
+def _js_text(v: Any) -> str:
+    """프론트 toStr (String(v)) 와 같은 문자열."""
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return str(v)
+
+
+def _joined_text(rows: List[Dict[str, Any]], columns: List[str]) -> pd.Series:
+    """프론트 rowToJoined 와 같은 행 텍스트: short 컬럼 값을 공백으로 이어 붙이고 소문자."""
+    parts = [pd.Series([_js_text(r.get(c)) for r in rows], dtype=object) for c in columns]
+    if not parts:
+        return pd.Series([""] * len(rows), dtype=object)
+    return parts[0].str.cat(parts[1:], sep=" ").str.lower() if len(parts) > 1 else parts[0].str.lower()
+
+
+def _rows_fingerprint(rows: List[Dict[str, Any]]) -> Optional[str]:
+    """행 dict 리스트의 내용 해시 (JSON 인코딩 한 번). 인코딩이 안 되면 None."""
+    try:
+        return hashlib.blake2b(json_dumps(rows, str), digest_size=16).hexdigest()
+    except Exception:
+        return None
+
+
+def _search_index_cached(source: Any, rows: List[Dict[str, Any]], columns: List[str]) -> _SearchIndex:
+    """DataFrame 입력이면 frame fingerprint, 아니면 행 내용 해시 기준으로 LRU 캐시.
+
+    hit 이면 행 텍스트(_joined_text)를 만들지 않음.
+    """
+    fp = _frame_fingerprint(source) if isinstance(source, pd.DataFrame) else _rows_fingerprint(rows)
+    key = None if fp is None else (fp, tuple(columns))
+    if key is not None:
+        hit = _search_cache.get(key)
+        if hit is not None:
+            return hit
+    index = _SearchIndex([_joined_text(rows, columns)], len(rows))
+    if key is not None:
+        _search_cache.put(key, index, index.nbytes)
+    return index
+
+
+def _search_rows(
+    source: Any,
+    rows: List[Dict[str, Any]],
+    columns: List[str],
+    query: str,
+    filters: Dict[str, List[str]],
+) -> Optional[List[int]]:
+    """검색어(AND) + 필터 -> 매칭 원본 행 번호. 검색/필터가 없으면 None."""
+    terms = _search_terms(query)
+    active = {c: set(map(str, v)) for c, v in (filters or {}).items() if v}
+    if not terms and not active:
+        return None
+    mask = np.ones(len(rows), dtype=bool)
+    known = set(columns)
+    for col, wanted in active.items():
+        # 프론트 필터는 short 행 값 기준 — short 에 없는 컬럼은 "" 로 보임
+        values = [_js_text(r.get(col)) if col in known else "" for r in rows]
+        mask &= np.isin(np.array(values, dtype=object), list(wanted))
+    if terms and mask.any():
+        mask &= _search_index_cached(source, rows, columns).search(terms)
+    return np.flatnonzero(mask).tolist()
+
+
+def _last_value(key: Optional[str]) -> Dict[str, Any]:
+    """프론트가 마지막으로 보낸 값 (st.session_state[key])."""
+    if not key:
+        return {}
+    try:
+        last = st.session_state.get(key)
+    except Exception:
+        return {}
+    return last if isinstance(last, dict) else {}
+
+
+# ---------------------- tail 모드 ----------------------
+_TAIL_READ_MAX = 32 * 1024 * 1024    # rerun 한 번에 파일에서 읽는 최대 바이트
+_TAIL_ITEMS_MAX = 200_000            # rerun 한 번에 iterator/callable 에서 받는 최대 항목 수
+TAIL_MAX_ROWS = 100_000              # tail_max_rows 기본값: 이보다 많으면 오래된 행부터 버림
+
+TailSource = Union[str, "os.PathLike[str]", Iterable[Any], Callable[[int], Iterable[Any]]]
+TailParser = Callable[[str], Optional[Dict[str, Any]]]
+
+
+def _default_tail_parser(line: str) -> Optional[Dict[str, Any]]:
+    """JSON 객체 줄은 그대로, 나머지는 {"Message": line}. 빈 줄은 건너뜀."""
+    text = line.strip()
+    if not text:
+        return None
+    if text.startswith("{"):
+        try:
+            obj = json.loads(text)
+        except ValueError:
+            obj = None
+        if isinstance(obj, dict):
+            return obj
+    return {"Message": line}
+
+
+class _TailState:
+    """key 별 tail 커서 (st.session_state 에 보관).
+
+    파일: 읽은 byte offset + 아직 개행이 안 온 마지막 줄(pending) + inode
+    + 읽은 구간의 anchor_digest (앞/뒤 바이트 해시 — 제자리에서 다시 쓰였는지 확인용).
+    iterator/callable: 받은 항목 수가 커서.
+    rows 는 최근 파싱한 행 (최대 tail_max_rows 개), dropped 는 앞에서 버린 행 수.
+    sent/base/held 는 버린 행까지 센 절대 위치 (rows[0] 의 위치 = dropped).
+    """
+
+    def __init__(self, source_id: str) -> None:
+        self.source_id = source_id
+        self.restart()
+
+    def restart(self) -> None:
+        self.session = os.urandom(6).hex()
+        self.offset = 0
+        self.inode: Optional[int] = None
+        self.anchor = b""
+        self.pending = b""
+        self.iterator: Any = None
+        self.consumed = 0
+        self.rows: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self.sent = 0
+        self.resync_id: Any = None
+
+
+def _tail_source_id(source: Any) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        return "path:" + os.path.abspath(os.fspath(source))
+    return "callable" if callable(source) else "iter"
+
+
+def _tail_read_file(state: _TailState, path: str, encoding: str) -> List[str]:
+    """마지막 offset 이후의 새 바이트만 읽어 완성된 줄만 돌려줌."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return []
+    if state.inode is not None and (stat.st_ino != state.inode or stat.st_size < state.offset):
+        state.restart()  # 로테이션/truncate -> 처음부터 (새 session 이라 프론트도 버퍼를 비움)
+    state.inode = stat.st_ino
+    if stat.st_size <= state.offset:
+        return []
+    with open(path, "rb") as f:
+        # copytruncate 뒤 예전 크기를 넘게 다시 쓰인 파일도 같은 inode + 더 큼 → 읽은 구간이 그대로인지 확인
+        if state.offset and _anchor_digest(f, state.offset) != state.anchor:
+            state.restart()
+            state.inode = stat.st_ino
+        f.seek(state.offset)
+        chunk = f.read(_TAIL_READ_MAX)
+        state.offset += len(chunk)
+        state.anchor = _anchor_digest(f, state.offset)
+    lines = (state.pending + chunk).split(b"\n")
+    state.pending = lines.pop()
+    return [line.rstrip(b"\r").decode(encoding, errors="replace") for line in lines]
+
+
+def _tail_items(state: _TailState, source: Any, encoding: str) -> List[Any]:
+    if isinstance(source, (str, os.PathLike)):
+        return _tail_read_file(state, os.fspath(source), encoding)
+    if callable(source):
+        items = list(islice(source(state.consumed), _TAIL_ITEMS_MAX))
+    else:
+        # generator/iterator 는 처음 받은 것을 계속 소비 (rerun 마다 새로 만들어도 무시)
+        if state.iterator is None:
+            state.iterator = iter(source)
+        items = list(islice(state.iterator, _TAIL_ITEMS_MAX))
+    state.consumed += len(items)
+    return items
+
+
+def _tail_update(
+    key: str, source: TailSource, parser: TailParser, encoding: str, max_rows: Optional[int] = TAIL_MAX_ROWS
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """새로 들어온 줄만 파싱해 state 에 붙이고, 프론트에 보낼 delta 를 만듦.
+
+    -> ({"session", "start", "base", "rows"}, 남아 있는 행). 프론트는 base 위치에 rows 를
+    이어 붙이고 start 앞의 행을 버림 (max_rows 를 넘겨 Python 이 버린 행).
+    """
+    state_key = f"__log_viewer_tail__{key}"
+    source_id = _tail_source_id(source)
+    state = st.session_state.get(state_key)
+    if not isinstance(state, _TailState) or state.source_id != source_id:
+        state = _TailState(source_id)
+        st.session_state[state_key] = state
+
+    # 프론트 버퍼가 끊겼으면(리마운트, 놓친 rerun) 프론트가 가진 행 수부터 다시 보냄
+    resync = _last_value(key).get("tail_resync")
+    if isinstance(resync, dict) and resync.get("session") == state.session and resync.get("id") != state.resync_id:
+        state.resync_id = resync.get("id")
+        try:
+            held = int(resync.get("held") or 0)
+        except (TypeError, ValueError):
+            held = 0
+        state.sent = max(0, min(held, state.sent))
+
+    for item in _tail_items(state, source, encoding):
+        row = item if isinstance(item, dict) else parser(str(item))
+        if row is not None:
+            state.rows.append({str(k): _clean_value(v) for k, v in row.items()})
+    if max_rows is not None and len(state.rows) > max(1, max_rows):
+        drop = len(state.rows) - max(1, max_rows)
+        del state.rows[:drop]
+        state.dropped += drop
+
+    # 프론트가 버린 구간 안에 있으면 남은 창의 처음부터 다시 보냄
+    base = max(state.sent, state.dropped)
+    state.sent = state.dropped + len(state.rows)
+    delta = {
+        "session": state.session,
+        "start": state.dropped,
+        "base": base,
+        "rows": state.rows[base - state.dropped :],
+    }
+    return delta, state.rows
+
+
+LogData = Union[pd.DataFrame, List[Dict[str, Any]], Dict[str, List[Any]]]
+
+
+# ---------------------- JSON bytes (json_bytes=True) ----------------------
+ENCODED_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_encoded_cache = _PayloadCache(ENCODED_CACHE_MAX_BYTES)
+
+
+def _json_default(v: Any) -> Any:
+    if isinstance(v, np.ndarray):
+        return v.tolist()
+    v = _clean_value(v)
+    return v if isinstance(v, (*_PLAIN_TYPES, type(None), list, dict)) else str(v)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json_dumps(obj, _json_default)
+
+
+def _encode_tables_cached(build: Callable[[], Dict[str, Any]], sources: List[Any], variant: Any) -> bytes:
+    """테이블 인자들을 JSON bytes 로. 원본이 모두 DataFrame 이면 fingerprint 기준으로 재사용
+    (hit 이면 columnar 변환/인코딩 모두 건너뜀)."""
+    fps = [_frame_fingerprint(src) if isinstance(src, pd.DataFrame) else None for src in sources]
+    if not fps or None in fps:
+        return _json_dumps(build())
+    key = (tuple(fps), variant)
+    hit = _encoded_cache.get(key)
+    if hit is not None:
+        return hit
+    raw = _json_dumps(build())
+    _encoded_cache.put(key, raw, len(raw))
+    return raw
+
+
+def log_viewer(
+    dict_log_short: Optional[LogData] = None,
+    dict_log_detail: Optional[LogData] = None,
+    left_title: str = "Simple Log",
+    right_title: str = "Detail Log",
+    height: int = 560,
+    initial_index: Optional[int] = 0,
+    search_placeholder: str = "Search",
+    # 디자인/동작 옵션
+    accent_color: str = "#4F8CF7",
+    zebra: bool = True,
+    density: str = "compact",            # "compact" | "comfortable"
+    width: Union[int, str] = "100%",
+    left_width: Optional[Union[int, str]] = None,
+    right_width: Optional[Union[int, str]] = None,
+    filter_columns: Optional[List[str]] = None,
+    highlight_rules: Optional[Dict[str, Dict[str, Any]]] = None,
+    highlight_background: Optional[Dict[str, Dict[str, str]]] = None,
+    nav_buttons: bool = False,
+    nav_column: str = "Level",
+    nav_terms: Optional[Dict[str, str]] = None,
+    buttons: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    wire_format: str = "records",        # "records" | "columnar"
+    # shared-row 모드: 한 테이블(log_rows)만 보내고 short 뷰는 short_columns 로 프론트에서 투영
+    log_rows: Optional[LogData] = None,
+    short_columns: Optional[List[str]] = None,
+    # 검색/필터를 Python 역색인으로 처리하고 행 번호만 전송 (key 필요)
+    search_index: bool = False,
+    # tail 모드: 파일 경로 / generator / callable(cursor) 에서 새로 들어온 줄만 읽어
+    # 프론트에 덧붙임 (key 필요). 행은 tail_parser(line) -> dict (None 이면 건너뜀)
+    tail_source: Optional[TailSource] = None,
+    tail_parser: Optional[TailParser] = None,
+    tail_encoding: str = "utf-8",
+    tail_max_rows: Optional[int] = TAIL_MAX_ROWS,  # 최근 N 행만 유지 (None 이면 무제한)
+    # 테이블 인자를 미리 인코딩한 JSON bytes 하나로 전송 (orjson 있으면 사용, 내용 기준 캐시)
+    json_bytes: bool = False,
+    key: Optional[str] = None,
+) -> Dict[str, Any]:
+    if wire_format not in ("records", "columnar"):
+        raise ValueError(f"[log_viewer] wire_format must be 'records' or 'columnar': {wire_format!r}")
+
+    tail = None
+    shared = log_rows is not None or tail_source is not None
+    if tail_source is not None:
+        if not key:
+            raise ValueError("[log_viewer] tail_source 를 쓰려면 key 가 필요합니다")
+        tail, detail_rows = _tail_update(
+            key, tail_source, tail_parser or _default_tail_parser, tail_encoding, tail_max_rows
+        )
+        if not short_columns:
+            short_columns = _columns_of(detail_rows[:1])
+        short_rows = None
+        row_count = len(detail_rows)
+    elif shared:
+        if not short_columns:
+            raise ValueError("[log_viewer] log_rows 를 쓰려면 short_columns 가 필요합니다")
+        detail_rows = _to_records_safe(log_rows)
+        known = set(detail_rows[0]) if detail_rows else set()
+        missing = [c for c in short_columns if detail_rows and c not in known]
+        if missing:
+            raise ValueError(f"[log_viewer] short_columns 가 log_rows 에 없습니다: {missing}")
+        short_rows: Optional[List[Dict[str, Any]]] = None
+        row_count = len(detail_rows)
+    else:
+        if dict_log_short is None or dict_log_detail is None:
+            raise ValueError("[log_viewer] dict_log_short/dict_log_detail 또는 log_rows 가 필요합니다")
+        short_rows = _to_records_safe(dict_log_short)
+        detail_rows = _to_records_safe(dict_log_detail)
+        if len(short_rows) != len(detail_rows):
+            raise ValueError(
+                f"[log_viewer] 길이 불일치: short({len(short_rows)}) != detail({len(detail_rows)})"
+            )
+        row_count = len(short_rows)
+
+    safe_initial = None
+    if row_count > 0 and (initial_index is not None) and 0 <= initial_index < row_count:
+        safe_initial = initial_index
+
+    def _short_at(i: int) -> Dict[str, Any]:
+        if short_rows is not None:
+            return short_rows[i]
+        row = detail_rows[i]
+        return {c: row.get(c) for c in short_columns or []}
+
+    default_payload = {
+        "selected_index": safe_initial,
+        "selected_short": _short_at(safe_initial) if safe_initial is not None else None,
+        "selected_detail": detail_rows[safe_initial] if safe_initial is not None else None,
+        "query": "",
+        "active_filters": {},
+    }
+
+    # Merge highlight rules with highlight_background mapping (column -> term -> color)
+    merged_rules: Dict[str, Dict[str, Any]] = {}
+    if highlight_rules:
+        merged_rules.update(highlight_rules)
+    if highlight_background:
+        idx = 0
+        for col, mapping in highlight_background.items():
+            if isinstance(mapping, dict):
+                for term, color in mapping.items():
+                    merged_rules[f"hb_{col}_{idx}"] = {
+                        "terms": [str(term)],
+                        "bg": color,
+                        "columns": [col],
+                    }
+                    idx += 1
+
+    # 룰 매칭은 여기서 한 번만 (short 컬럼 기준) — 프론트는 칠하기만
+    short_cols = list(short_columns or []) if shared else _columns_of(short_rows or [])
+    source_rows = detail_rows if shared else (short_rows or [])
+    specs = _jump_specs(buttons, nav_buttons, nav_column, nav_terms or {"warn": "WARN", "error": "ERROR"})
+    # tail 모드는 전체 행 기준 인덱스를 매번 보내지 않음 — 프론트가 스캔으로 처리
+    column_values = (
+        {c: [r.get(c) for r in source_rows] for c in short_cols}
+        if (merged_rules or specs) and tail is None
+        else {}
+    )
+    highlight_index = (
+        _compile_highlight_rules(short_cols, column_values, row_count, merged_rules) if tail is None else None
+    )
+    # 점프 버튼: 매칭 행 위치를 미리 계산 -> 프론트는 이진 탐색만
+    jump_index = (
+        _jump_index_cached(log_rows if shared else dict_log_short, column_values, row_count, specs)
+        if specs and tail is None
+        else None
+    )
+
+    # search_index: 프론트가 마지막으로 보낸 query/active_filters 를 역색인으로 계산
+    use_search_index = bool(search_index and key and tail is None)
+    search_result = None
+    if use_search_index:
+        last = _last_value(key)
+        query = str(last.get("query") or "")
+        filters = last.get("active_filters") if isinstance(last.get("active_filters"), dict) else {}
+        found = _search_rows(log_rows if shared else dict_log_short, source_rows, short_cols, query, filters)
+        if found is not None:
+            search_result = {"query": query, "filters": filters, "rows": found}
+
+    # columnar: 행마다 컬럼명을 반복하지 않도록 column-major 로 전송
+    columnar = wire_format == "columnar"
+
+    def _tables() -> Dict[str, Any]:
+        tables: Dict[str, Any] = {}
+        if tail is not None:
+            tables["tail"] = tail
+            tables["short_columns"] = list(short_columns or [])
+        elif shared:
+            tables["shared_rows"] = None if columnar else detail_rows
+            tables["shared_table"] = _records_to_columnar(detail_rows) if columnar else None
+            tables["short_columns"] = list(short_columns or [])
+        else:
+            tables["short_rows"] = None if columnar else short_rows
+            tables["detail_rows"] = None if columnar else detail_rows
+            tables["short_table"] = _records_to_columnar(short_rows or []) if columnar else None
+            tables["detail_table"] = _records_to_columnar(detail_rows) if columnar else None
+        return tables
+
+    if json_bytes:
+        # tail 은 매번 바뀌므로 캐시 없이 인코딩만
+        if tail is not None:
+            sources: List[Any] = []
+        elif shared:
+            sources = [log_rows]
+        else:
+            sources = [dict_log_short, dict_log_detail]
+        variant = (wire_format, tuple(short_columns or ()) if shared else None)
+        tables = {"payload_json": _encode_tables_cached(_tables, sources, variant)}
+    else:
+        tables = _tables()
+    component_value = _component_func(
+        **tables,
+        left_title=left_title,
+        right_title=right_title,
+        height=height,
+        initial_index=safe_initial,
+        search_placeholder=search_placeholder,
+        accent_color=accent_color,
+        zebra=zebra,
+        density=density,
+        width=width,
+        left_width=left_width,
+        right_width=right_width,
+        filter_columns=filter_columns or [],
+        highlight_rules=merged_rules,
+        highlight_index=highlight_index,
+        jump_index=jump_index,
+        search_index=use_search_index,
+        search_result=search_result,
+        nav_buttons=nav_buttons,
+        nav_column=nav_column,
+        nav_terms=nav_terms or {"warn": "WARN", "error": "ERROR"},
+        buttons=buttons,
+        key=key,
+        default=default_payload,
+    )
+    return component_value
+
+
+if __name__ == "__main__":
+    import streamlit as st
+
+    st.set_page_config(
+    page_title="내 앱",
+    layout="wide",  # 👉 넓게 펼치는 옵션
+    initial_sidebar_state="expanded"
+)
+
+    st.title("log_viewer (Light UI + Expanding Search)")
+
+    short = [
+        {"Timestamp": "2024-01-26 10:00:00", "Level": "INFO",  "Message": "System started successfully"},
+        {"Timestamp": "2024-01-26 10:05:00", "Level": "WARNING","Message": "Low disk space"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+        {"Timestamp": "2024-01-26 10:15:00", "Level": "INFO",  "Message": "User logged in"},
+        {"Timestamp": "2024-01-26 10:20:00", "Level": "DEBUG", "Message": "Processing request"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR", "Message": "Failed to connect to database"},
+
+    ]
+    detail = [
+        {"Timestamp": "2024-01-26 10:00:00", "Level": "INFO",   "Message": "System started successfully", "Source":"System","User":"-" },
+        {"Timestamp": "2024-01-26 10:05:00", "Level": "WARNING","Message": "Low disk space",              "Source":"Disk Monitor","User":"System"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+        {"Timestamp": "2024-01-26 10:15:00", "Level": "INFO",   "Message": "User logged in",              "Source":"Web","User":"admin"},
+        {"Timestamp": "2024-01-26 10:20:00", "Level": "DEBUG",  "Message": "Processing request",          "Source":"API","User":"-"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+        {"Timestamp": "2024-01-26 10:10:00", "Level": "ERROR",  "Message": "Failed to connect to database","Source":"DB","User":"System"},
+
+    ]
+
+    rules = {
+        "warn":  {"terms": ["low disk"], "bg": "rgba(255,211,105,0.18)", "columns": ["Message"]},
+        "error": {"terms": ["failed", "database"], "bg": "rgba(255,134,134,0.18)"},
+    }
+
+    # New: highlight_background maps column -> { term -> color }
+    highlight_bg = {
+        "Level": {
+            "WARNING": "rgba(255,211,105,0.18)",
+            "ERROR": "rgba(255,134,134,0.18)",
+        },
+        "Message": {
+            "logged in": "rgba(91,191,114,0.20)",
+        },
+    }
+
+    # Dynamic buttons: label -> { column -> [terms] }
+    buttons = {
+        "Go ERROR": {
+            "Level": ["ERROR"],
+        },
+        "Go warn": {
+            "Level": ["WARN", "WARNING"],
+        },
+    }
+
+    st.write(log_viewer(
+        dict_log_short=short,
+        dict_log_detail=detail,
+        left_title="Simple Log (Demo)",
+        right_title="Detail Log (Demo)",
+        height=400,
+        initial_index=0,
+        search_placeholder="Search logs...",
+        accent_color="#4F8CF7",
+        zebra=True,
+        density="compact",
+        width="100%",              # or a number like 1200
+        left_width=1.2,             # or "700px"
+        right_width=1,              # or "1fr"
+        filter_columns=["Level", "Message"],
+        highlight_rules=rules,      # existing rules still supported
+        highlight_background=highlight_bg,  # new background mapping
+        nav_buttons=True,
+        nav_column="Level",
+        nav_terms={"warn": "WARNING", "error": "ERROR"},
+        buttons=buttons,
+        key="demo",
+    ))
@@ -0,0 +1,96 @@
+"""
+redis_batch 테스트 (fakeredis 가 없으면 건너뜀, Lua 는 lupa 필요)
+
+python -m pytest backend/test_redis_batch.py
+"""
+
+import asyncio
+
+import pytest
+
+aioredis = pytest.importorskip("fakeredis.aioredis")
+
+from backend.redis_batch import RedisBatcher, RedisGate  # noqa: E402
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_commands_share_one_pipeline():
+    async def main():
+        r = aioredis.FakeRedis()
+        b = RedisBatcher(r, max_batch=64, max_delay_us=1000)
+        res = await asyncio.gather(*(b.execute("SET", f"k{i}", i) for i in range(10)))
+        vals = await asyncio.gather(*(b.execute("GET", f"k{i}") for i in range(10)))
+        await b.aclose()
+        return res, vals, b.stats()
+
+    res, vals, stats = _run(main())
+    assert res == [True] * 10
+    assert vals == [str(i).encode() for i in range(10)]
+    assert stats["batches"] == 2 and stats["commands"] == 20
+
+
+def test_flush_on_max_batch():
+    async def main():
+        r = aioredis.FakeRedis()
+        b = RedisBatcher(r, max_batch=4, max_delay_us=10_000_000)  # 타이머로는 안 나감
+        await asyncio.wait_for(asyncio.gather(*(b.execute("PING") for _ in range(8))), 1.0)
+        return b.stats()
+
+    assert _run(main())["batches"] == 2
+
+
+def test_command_error_only_fails_its_caller():
+    async def main():
+        r = aioredis.FakeRedis()
+        b = RedisBatcher(r)
+        return await asyncio.gather(b.execute("NOSUCHCMD"), b.execute("PING"), return_exceptions=True)
+
+    bad, ok = _run(main())
+    assert isinstance(bad, Exception)
+    assert ok is True
+
+
+def test_queueing_error_only_fails_its_caller():
+    async def main():
+        r = aioredis.FakeRedis()
+        b = RedisBatcher(r)
+
+        def broken(pipe):
+            pipe.execute_command("SET", "half", "1")  # 쌓다가 실패 → 이 명령은 버려져야 함
+            raise ValueError("bad op")
+
+        return await asyncio.gather(
+            b.execute("SET", "a", "1"), b.submit(broken), b.execute("GET", "a"), return_exceptions=True
+        ), await r.exists("half")
+
+    (first, bad, got), half = _run(main())
+    assert first is True
+    assert isinstance(bad, ValueError)
+    assert got == b"1"
+    assert half == 0
+
+
+def test_gate_and_rate_limit_script():
+    pytest.importorskip("lupa")
+
+    async def main():
+        r = aioredis.FakeRedis()
+        g = RedisGate(r, batcher=RedisBatcher(r, max_delay_us=200), window_sec=10, limit=3, ban_sec=5)
+        closed = await g.check("u", "user:u")
+        await g.set_ready("u", 600)
+        ready = await g.is_ready("u")
+        res = await asyncio.gather(*(g.check("u", "user:u") for _ in range(5)))
+        await r.script_flush()  # NOSCRIPT → 파이프라인이 스크립트를 다시 로드
+        again = await g.check("other", "user:other")
+        return closed, ready, res, again
+
+    closed, ready, res, again = _run(main())
+    assert closed == (False, 0.0)
+    assert ready
+    assert [retry for _, retry in res[:3]] == [0.0] * 3
+    assert res[3] == (True, 5.0)
+    assert 0 < res[4][1] <= 5.0
+    assert again == (False, 0.0)
@@ -0,0 +1,476 @@
+"""
+유저별 게이트 저장소 (main.py 의 set_user_ready / is_user_ready 백엔드)
+
+- 만료 시각은 time.monotonic() float — 요청마다 datetime 생성/비교 없음
+- 만료 정리는 타이머 휠: 키를 만료 tick 슬롯에 넣고, 접근 시 지나간 슬롯만 비움
+  → 요청당 상각 O(1), 만료된 키는 dict 에 남지 않음
+- max_keys 초과 시 가장 먼저 만료될 키부터 밀어냄 (메모리 상한)
+- stats(): live / expired / evicted 카운터 (/health 등에 노출)
+
+백엔드 교체: GATE_STORE 환경변수 → get_gate_store()
+- "memory": 프로세스 내 타이머 휠 (워커 간 공유 X)
+- "shm":    같은 호스트의 모든 uvicorn 워커가 공유하는 mmap 해시 테이블 (Redis 없이)
+- "redis":  SETEX/TTL (여러 호스트). 기본으로 워커별 near-cache 를 앞에 둠 (GATE_NEAR_CACHE=0 이면 끔)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Protocol, Set
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: shm 백엔드 사용 불가
+    fcntl = None  # type: ignore[assignment]
+
+log = logging.getLogger("gate")
+
+
+class GateStore(Protocol):
+    """게이트 백엔드 인터페이스 — 새 백엔드는 이 세 메서드만 구현하면 됨"""
+
+    def set_ready(self, user_id: str, ttl_sec: float) -> None: ...
+
+    def is_ready(self, user_id: str) -> bool: ...
+
+    def stats(self) -> Dict[str, int]: ...
+
+
+class MemoryGateStore:
+    """단일 프로세스용 TTL 저장소 (타이머 휠)
+
+    슬롯 수 = ceil(max_ttl / tick) + 1 이라 휠 한 바퀴가 최대 TTL 보다 길다.
+    → 이미 지나간 tick 의 슬롯에 있는 키는 전부 만료 (만료 시각 재확인 불필요).
+    현재 tick 안에서 만료된 키는 is_ready 의 exp > now 비교로 걸러짐.
+    """
+
+    def __init__(
+        self,
+        max_ttl_sec: float = 600.0,
+        *,
+        tick_sec: float = 1.0,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_ttl = float(max_ttl_sec)
+        self.tick = float(tick_sec)
+        self.max_keys = int(max_keys)
+        self._clock = clock
+        self._expiry: Dict[str, float] = {}
+        self._slot_of: Dict[str, int] = {}
+        self._slots: List[Set[str]] = [set() for _ in range(math.ceil(self.max_ttl / self.tick) + 1)]
+        self._swept = int(clock() // self.tick)  # 이 tick 이전 슬롯은 비워진 상태
+        self._evict_from = self._swept  # 이 tick 이전엔 키가 없음 (밀어내기 탐색 시작점)
+        self._lock = threading.Lock()
+        self.expired = 0
+        self.evicted = 0
+
+    # -- 내부 --
+    def _sweep(self, now: float) -> None:
+        """지나간 tick 슬롯 비우기 — 슬롯당 한 번이라 상각 O(1)"""
+        cur = int(now // self.tick)
+        if cur <= self._swept:
+            return
+        n = len(self._slots)
+        # 한 바퀴 이상 쉬었으면 모든 슬롯이 지나간 것 — 각 슬롯을 한 번씩만
+        for t in range(self._swept, min(cur, self._swept + n)):
+            bucket = self._slots[t % n]
+            if not bucket:
+                continue
+            for uid in bucket:
+                del self._expiry[uid]
+                del self._slot_of[uid]
+            self.expired += len(bucket)
+            bucket.clear()
+        self._swept = cur
+
+    def _evict_soonest(self) -> None:
+        """휠을 돌며 처음 만나는 키 (= 가장 먼저 만료될 키, tick 정밀도)"""
+        n = len(self._slots)
+        start = max(self._swept, self._evict_from)
+        for t in range(start, self._swept + n):
+            bucket = self._slots[t % n]
+            if bucket:
+                uid = bucket.pop()  # set.pop 은 상각 O(1) (next(iter(set)) 는 삭제 흔적을 다시 훑음)
+                del self._expiry[uid]
+                del self._slot_of[uid]
+                self.evicted += 1
+                self._evict_from = t
+                return
+
+    # -- GateStore --
+    def set_ready(self, user_id: str, ttl_sec: float) -> None:
+        """지금부터 ttl_sec 동안 열기 (리셋). max_ttl 보다 긴 TTL 은 max_ttl 로 자름"""
+        now = self._clock()
+        exp = now + min(float(ttl_sec), self.max_ttl)
+        exp_tick = int(exp // self.tick)
+        slot = exp_tick % len(self._slots)
+        with self._lock:
+            self._sweep(now)
+            self._evict_from = min(self._evict_from, exp_tick)
+            old = self._slot_of.get(user_id)
+            if old is None and len(self._expiry) >= self.max_keys:
+                self._evict_soonest()
+            elif old is not None and old != slot:
+                self._slots[old].discard(user_id)
+            self._expiry[user_id] = exp
+            self._slot_of[user_id] = slot
+            self._slots[slot].add(user_id)
+
+    def is_ready(self, user_id: str) -> bool:
+        now = self._clock()
+        with self._lock:
+            self._sweep(now)
+            exp = self._expiry.get(user_id)
+        return exp is not None and exp > now
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._sweep(self._clock())
+            return {
+                "live": len(self._expiry),
+                "expired": self.expired,
+                "evicted": self.evicted,
+                "max_keys": self.max_keys,
+            }
+
+
+_SHM_MAGIC = b"GATESHM1"
+_SHM_HEADER = struct.Struct("<8sQQ")  # magic, slot 수, evicted
+_SHM_BODY = 32  # 헤더 영역 (슬롯 배열은 8바이트 정렬된 이 오프셋부터)
+_SHM_PROBE_MAX = 32
+
+
+def _shm_dir() -> str:
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def _key_hash(user_id: str) -> int:
+    """프로세스와 무관한 64비트 해시 (0 = 빈 슬롯이라 제외). Python hash() 는 프로세스마다 달라 못 씀"""
+    h = int.from_bytes(hashlib.blake2b(user_id.encode("utf-8"), digest_size=8).digest(), "little")
+    return h or 1
+
+
+class SharedMemoryGateStore:
+    """한 호스트의 여러 워커가 공유하는 게이트 (mmap 된 /dev/shm 파일, open addressing 해시 테이블)
+
+    슬롯 = (user_id 해시 u64, 만료 monotonic f64) 16바이트. monotonic 시계는 같은 호스트의
+    모든 프로세스에 공통이라 만료 시각을 그대로 공유할 수 있음.
+    - 읽기(is_ready): 락 없음. 해시 → 만료 → 해시 순으로 읽어 그 사이 슬롯이 바뀌었으면 다시 읽음
+    - 쓰기(set_ready, /signal/ready 때만): 파일 flock 으로 프로세스 간 직렬화
+    - 슬롯은 비우지 않음 (탐색 체인 유지). 새 키는 탐색 구간의 만료된 슬롯을 재사용하고,
+      구간이 다 살아 있으면 가장 먼저 만료될 슬롯을 밀어냄 → 메모리는 slots*16 바이트 고정
+    """
+
+    def __init__(
+        self,
+        name: str = "gate",
+        *,
+        slots: int = 1 << 18,
+        path: Optional[str] = None,
+        max_ttl_sec: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("SharedMemoryGateStore 는 POSIX(fcntl) 전용")
+        self.path = path or os.path.join(_shm_dir(), f"{name}.gate")
+        self.max_ttl = float(max_ttl_sec)
+        self._clock = clock
+        self._lock = threading.Lock()  # 같은 프로세스 안 스레드끼리 (flock 은 프로세스 단위)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        want = 1 << max(4, (int(slots) - 1).bit_length())  # 2의 거듭제곱
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            head = os.pread(self._fd, _SHM_HEADER.size, 0)
+            if len(head) == _SHM_HEADER.size and head[:8] == _SHM_MAGIC:
+                want = _SHM_HEADER.unpack(head)[1]  # 먼저 뜬 워커가 정한 크기를 따름
+            else:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, _SHM_BODY + want * 16)
+                os.pwrite(self._fd, _SHM_HEADER.pack(_SHM_MAGIC, want, 0), 0)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self.slots = want
+        self._mask = want - 1
+        self._mm = mmap.mmap(self._fd, _SHM_BODY + want * 16)
+        body = memoryview(self._mm)[_SHM_BODY:]
+        self._keys = body.cast("Q")  # 짝수 인덱스 = 해시
+        self._exps = body.cast("d")  # 홀수 인덱스 = 만료 시각
+
+    def _read(self, i: int) -> tuple:
+        keys, exps = self._keys, self._exps
+        while True:
+            h = keys[2 * i]
+            exp = exps[2 * i + 1]
+            if keys[2 * i] == h:
+                return h, exp
+
+    def _find(self, h: int) -> Optional[float]:
+        i = h & self._mask
+        for _ in range(_SHM_PROBE_MAX):
+            slot_h, exp = self._read(i)
+            if slot_h == h:
+                return exp
+            if slot_h == 0:
+                return None
+            i = (i + 1) & self._mask
+        return None
+
+    # -- GateStore --
+    def set_ready(self, user_id: str, ttl_sec: float) -> None:
+        h = _key_hash(user_id)
+        now = self._clock()
+        exp = now + min(float(ttl_sec), self.max_ttl)
+        keys, exps = self._keys, self._exps
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                i = h & self._mask
+                reuse = -1
+                soonest = -1
+                for _ in range(_SHM_PROBE_MAX):
+                    slot_h = keys[2 * i]
+                    if slot_h == h:
+                        exps[2 * i + 1] = exp
+                        return
+                    if slot_h == 0:
+                        break
+                    slot_exp = exps[2 * i + 1]
+                    if reuse < 0 and slot_exp <= now:
+                        reuse = i
+                    if soonest < 0 or slot_exp < exps[2 * soonest + 1]:
+                        soonest = i
+                    i = (i + 1) & self._mask
+                else:
+                    i = -1  # 탐색 구간에 빈 슬롯 없음
+                if reuse >= 0:
+                    i = reuse
+                elif i < 0:
+                    i = soonest
+                    self._bump_evicted()
+                # 해시 먼저 바꾸고 만료를 씀 — 읽는 쪽은 해시 재확인으로 찢어진 값을 버림
+                keys[2 * i] = h
+                exps[2 * i + 1] = exp
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _bump_evicted(self) -> None:
+        magic, slots, evicted = _SHM_HEADER.unpack_from(self._mm, 0)
+        _SHM_HEADER.pack_into(self._mm, 0, magic, slots, evicted + 1)
+
+    def is_ready(self, user_id: str) -> bool:
+        exp = self._find(_key_hash(user_id))
+        return exp is not None and exp > self._clock()
+
+    def stats(self) -> Dict[str, int]:
+        now = self._clock()
+        live = expired = 0
+        # 전체 스캔 (/health 용) — 슬라이스 tolist 로 한 번에 꺼냄
+        for h, exp in zip(self._keys[0::2].tolist(), self._exps[1::2].tolist()):
+            if h:
+                if exp > now:
+                    live += 1
+                else:
+                    expired += 1
+        evicted = _SHM_HEADER.unpack_from(self._mm, 0)[2]
+        return {"live": live, "expired": expired, "evicted": evicted, "slots": self.slots}
+
+    def close(self) -> None:
+        self._keys.release()
+        self._exps.release()
+        self._mm.close()
+        os.close(self._fd)
+
+
+class RedisGateStore:
+    """SETEX/TTL 게이트 (여러 호스트). client 는 redis-py 동기 클라이언트 (fakeredis 도 가능)"""
+
+    def __init__(self, client: Any, *, prefix: str = "ready:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def set_ready(self, user_id: str, ttl_sec: float) -> None:
+        # 항상 '지금부터 TTL' 로 리셋 (연장 누적 X)
+        self.client.setex(self.prefix + user_id, int(math.ceil(ttl_sec)), "1")
+
+    def is_ready(self, user_id: str) -> bool:
+        # -2: 키 없음, -1: TTL 없음(무기한) → 둘 다 닫힘
+        ttl = self.client.ttl(self.prefix + user_id)
+        return ttl is not None and ttl > 0
+
+    def stats(self) -> Dict[str, int]:
+        live = sum(1 for _ in self.client.scan_iter(match=self.prefix + "*", count=1000))
+        return {"live": live}
+
+
+class NearCacheRedisGateStore(RedisGateStore):
+    """RedisGateStore + 워커별 near-cache
+
+    - is_ready: Redis 가 준 만료 시각(절대, monotonic)을 로컬 dict 에 두고 지날 때까지 로컬 응답
+      → 게이트가 열린 유저는 만료 전까지 Redis 왕복 없음
+    - 닫힌 유저도 negative_ttl_sec 동안 캐시 (signal_ready 가 pub/sub 로 즉시 무효화)
+    - set_ready: SETEX + PUBLISH(channel, user_id) 한 파이프라인 → 모든 워커가 해당 유저 항목 삭제
+    - 구독 스레드가 끊겨 있는 동안은 캐시를 비우고 매번 Redis 직접 조회 (무효화 유실 방지)
+
+    열린 게이트를 닫는 API 는 없으므로(리셋은 연장만) positive 항목은 무효화 없이도 안전하고,
+    무효화가 필요한 건 '닫힘 → 열림' 으로 바뀐 negative 항목뿐.
+    (pub/sub 전달 지연만큼은 다른 워커가 잠깐 닫힘으로 볼 수 있음 — 보통 ms 미만)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = "ready:",
+        channel: str = "gate:ready",
+        negative_ttl_sec: float = 5.0,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(client, prefix=prefix)
+        self.channel = channel
+        self.negative_ttl = float(negative_ttl_sec)
+        self.max_keys = int(max_keys)
+        self._clock = clock
+        self._local: Dict[str, tuple] = {}  # user_id -> (ready, 이 시각까지 유효)
+        self._lock = threading.Lock()
+        self._gen = 0  # 무효화마다 +1 → 조회 도중 무효화되면 그 결과는 캐시하지 않음
+        self._live = False  # 구독 확인(subscribe 응답) 받은 뒤에만 True
+        self._stop = threading.Event()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._thread = threading.Thread(target=self._listen, name="gate-near-cache", daemon=True)
+        self._thread.start()
+
+    def _drop(self, user_id: Optional[str] = None) -> None:
+        with self._lock:
+            self._gen += 1
+            if user_id is None:
+                self._local.clear()
+            else:
+                self._local.pop(user_id, None)
+
+    def _listen(self) -> None:
+        backoff = 0.5
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub()
+                pubsub.subscribe(self.channel)
+                while not self._stop.is_set():
+                    msg = pubsub.get_message(timeout=1.0)
+                    if not msg:
+                        continue
+                    if msg["type"] == "subscribe":
+                        # 이 시점 이후 publish 는 놓치지 않음 → 그 전에 쌓인 캐시는 버리고 시작
+                        self._drop()
+                        self._live = True
+                        backoff = 0.5
+                    elif msg["type"] == "message":
+                        data = msg["data"]
+                        self.invalidations += 1
+                        self._drop(data.decode() if isinstance(data, bytes) else str(data))
+            except Exception as e:  # 연결 끊김 등 → 캐시 끄고 재구독
+                log.warning("gate near-cache: pubsub 끊김 (%s), %.1fs 후 재시도", e, backoff)
+            finally:
+                self._live = False
+                self._drop()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def set_ready(self, user_id: str, ttl_sec: float) -> None:
+        key = self.prefix + user_id
+        pipe = self.client.pipeline(transaction=False)
+        pipe.setex(key, int(math.ceil(ttl_sec)), "1")
+        pipe.publish(self.channel, user_id)
+        pipe.execute()
+
+    def is_ready(self, user_id: str) -> bool:
+        if not self._live:
+            return super().is_ready(user_id)
+        now = self._clock()
+        hit = self._local.get(user_id)
+        if hit is not None and now < hit[1]:
+            self.hits += 1
+            return hit[0]
+        self.misses += 1
+        gen = self._gen
+        # 요청 보내기 전 시각 + 남은 ms → 실제 만료보다 항상 이르거나 같음
+        ms = self.client.pttl(self.prefix + user_id)
+        ready = ms is not None and ms > 0
+        until = now + ms / 1000.0 if ready else now + self.negative_ttl
+        with self._lock:
+            if gen == self._gen and self._live:
+                self._local.pop(user_id, None)
+                if len(self._local) >= self.max_keys:
+                    # 가장 오래 전에 채운 항목부터 (dict 삽입 순서)
+                    self._local.pop(next(iter(self._local)))
+                self._local[user_id] = (ready, until)
+        return ready
+
+    def stats(self) -> Dict[str, int]:
+        out = super().stats()
+        out.update(
+            near_size=len(self._local),
+            near_hits=self.hits,
+            near_misses=self.misses,
+            near_invalidations=self.invalidations,
+            near_live=int(self._live),
+        )
+        return out
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+
+
+def make_gate_store(kind: Optional[str] = None, *, max_ttl_sec: Optional[float] = None) -> GateStore:
+    """GATE_STORE 값으로 백엔드 생성 ("memory" | "shm" | "redis")"""
+    kind = (kind or os.getenv("GATE_STORE", "memory")).strip().lower()
+    ttl = float(max_ttl_sec if max_ttl_sec is not None else os.getenv("READY_TTL_SEC", "600"))
+    if kind == "memory":
+        return MemoryGateStore(ttl, max_keys=int(os.getenv("GATE_MAX_KEYS", "100000")))
+    if kind == "shm":
+        return SharedMemoryGateStore(
+            os.getenv("GATE_SHM_NAME", "gate"),
+            slots=int(os.getenv("GATE_SHM_SLOTS", str(1 << 18))),
+            max_ttl_sec=ttl,
+        )
+    if kind == "redis":
+        import redis  # pip install "redis>=5"
+
+        client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+        if os.getenv("GATE_NEAR_CACHE", "1") == "0":
+            return RedisGateStore(client)
+        return NearCacheRedisGateStore(
+            client, negative_ttl_sec=float(os.getenv("GATE_NEAR_NEGATIVE_TTL", "5"))
+        )
+    raise ValueError(f"unknown GATE_STORE: {kind!r}")
+
+
+_default: Optional[GateStore] = None
+_default_lock = threading.Lock()
+
+
+def get_gate_store() -> GateStore:
+    """프로세스 공용 게이트 저장소 (처음 호출 시 생성)"""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = make_gate_store()
+    return _default
@@ -0,0 +1,60 @@
+import type { ShortLogJumpEntry } from "./types"
+
+// First position whose value is > x (arr sorted ascending)
+export function upperBound(arr: number[], x: number): number {
+  let lo = 0
+  let hi = arr.length
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1
+    if (arr[mid] <= x) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+// First position whose value is >= x (arr sorted ascending)
+export function lowerBound(arr: number[], x: number): number {
+  let lo = 0
+  let hi = arr.length
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1
+    if (arr[mid] < x) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+// Positions in the current view (view[i] = original row id, ascending) that a
+// precomputed jump entry hits. O(hits * log(view)) instead of a full scan.
+export function viewPositions(entry: ShortLogJumpEntry, view: number[]): number[] {
+  let pos: number[]
+  if (entry.rows == null) {
+    pos = view.map((_, i) => i)
+  } else {
+    pos = []
+    for (const id of entry.rows) {
+      const i = lowerBound(view, id)
+      if (i < view.length && view[i] === id) pos.push(i)
+    }
+  }
+  if (entry.filtered != null) {
+    const allowed = new Set(entry.filtered)
+    pos = pos.filter((i) => allowed.has(i))
+  }
+  return pos
+}
+
+// Next (or previous) hit relative to `cur`, wrapping around; null if none
+export function stepHit(
+  hits: number[],
+  cur: number,
+  dir: "next" | "prev"
+): number | null {
+  if (hits.length === 0) return null
+  if (dir === "prev") {
+    const i = lowerBound(hits, cur) - 1
+    return i >= 0 ? hits[i] : hits[hits.length - 1]
+  }
+  const i = upperBound(hits, cur)
+  return i < hits.length ? hits[i] : hits[0]
+}
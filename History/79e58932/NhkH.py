@@ -0,0 +1,100 @@
+"""
+벤치마크: 레이트리밋 처리량 / 메모리 (키 100k)
+
+python -m backend.bench_rate_limit               # 키 100k, 요청 500k
+python -m backend.bench_rate_limit 200000 1000000
+
+- deque : 예전 rate_limiter_middleware (키별 asyncio.Lock + deque + _ban_until, 정리 없음)
+- gcra  : RateLimiter (키당 float 하나, 두 세대 dict 로 유휴 키 정리)
+
+요청마다 async 함수 한 번 (미들웨어 안에서 도는 것과 같은 조건), 키는 무작위
+"""
+
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from typing import DefaultDict, Deque, Dict
+
+from backend.rate_limit import RateLimiter, RateRule
+
+WINDOW_SEC = 10.0
+LIMIT = 10
+BAN_SEC = 10.0
+
+
+class DequeLimiter:
+    """예전 구현 그대로 (HTTPException 대신 retry_after 반환)"""
+
+    def __init__(self) -> None:
+        self._request_qs: DefaultDict[str, Deque[float]] = defaultdict(deque)
+        self._locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._ban_until: Dict[str, float] = {}
+
+    async def check(self, key: str) -> float:
+        now = time.monotonic()
+        async with self._locks[key]:
+            until = self._ban_until.get(key, 0.0)
+            if until > now:
+                return until - now
+            q = self._request_qs[key]
+            while q and (now - q[0]) > WINDOW_SEC:
+                q.popleft()
+            if len(q) >= LIMIT:
+                self._ban_until[key] = now + BAN_SEC
+                return BAN_SEC
+            q.append(now)
+        return 0.0
+
+    def keys(self) -> int:
+        return len(self._request_qs)
+
+
+class GcraLimiter:
+    def __init__(self) -> None:
+        self.limiter = RateLimiter(RateRule(LIMIT, WINDOW_SEC, ban_sec=BAN_SEC))
+        self.state = self.limiter.rule_for("/")
+
+    async def check(self, key: str) -> float:
+        return self.limiter.hit(self.state, key)
+
+    def keys(self) -> int:
+        return self.limiter.stats()["keys"]
+
+
+async def _drive(limiter, keys) -> int:
+    denied = 0
+    for k in keys:
+        if await limiter.check(k):
+            denied += 1
+    return denied
+
+
+def main() -> None:
+    n_keys = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_req = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+    rng = random.Random(0)
+    names = [f"user:{i}" for i in range(n_keys)]
+    stream = [names[rng.randrange(n_keys)] for _ in range(n_req)]
+    print(f"keys={n_keys:,} requests={n_req:,}")
+    for label, make in (("deque", DequeLimiter), ("gcra", GcraLimiter)):
+        limiter = make()
+        t0 = time.perf_counter()
+        denied = asyncio.run(_drive(limiter, stream))
+        dt = time.perf_counter() - t0
+        # 메모리는 따로 한 번 더 (tracemalloc 켜면 처리량이 왜곡됨)
+        tracemalloc.start()
+        mem_limiter = make()
+        asyncio.run(_drive(mem_limiter, stream))
+        mem = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(
+            f"  {label:<6}: {n_req / dt:12,.0f} req/s  denied={denied:,}  "
+            f"keys={limiter.keys():,}  state={mem / 2**20:6.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
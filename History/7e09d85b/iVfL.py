@@ -0,0 +1,180 @@
+"""
+Redis 접근 계층 (main.py 의 게이트 + 레이트리밋)
+
+- RedisBatcher: 동시에 처리 중인 여러 요청의 명령을 모아 파이프라인 하나로 전송
+  → max_batch 개가 차면 즉시, 아니면 첫 명령 후 max_delay_us 가 지나면 flush
+  → 요청 N개가 Redis 왕복 N번 대신 대략 N / 배치크기 번
+- RedisGate: 게이트 확인 + 레이트리밋 증가를 Lua 스크립트 하나(EVALSHA 1회)로
+  - 게이트 닫힘 → 카운트 안 함 (503)
+  - 차단 중 / 창 초과 → retry_after (429, 예전 _ban_until / _request_qs 와 같은 규칙)
+- client 는 redis.asyncio.Redis (테스트는 fakeredis.aioredis.FakeRedis + lupa)
+
+단일 Redis 인스턴스 기준 (클러스터면 ready / rl 키가 다른 슬롯일 수 있음)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import math
+import os
+from typing import Any, Callable, List, Optional, Tuple
+
+# KEYS: ready 키, 요청 기록 zset, 차단 키
+# ARGV: window_ms, limit, ban_ms, member
+# 반환: {게이트 남은 ms (<=0 이면 닫힘), retry_after ms (0 이면 통과)}
+GATE_AND_LIMIT_LUA = """
+local ready = redis.call('PTTL', KEYS[1])
+if ready <= 0 then
+  return {ready, 0}
+end
+local ban = redis.call('PTTL', KEYS[3])
+if ban > 0 then
+  return {ready, ban}
+end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - window)
+if redis.call('ZCARD', KEYS[2]) >= tonumber(ARGV[2]) then
+  redis.call('SET', KEYS[3], '1', 'PX', ARGV[3])
+  return {ready, tonumber(ARGV[3])}
+end
+redis.call('ZADD', KEYS[2], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[2], window)
+return {ready, 0}
+"""
+
+
+class RedisBatcher:
+    """요청별 명령을 모아 파이프라인으로 보냄 (asyncio 이벤트 루프 하나 기준)"""
+
+    def __init__(self, client: Any, *, max_batch: int = 128, max_delay_us: float = 100.0) -> None:
+        self.client = client
+        self.max_batch = max(1, int(max_batch))
+        self.max_delay = max(0.0, float(max_delay_us)) / 1e6
+        self._ops: List[Tuple[Callable[[Any], Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.Handle] = None
+        self._inflight: set = set()
+        self.batches = 0
+        self.commands = 0
+
+    def submit(self, op: Callable[[Any], Any]) -> asyncio.Future:
+        """op(pipe) 로 파이프라인에 명령 하나 추가 → 그 결과 Future (op 는 명령 하나만 쌓아야 함)"""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._ops.append((op, fut))
+        if len(self._ops) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            if self.max_delay:
+                self._timer = loop.call_later(self.max_delay, self._flush)
+            else:
+                # 같은 루프 반복에서 쌓인 명령만 묶음
+                self._timer = loop.call_soon(self._flush)
+        return fut
+
+    def execute(self, *args: Any) -> asyncio.Future:
+        return self.submit(lambda pipe: pipe.execute_command(*args))
+
+    def script(self, script: Any, keys: List[str], args: List[Any]) -> asyncio.Future:
+        """register_script() 로 만든 Script — 파이프라인에선 EVALSHA, 없으면 SCRIPT LOAD 후 재시도"""
+        return self.submit(lambda pipe: script(keys=keys, args=args, client=pipe))
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        ops, self._ops = self._ops, []
+        if not ops:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(ops))
+        self._inflight.add(task)  # 태스크 GC 방지
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, ops: List[Tuple[Callable[[Any], Any], asyncio.Future]]) -> None:
+        self.batches += 1
+        self.commands += len(ops)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for op, _ in ops:
+                queued = op(pipe)
+                if inspect.isawaitable(queued):  # redis.asyncio 의 Script 호출은 코루틴
+                    await queued
+            results = await pipe.execute(raise_on_error=False)
+        except Exception as e:  # 연결 오류 등 → 배치 전체 실패
+            for _, fut in ops:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), res in zip(ops, results):
+            if fut.done():  # 호출 측 취소
+                continue
+            if isinstance(res, Exception):
+                fut.set_exception(res)
+            else:
+                fut.set_result(res)
+
+    async def aclose(self) -> None:
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "commands": self.commands,
+            "avg_batch": round(self.commands / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+class RedisGate:
+    """게이트 + 레이트리밋 (모든 명령은 batcher 경유)"""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        batcher: Optional[RedisBatcher] = None,
+        prefix: str = "ready:",
+        rate_prefix: str = "rl:",
+        channel: Optional[str] = "gate:ready",
+        window_sec: float = 10.0,
+        limit: int = 10,
+        ban_sec: float = 10.0,
+    ) -> None:
+        self.client = client
+        self.batcher = batcher or RedisBatcher(client)
+        self.prefix = prefix
+        self.rate_prefix = rate_prefix
+        self.channel = channel  # NearCacheRedisGateStore 무효화 채널 (None 이면 publish 안 함)
+        self.window_ms = int(window_sec * 1000)
+        self.limit = int(limit)
+        self.ban_ms = int(ban_sec * 1000)
+        self._script = client.register_script(GATE_AND_LIMIT_LUA)
+        # zset 멤버는 요청마다 유일해야 함 (같은 ms 에 여러 요청)
+        self._member_prefix = f"{os.getpid()}:{os.urandom(4).hex()}:"
+        self._seq = itertools.count()
+
+    async def set_ready(self, user_id: str, ttl_sec: float) -> None:
+        """지금부터 ttl 동안 게이트 열기 (리셋) — SET EX 와 PUBLISH 가 같은 배치로"""
+        sets = self.batcher.execute("SET", self.prefix + user_id, "1", "EX", int(math.ceil(ttl_sec)))
+        if self.channel:
+            await asyncio.gather(sets, self.batcher.execute("PUBLISH", self.channel, user_id))
+        else:
+            await sets
+
+    async def is_ready(self, user_id: str) -> bool:
+        ms = await self.batcher.execute("PTTL", self.prefix + user_id)
+        return ms is not None and ms > 0
+
+    async def check(self, user_id: str, rate_key: str) -> Tuple[bool, float]:
+        """(게이트 열림 여부, retry_after 초) — 열려 있고 retry_after 가 0 이면 통과"""
+        rl = self.rate_prefix + rate_key
+        ready, retry_ms = await self.batcher.script(
+            self._script,
+            [self.prefix + user_id, rl, rl + ":ban"],
+            [self.window_ms, self.limit, self.ban_ms, f"{self._member_prefix}{next(self._seq)}"],
+        )
+        return int(ready) > 0, int(retry_ms) / 1000.0
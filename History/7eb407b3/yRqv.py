@@ -0,0 +1,64 @@
+"""
+Benchmark: my_viewer DataFrame normalization (columnar vs per-cell path)
+
+python bench_normalize.py            # 200k rows
+python bench_normalize.py 50000 3    # rows, repeats
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from my_viewer import _normalize_frame_columnar, _normalize_frame_per_cell
+
+
+def make_log_frame(rows: int) -> pd.DataFrame:
+    """Synthetic frame shaped like a short/detail log."""
+    rng = np.random.default_rng(0)
+    ts = pd.Timestamp("2025-01-01") + pd.to_timedelta(np.arange(rows) * 250, unit="ms")
+    val = rng.normal(size=rows)
+    val[rng.random(rows) < 0.05] = np.nan
+    return pd.DataFrame(
+        {
+            "ts": ts,
+            "level": pd.Categorical(rng.choice(["INFO", "WARN", "ERROR"], size=rows)),
+            "message": [f"short log line {i}" for i in range(rows)],
+            "line": np.arange(rows, dtype="int64"),
+            "value": val,
+        }
+    )
+
+
+def _best(fn, df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(df)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    df = make_log_frame(rows)
+
+    assert _normalize_frame_columnar(df) == _normalize_frame_per_cell(df)
+
+    per_cell = _best(_normalize_frame_per_cell, df, repeat)
+    columnar = _best(_normalize_frame_columnar, df, repeat)
+    print(f"rows={rows:,} cols={df.shape[1]} (best of {repeat})")
+    print(f"  per-cell : {per_cell * 1000:9.1f} ms")
+    print(f"  columnar : {columnar * 1000:9.1f} ms  (x{per_cell / columnar:.1f})")
+
+    for col in df.columns:
+        one = df[[col]]
+        a = _best(_normalize_frame_per_cell, one, repeat)
+        b = _best(_normalize_frame_columnar, one, repeat)
+        print(f"  {col:<8} {str(df[col].dtype):<10} {a * 1000:8.1f} -> {b * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()